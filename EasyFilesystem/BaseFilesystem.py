@@ -3,6 +3,7 @@ from abc import abstractmethod
 from typing import Optional
 
 from EasyFilesystem.BaseFilesystemError import BaseFilesystemError
+from EasyFilesystem.BatchResult import BatchResult
 from EasyLocalDisk.Client import Client as LocalDiskClient
 from EasyLog.Log import Log
 
@@ -167,7 +168,7 @@ class BaseFilesystem:
         pass
 
     @abstractmethod
-    def file_download_recursive(self, remote_path, local_path, callback=None, allow_overwrite=True) -> None:
+    def file_download_recursive(self, remote_path, local_path, callback=None, allow_overwrite=True, snapshot=True) -> BatchResult:
         """
         Recursively download all files found in the specified remote path to the specified local path
 
@@ -183,7 +184,12 @@ class BaseFilesystem:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
-        :return: None
+        :type snapshot: bool
+        :param snapshot: If true, the full listing is read before the first file is downloaded, so files created in the
+            path while downloading are not downloaded. If false, implementations may download files as the listing is
+            received
+
+        :return: BatchResult
         """
         pass
 
@@ -325,11 +331,14 @@ class BaseFilesystem:
         else:
             Log.exception(BaseFilesystemError.ERROR_ITERATE_STRATEGY_UNKNOWN)
 
+        # Files are renamed as they are staked, list every file before staking begins so the renamed files are not
+        # found again and downloaded a second time
         Log.test('Starting Recursive Download...')
         self.file_download_recursive(
             remote_path='',
             local_path=staking_path,
-            callback=callback_staked
+            callback=callback_staked,
+            snapshot=True
         )
 
     def __stake_ignore__(self, local_filename, remote_filename):
@@ -363,7 +372,7 @@ class BaseFilesystem:
 
         # If the file is always staked- ignore it
         if remote_filename.endswith(staking_extension) is True:
-            Log.test('File Already Staked: {remote_filename}'.format(remote_filename=remote_filename))
+            Log.test('File Already Staked: {remote_filename}', remote_filename=remote_filename)
             return
 
         staked_filename = '{remote_filename}.{uuid}.{staking_extension}'.format(
@@ -372,7 +381,7 @@ class BaseFilesystem:
             staking_extension=staking_extension
         )
 
-        Log.test('Staking Filename: {staked_filename}'.format(staked_filename=staked_filename))
+        Log.test('Staking Filename: {staked_filename}', staked_filename=staked_filename)
 
         try:
             Log.test('Staking File...')
@@ -391,7 +400,7 @@ class BaseFilesystem:
                     staked_filename=staked_filename
                 )
         except Exception as staking_exception:
-            Log.test('Failed To Stake File: {staking_exception}'.format(staking_exception=staking_exception))
+            Log.test('Failed To Stake File: {staking_exception}', staking_exception=staking_exception)
             return
 
     def __stake_process_callbacks__(self, local_filename, remote_filename, staked_filename):
@@ -4,3 +4,5 @@ class BaseFilesystemError:
     ERROR_ITERATE = 'An unexpected error occurred during sftp_filesystem iteration.'
     ERROR_ITERATE_CALLBACK_NOT_CALLABLE = ERROR_ITERATE + ' The user callback_staked function provided was not a callable object.'
     ERROR_ITERATE_STRATEGY_UNKNOWN = ERROR_ITERATE + ' The specified iteration staking_strategy was unknown.'
+
+    ERROR_VERIFICATION_POLICY_UNKNOWN = 'An unknown verification policy was specified.'
@@ -0,0 +1,50 @@
+class BatchResult:
+    """
+    Outcome of an operation performed on many files, where the failure of one file does not stop the others
+    """
+
+    def __init__(self):
+        self.succeeded = []
+        self.failed = {}
+        self.stopped = False
+
+    def __repr__(self) -> str:
+        return 'BatchResult(succeeded={succeeded}, failed={failed}, stopped={stopped})'.format(
+            succeeded=len(self.succeeded),
+            failed=len(self.failed),
+            stopped=self.stopped
+        )
+
+    def add_success(self, filename) -> None:
+        """
+        Record a file that was processed successfully
+
+        :type filename: str
+        :param filename: The file that was processed
+
+        :return: None
+        """
+        self.succeeded.append(filename)
+
+    def add_failure(self, filename, exception) -> None:
+        """
+        Record a file that could not be processed
+
+        :type filename: str
+        :param filename: The file that failed
+
+        :type exception: Exception
+        :param exception: The exception raised while processing the file
+
+        :return: None
+        """
+        self.failed[filename] = exception
+
+    @property
+    def is_success(self) -> bool:
+        """
+        Flag indicating every file was processed successfully
+
+        :return: bool
+        """
+        return len(self.failed) == 0
@@ -1,23 +1,101 @@
 import boto3
+import contextvars
+import copy
+import io
 import os
+import queue
+import threading
+import time
 import uuid
 
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
+from botocore.exceptions import ClientError as BotocoreClientError
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Iterator
+
+from EasyFilesystem.BatchResult import BatchResult
+from EasyFilesystem.VerificationPolicy import VerificationPolicy
 from EasyLocalDisk.Client import Client as LocalDiskClient
 from EasyLog.Log import Log
 from EasyFilesystem.S3.ClientError import ClientError
+from EasyFilesystem.S3.FileInfo import FileInfo
+from EasyFilesystem.S3.FileInfoSubscriber import FileInfoSubscriber
+from EasyFilesystem.S3.ObjectReader import ObjectReader
+from EasyFilesystem.S3.TransferCheckpoint import TransferCheckpoint
+from EasyFilesystem.S3.TransferProfile import TransferProfile
 
 
 # noinspection DuplicatedCode
 class Client:
-    def __init__(self, assumed_role_arn=None):
+    # Split points dividing a path into shards by the first character of a hexadecimal key
+    SPLIT_POINTS_HEX = tuple('0123456789abcdef')
+
+    # Maximum number of listed pages held in memory for each shard during a parallel listing
+    PARALLEL_LIST_QUEUE_SIZE = 4
+
+    # Maximum number of files S3 will delete in a single request
+    DELETE_BATCH_SIZE = 1000
+
+    # Maximum number of parts S3 will accept in a multipart upload
+    MULTIPART_MAXIMUM_PARTS = 10000
+
+    # Minimum size S3 will accept for all but the last part of a multipart upload
+    MULTIPART_MINIMUM_PART_SIZE = 5 * 1024 * 1024
+
+    # Maximum size of object S3 will copy in a single request
+    COPY_MAXIMUM_SIZE = 5 * 1024 * 1024 * 1024
+
+    # Number of bytes of a downloaded range written at once, and the initial delay in seconds before a failed range is
+    # requested again
+    RANGE_CHUNK_SIZE = 1024 * 1024
+    RANGE_RETRY_DELAY = 0.5
+
+    # Number of connections botocore keeps open to S3 by default
+    POOL_CONNECTIONS_DEFAULT = 10
+
+    def __init__(
+            self,
+            assumed_role_arn=None,
+            max_pool_connections=None,
+            verification_policy=VerificationPolicy.STRICT,
+            transfer_config=None,
+            endpoint_url=None
+    ):
         """
         Setup S3 client
 
         :type assumed_role_arn: str or None
         :param assumed_role_arn: If applicable, the ARN of an IAM role to assume when connecting to this bucket
+
+        :type max_pool_connections: int or None
+        :param max_pool_connections: Maximum number of connections kept open to S3. If None the pool is sized for the
+            larger of the botocore default and the max_concurrency of the transfer configuration. A warning is logged
+            when an operation makes more requests at once than there are connections, in which case the pool should be
+            sized for the largest number of workers used
+
+        :type verification_policy: str
+        :param verification_policy: Default verification policy for file operations, one of the VerificationPolicy class
+            constants. STRICT checks the source and destination exist before and after each operation
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Default multipart settings for managed uploads, downloads and copies, either a transfer
+            configuration or one of the TransferProfile class constants. If None the boto3 defaults are used
+
+        :type endpoint_url: str or None
+        :param endpoint_url: Optional URL of an S3 compatible endpoint to connect to instead of AWS
         """
+        self.__verification_policy__ = VerificationPolicy.sanitize(verification_policy)
         self.__boto3_s3_client__ = None
+        self.__boto3_s3_client_lock__ = threading.Lock()
         self.__assumed_role_arn__ = assumed_role_arn
+        self.__transfer_config__ = TransferProfile.get_transfer_config(transfer_config)
+        self.__max_pool_connections__ = max_pool_connections
+
+        # Size the pool once, every object using the client shares it for the lifetime of the client
+        if self.__max_pool_connections__ is None:
+            self.__max_pool_connections__ = max(Client.POOL_CONNECTIONS_DEFAULT, Client.__get_transfer_workers__(self.__transfer_config__))
+        self.__endpoint_url__ = endpoint_url
 
     @staticmethod
     def sanitize_path(path) -> str:
@@ -70,7 +148,7 @@ class Client:
         # Concatenate them together
         return '{path}{filename}'.format(path=path, filename=filename)
 
-    def create_path(self, bucket, path, allow_overwrite=False) -> None:
+    def create_path(self, bucket, path, allow_overwrite=False, verification_policy=None) -> None:
         """
         Create path in remote sftp_filesystem
         
@@ -83,8 +161,14 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the path is allowed to be overwritten if it exists. If False, and the path exists an exception will be thrown
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+
         # Sanitize the supplied path
         path = self.sanitize_path(path)
 
@@ -100,8 +184,9 @@ class Client:
             Log.exception(ClientError.ERROR_CREATE_PATH_UNHANDLED_EXCEPTION, create_path_exception)
 
         # Make sure the path exists
-        if self.path_exists(bucket=bucket, path=path) is False:
-            Log.exception(ClientError.ERROR_CREATE_PATH_FAILED)
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.path_exists(bucket=bucket, path=path) is False:
+                Log.exception(ClientError.ERROR_CREATE_PATH_FAILED)
 
     def create_temp_path(self, bucket, prefix='', temp_path=None, auto_create=True) -> str:
         """
@@ -161,7 +246,7 @@ class Client:
         """
         try:
             # Request list of buckets
-            list_buckets_result = self.__get_boto3_s3_client__().bucket_list()
+            list_buckets_result = self.__get_boto3_s3_client__().list_buckets()
             if 'Buckets' not in list_buckets_result:
                 Log.exception(ClientError.ERROR_BUCKET_LIST_INVALID_RESULT)
 
@@ -175,7 +260,8 @@ class Client:
         except Exception as list_exception:
             Log.exception(ClientError.ERROR_BUCKET_LIST_UNHANDLED_EXCEPTION, list_exception)
 
-    def file_list(self, bucket, path, include_directories=False, recursive=False) -> list:
+    @Log.span('s3.file_list')
+    def file_list(self, bucket, path, include_directories=False, recursive=False, details=False) -> list:
         """
         List the contents of the specified bucket/path
 
@@ -191,60 +277,224 @@ class Client:
         :type recursive: bool
         :param recursive: If true all sub-folder of the path will be iterated
 
-        :return: list[str]
+        :type details: bool
+        :param details: If true, FileInfo objects describing each file are returned instead of filenames
+
+        :return: list[str] or list[FileInfo]
+        """
+        return list(self.iter_files(
+            bucket=bucket,
+            path=path,
+            include_directories=include_directories,
+            recursive=recursive,
+            details=details
+        ))
+
+    def iter_files(self, bucket, path, include_directories=False, recursive=False, details=False, start_after=None, prefetch=False) -> Iterator:
+        """
+        Iterate over the contents of the specified bucket/path, yielding each page of results as soon as it has been
+        received so large paths can be processed without holding the full listing in memory
+
+        :type bucket:str
+        :param bucket: The bucket from which the objects are to be listed
+
+        :type path:str
+        :param path: The buckets path
+
+        :type include_directories: bool
+        :param include_directories: If true, directories will be included in the results
+
+        :type recursive: bool
+        :param recursive: If true all sub-folder of the path will be iterated
+
+        :type details: bool
+        :param details: If true, FileInfo objects describing each file are yielded instead of filenames
+
+        :type start_after: str or None
+        :param start_after: If set, only files whose full path/filename sorts after this value are returned
+
+        :type prefetch: bool
+        :param prefetch: If true, the next page of results is requested in the background while the current page is
+            being processed
+
+        :return: Iterator[str] or Iterator[FileInfo]
         """
         # Sanitize the bucket path
         path = self.sanitize_path(path)
 
-        files = []
+        # For non-recursive listings let S3 group everything below the path into common prefixes, so only the
+        # immediate contents of the path are returned rather than every object in the subtree
+        list_objects_arguments = {'Bucket': bucket, 'Prefix': path}
+        if recursive is False:
+            list_objects_arguments['Delimiter'] = '/'
+        if start_after is not None:
+            list_objects_arguments['StartAfter'] = start_after
+
+        executor = None
+        if prefetch is True:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='EasyFilesystemS3Prefetch')
 
         try:
             # Retrieve list of files
-            list_objects_result = self.__get_boto3_s3_client__().list_objects_v2(Bucket=bucket, Prefix=path)
+            list_objects_result = self.__get_boto3_s3_client__().list_objects_v2(**list_objects_arguments)
 
             while True:
-                # Make sure the result contains the expected contents key
-                if 'Contents' not in list_objects_result:
-                    # The result did not contain any contents, get out of here
-                    break
+                # If prefetching, request the next page before processing the current one
+                next_list_objects_future = None
+                if executor is not None and 'NextContinuationToken' in list_objects_result:
+                    Log.debug('Prefetching next marker...')
+                    next_list_objects_future = executor.submit(
+                        self.__get_boto3_s3_client__().list_objects_v2,
+                        ContinuationToken=list_objects_result['NextContinuationToken'],
+                        **list_objects_arguments
+                    )
 
                 # Iterate through the content of the most recent search results
-                for object_details in list_objects_result['Contents']:
+                for object_details in list_objects_result.get('Contents', []):
                     # Make sure the result contains the expected filename key
                     if 'Key' not in object_details:
                         # The result did not contain the required key, throw an exception
                         Log.exception(ClientError.ERROR_FILE_LIST_INVALID_RESULT)
 
-                    # Check if we are performing a recursive search
-                    if recursive is False:
-                        # We are not recursively searching, make sure the file is in the required path
-                        if Client.sanitize_path(os.path.dirname(object_details['Key'])) != path:
-                            # Skip this file
-                            continue
-
                     # Handle directories
                     if str(object_details['Key']).endswith('/') is True:
                         if include_directories is False:
                             continue
 
-                    # Add the file to the list we will return
-                    files.append(object_details['Key'])
+                    yield FileInfo.from_object_details(object_details) if details is True else object_details['Key']
+
+                # Common prefixes are the sub-directories of the path in a non-recursive listing
+                if include_directories is True:
+                    for prefix_details in list_objects_result.get('CommonPrefixes', []):
+                        # Make sure the result contains the expected prefix key
+                        if 'Prefix' not in prefix_details:
+                            # The result did not contain the required key, throw an exception
+                            Log.exception(ClientError.ERROR_FILE_LIST_INVALID_RESULT)
+
+                        yield FileInfo(key=prefix_details['Prefix']) if details is True else prefix_details['Prefix']
 
                 # Check if the search results indicated there were more results
                 if 'NextContinuationToken' not in list_objects_result:
                     break
 
+                if next_list_objects_future is not None:
+                    list_objects_result = next_list_objects_future.result()
+                    continue
+
                 Log.debug('Loading next marker...')
 
                 # There were more results, rerun the search to get the next page of results
-                next_continuation_token = list_objects_result['NextContinuationToken']
-                list_objects_result = self.__get_boto3_s3_client__().list_objects_v2(Bucket=bucket, ContinuationToken=next_continuation_token)
+                list_objects_result = self.__get_boto3_s3_client__().list_objects_v2(
+                    ContinuationToken=list_objects_result['NextContinuationToken'],
+                    **list_objects_arguments
+                )
         except Exception as list_exception:
             Log.exception(ClientError.ERROR_FILE_LIST_UNHANDLED_EXCEPTION, list_exception)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def iter_files_parallel(self, bucket, path, include_directories=False, details=False, split_points=None, max_workers=8, ordered=False) -> Iterator:
+        """
+        Recursively iterate over the contents of the specified bucket/path, dividing the path into shards that are
+        listed concurrently
+
+        If no split points are supplied the path is divided into its immediate sub-directories, which suits paths
+        containing many directories (e.g. date partitions). Paths holding most of their files in a single directory
+        should supply split points instead (e.g. SPLIT_POINTS_HEX for keys beginning with a hash or UUID)
+
+        :type bucket:str
+        :param bucket: The bucket from which the objects are to be listed
+
+        :type path:str
+        :param path: The buckets path
+
+        :type include_directories: bool
+        :param include_directories: If true, directories will be included in the results
+
+        :type details: bool
+        :param details: If true, FileInfo objects describing each file are yielded instead of filenames
+
+        :type split_points: list[str] or tuple[str] or None
+        :param split_points: Optional filename prefixes, relative to the path, at which the path is divided into shards.
+            Each shard contains the files sorting between one split point and the next
+
+        :type max_workers: int
+        :param max_workers: Maximum number of shards listed at once
+
+        :type ordered: bool
+        :param ordered: If true files are returned in the same order as a sequential listing, otherwise files are
+            returned as soon as any shard has listed them
+
+        :return: Iterator[str] or Iterator[FileInfo]
+        """
+        # Sanitize the bucket path
+        path = self.sanitize_path(path)
+
+        # Files found while dividing the path that do not belong to any shard
+        files = []
 
-        # Return files we found
-        return files
+        # Each shard is described by the prefix to list, and the (inclusive) lower and (exclusive) upper bounds of the
+        # filenames it contains
+        shards = []
+
+        if split_points is None:
+            # Divide the path into its immediate sub-directories, using a single non-recursive listing
+            for file_info in self.iter_files(bucket=bucket, path=path, include_directories=True, details=True):
+                if file_info.key == path:
+                    if include_directories is True:
+                        files.append(file_info)
+                elif file_info.is_directory is True:
+                    shards.append((file_info.key, None, None))
+                else:
+                    files.append(file_info)
+        else:
+            # Divide the path at each of the split points
+            bounds = sorted(set('{path}{split_point}'.format(path=path, split_point=split_point) for split_point in split_points) - {path})
+            for lower, upper in zip([None] + bounds, bounds + [None]):
+                shards.append((path, lower, upper))
+
+        Log.debug('Listing {count} shards...', count=len(shards))
+
+        if details is False:
+            files = [file_info.key for file_info in files]
+
+        stopped = threading.Event()
+        self.__check_connections__(max_workers)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='EasyFilesystemS3List')
 
+        try:
+            if ordered is True:
+                # Shards are started in order and each writes to its own queue, the queues are then read in order
+                outputs = []
+                for prefix, lower, upper in shards:
+                    output = queue.Queue(maxsize=Client.PARALLEL_LIST_QUEUE_SIZE)
+                    outputs.append(output)
+                    executor.submit(self.__list_shard__, bucket, prefix, lower, upper, include_directories, details, output, stopped)
+
+                # Shards never overlap, so files outside every shard can be placed before the first shard that sorts
+                # after them
+                for index, output in enumerate(outputs):
+                    shard_start = shards[index][1] if shards[index][1] is not None else shards[index][0]
+                    while len(files) > 0 and str(files[0]) < shard_start:
+                        yield files.pop(0)
+                    yield from Client.__iter_shard_output__(output=output, count_shards=1)
+
+                yield from files
+            else:
+                # All shards write to a single queue which is read as pages arrive
+                output = queue.Queue(maxsize=Client.PARALLEL_LIST_QUEUE_SIZE * max_workers)
+                for prefix, lower, upper in shards:
+                    executor.submit(self.__list_shard__, bucket, prefix, lower, upper, include_directories, details, output, stopped)
+
+                yield from files
+                yield from Client.__iter_shard_output__(output=output, count_shards=len(shards))
+        finally:
+            # Stop any shards still being listed if the caller stopped iterating early
+            stopped.set()
+            executor.shutdown(wait=False)
+
+    @Log.span('s3.path_exists')
     def path_exists(self, bucket, path) -> bool:
         """
         Check if file exists in the specified bucket
@@ -272,6 +522,7 @@ class Client:
 
         return path in file_list_result
 
+    @Log.span('s3.file_exists')
     def file_exists(self, bucket, filename) -> bool:
         """
         Check if file exists in the specified bucket
@@ -295,7 +546,8 @@ class Client:
 
         return filename in file_list_result
 
-    def path_delete(self, bucket, path, allow_missing=False) -> None:
+    @Log.span('s3.path_delete')
+    def path_delete(self, bucket, path, allow_missing=False, recursive=False, verification_policy=None) -> None:
         """
         Delete a path from S3 bucket
 
@@ -308,18 +560,50 @@ class Client:
         :type allow_missing: bool
         :param allow_missing: Boolean flag, if False and the file cannot be found to delete an exception will be raised
 
+        :type recursive: bool
+        :param recursive: If true, the path and every file below it are deleted using batched requests
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants. When deleting recursively the listing replaces the pre check, and the
+            post check makes sure no files remain below the path
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+
         # Sanitize the path
         path = self.sanitize_path(path)
 
-        # Make sure the file exists before we try to delete it
-        if self.path_exists(bucket=bucket, path=path) is False:
-            # If this is fine, get out of here- the file is already gone
-            if allow_missing is True:
-                return
+        if recursive is True:
+            # Delete files as they are listed, so the full listing never needs to be held in memory
+            result = self.files_delete(
+                bucket=bucket,
+                filenames=self.iter_files(bucket=bucket, path=path, include_directories=True, recursive=True)
+            )
+
+            if len(result.succeeded) == 0 and len(result.failed) == 0 and allow_missing is False:
+                Log.exception(ClientError.ERROR_PATH_DELETE_NOT_FOUND)
+
+            if result.is_success is False:
+                Log.exception(ClientError.ERROR_PATH_DELETE_FAILED, '{count} files could not be deleted'.format(count=len(result.failed)))
+
+            # Make sure no files remain below the path after deleting
+            if VerificationPolicy.is_post_check_required(verification_policy) is True:
+                if self.__get_boto3_s3_client__().list_objects_v2(Bucket=bucket, Prefix=path, MaxKeys=1)['KeyCount'] > 0:
+                    Log.exception(ClientError.ERROR_PATH_DELETE_FAILED)
+
+            return
 
-            Log.exception(ClientError.ERROR_PATH_DELETE_NOT_FOUND)
+        # Make sure the file exists before we try to delete it, deleting a missing path does not raise an error so the
+        # check is always required if the path must exist
+        if allow_missing is False or VerificationPolicy.is_pre_check_required(verification_policy) is True:
+            if self.path_exists(bucket=bucket, path=path) is False:
+                # If this is fine, get out of here- the file is already gone
+                if allow_missing is True:
+                    return
+
+                Log.exception(ClientError.ERROR_PATH_DELETE_NOT_FOUND)
 
         # Delete the path
         try:
@@ -328,10 +612,12 @@ class Client:
             Log.exception(ClientError.ERROR_PATH_DELETE_UNHANDLED_EXCEPTION, delete_exception)
 
         # Make sure the file no longer exists after deleting
-        if self.path_exists(bucket=bucket, path=path) is True:
-            Log.exception(ClientError.ERROR_PATH_DELETE_FAILED)
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.path_exists(bucket=bucket, path=path) is True:
+                Log.exception(ClientError.ERROR_PATH_DELETE_FAILED)
 
-    def file_delete(self, bucket, filename, allow_missing=False) -> None:
+    @Log.span('s3.file_delete')
+    def file_delete(self, bucket, filename, allow_missing=False, verification_policy=None) -> None:
         """
         Delete a file from S3 bucket
 
@@ -344,17 +630,25 @@ class Client:
         :type allow_missing: bool
         :param allow_missing: Boolean flag, if False and the file cannot be found to delete an exception will be raised
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+
         # Sanitize the filename
         filename = self.sanitize_filename(filename)
 
-        # Make sure the file exists before we try to delete it
-        if self.file_exists(bucket=bucket, filename=filename) is False:
-            # If this is fine, get out of here- the file is already gone
-            if allow_missing is True:
-                return
-            Log.exception(ClientError.ERROR_FILE_DELETE_NOT_FOUND)
+        # Make sure the file exists before we try to delete it, deleting a missing file does not raise an error so the
+        # check is always required if the file must exist
+        if allow_missing is False or VerificationPolicy.is_pre_check_required(verification_policy) is True:
+            if self.file_exists(bucket=bucket, filename=filename) is False:
+                # If this is fine, get out of here- the file is already gone
+                if allow_missing is True:
+                    return
+                Log.exception(ClientError.ERROR_FILE_DELETE_NOT_FOUND)
 
         # Delete the file
         try:
@@ -363,18 +657,70 @@ class Client:
             Log.exception(ClientError.ERROR_FILE_DELETE_UNHANDLED_EXCEPTION, delete_exception)
 
         # Make sure the file no longer exists after deleting
-        if self.file_exists(bucket=bucket, filename=filename) is True:
-            Log.exception(ClientError.ERROR_FILE_DELETE_FAILED)
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.file_exists(bucket=bucket, filename=filename) is True:
+                Log.exception(ClientError.ERROR_FILE_DELETE_FAILED)
+
+    @Log.span('s3.files_delete')
+    def files_delete(self, bucket, filenames, max_workers=4) -> BatchResult:
+        """
+        Delete many files from S3 bucket, sending batches of up to 1000 files per request concurrently. Files that do not
+        exist are treated as successfully deleted
+
+        :type bucket:str
+        :param bucket: Bucket from which the files should be deleted
+
+        :type filenames: list[str] or Iterator[str]
+        :param filenames: Paths of the S3 files to be deleted
+
+        :type max_workers: int
+        :param max_workers: Maximum number of batches deleted at once
+
+        :return: BatchResult
+        """
+        result = BatchResult()
+
+        self.__check_connections__(max_workers)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='EasyFilesystemS3Delete')
+
+        # Batches that have been submitted but not yet processed, limited so the filenames are not read far ahead
+        submitted = {}
 
-    def file_move(self, source_bucket, source_filename, destination_bucket, destination_filename, allow_overwrite=True) -> None:
+        try:
+            for batch in Client.__iter_batches__(filenames, Client.DELETE_BATCH_SIZE):
+                batch = [self.sanitize_filename(filename) for filename in batch]
+                submitted[executor.submit(self.__delete_batch__, bucket, batch)] = batch
+
+                while len(submitted) >= max_workers * 2:
+                    Client.__process_completed_deletes__(submitted=submitted, result=result)
+
+            while len(submitted) > 0:
+                Client.__process_completed_deletes__(submitted=submitted, result=result)
+        finally:
+            executor.shutdown(wait=True)
+
+        return result
+
+    @Log.span('s3.file_move')
+    def file_move(
+            self,
+            source_bucket,
+            source_filename,
+            destination_bucket,
+            destination_filename,
+            allow_overwrite=True,
+            verification_policy=None,
+            transfer_config=None
+    ) -> None:
         """
         Move a file to the specified destination
 
         :type source_bucket:str
         :param source_bucket: The bucket the file should be moved from
 
-        :type source_filename:str
-        :param source_filename: The source filename
+        :type source_filename: str or FileInfo
+        :param source_filename: The source filename, or the details of the file returned by a listing in which case the
+            file is already known to exist
 
         :type destination_bucket:str
         :param destination_bucket: The bucket the file should be moved to
@@ -385,8 +731,26 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+        transfer_config = TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
+
+        source_file_info = None
+
+        if isinstance(source_filename, FileInfo) is True:
+            # The file was found by a listing, there is no need to check it exists or request its size
+            source_file_info = source_filename
+            source_filename = source_filename.key
+
         # Sanitize the filenames
         source_filename = Client.sanitize_filename(source_filename)
         destination_filename = Client.sanitize_filename(destination_filename)
@@ -401,43 +765,68 @@ class Client:
                 Log.exception(ClientError.ERROR_FILE_MOVE_ALREADY_EXISTS)
 
         # Make sure the source file exists
-        if self.file_exists(bucket=source_bucket, filename=source_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_MOVE_SOURCE_NOT_FOUND)
+        if source_file_info is None and VerificationPolicy.is_pre_check_required(verification_policy) is True:
+            if self.file_exists(bucket=source_bucket, filename=source_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_MOVE_SOURCE_NOT_FOUND)
+
+        # Unless verifying strictly, the copy and delete do not need to repeat the checks already made by the move
+        is_strict = VerificationPolicy.is_post_check_required(verification_policy)
+        step_verification_policy = VerificationPolicy.STRICT if is_strict is True else VerificationPolicy.TRUST
 
         # Move the file
         try:
             self.file_copy(
                 source_bucket=source_bucket,
-                source_filename=source_filename,
+                source_filename=source_file_info if source_file_info is not None else source_filename,
                 destination_bucket=destination_bucket,
-                destination_filename=destination_filename
+                destination_filename=destination_filename,
+                verification_policy=step_verification_policy,
+                transfer_config=transfer_config
             )
         except Exception as move_exception:
             Log.exception(ClientError.ERROR_FILE_MOVE_COPY_UNHANDLED_EXCEPTION, move_exception)
 
         # Make sure the file exists at its destination
-        if self.file_exists(bucket=destination_bucket, filename=destination_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_MOVE_COPY_FAILED)
+        if is_strict is True:
+            if self.file_exists(bucket=destination_bucket, filename=destination_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_MOVE_COPY_FAILED)
 
         # Delete the file from the source bucket
         try:
-            self.file_delete(bucket=source_bucket, filename=source_filename)
+            self.file_delete(
+                bucket=source_bucket,
+                filename=source_filename,
+                allow_missing=is_strict is False,
+                verification_policy=step_verification_policy
+            )
         except Exception as delete_exception:
             Log.exception(ClientError.ERROR_FILE_MOVE_DELETE_UNHANDLED_EXCEPTION, delete_exception)
 
         # Make sure the source file no longer exists
-        if self.file_exists(bucket=source_bucket, filename=source_filename) is True:
-            Log.exception(ClientError.ERROR_FILE_MOVE_DELETE_FAILED)
-
-    def file_copy(self, source_bucket, source_filename, destination_bucket, destination_filename, allow_overwrite=True) -> None:
+        if is_strict is True:
+            if self.file_exists(bucket=source_bucket, filename=source_filename) is True:
+                Log.exception(ClientError.ERROR_FILE_MOVE_DELETE_FAILED)
+
+    @Log.span('s3.file_copy')
+    def file_copy(
+            self,
+            source_bucket,
+            source_filename,
+            destination_bucket,
+            destination_filename,
+            allow_overwrite=True,
+            verification_policy=None,
+            transfer_config=None
+    ) -> None:
         """
         Copy file to the specified destination
 
         :type source_bucket:str
         :param source_bucket: The bucket the file should be copied from
 
-        :type source_filename:str
-        :param source_filename: The source path/filename
+        :type source_filename: str or FileInfo
+        :param source_filename: The source path/filename, or the details of the file returned by a listing in which case
+            the file is already known to exist and its size does not need to be requested
 
         :type destination_bucket:str
         :param destination_bucket: The bucket the file should be copied to
@@ -448,8 +837,27 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+        transfer_config = TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
+
+        source_size = None
+        source_details = None
+
+        if isinstance(source_filename, FileInfo) is True:
+            # The file was found by a listing, there is no need to check it exists or request its size
+            source_size = source_filename.size
+            source_filename = source_filename.key
+
         # Sanitize the filenames
         source_filename = Client.sanitize_filename(source_filename)
         destination_filename = Client.sanitize_filename(destination_filename)
@@ -463,32 +871,55 @@ class Client:
             if self.file_exists(bucket=destination_bucket, filename=destination_filename) is True:
                 Log.exception(ClientError.ERROR_FILE_COPY_ALREADY_EXISTS)
 
-        # Make sure the source file exists
-        if self.file_exists(bucket=source_bucket, filename=source_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_COPY_SOURCE_NOT_FOUND)
+        # The size of the source file decides how it is copied, requesting it also makes sure the source file exists
+        if source_size is None:
+            source_details = self.__get_file_details__(bucket=source_bucket, filename=source_filename)
+            if source_details is None:
+                Log.exception(ClientError.ERROR_FILE_COPY_SOURCE_NOT_FOUND)
+            source_size = source_details['ContentLength']
 
         try:
-            self.__get_boto3_s3_client__().copy(
-                CopySource={'Bucket': source_bucket, 'Key': source_filename},
-                Bucket=destination_bucket,
-                Key=destination_filename
-            )
+            # Objects larger than S3 can copy in a single request are always copied in parts
+            if source_size < min(transfer_config.multipart_threshold, Client.COPY_MAXIMUM_SIZE):
+                self.__get_boto3_s3_client__().copy_object(
+                    CopySource={'Bucket': source_bucket, 'Key': source_filename},
+                    Bucket=destination_bucket,
+                    Key=destination_filename
+                )
+            else:
+                # A listing does not include the details carried over to the copy, request them once
+                if source_details is None:
+                    source_details = self.__get_file_details__(bucket=source_bucket, filename=source_filename)
+                    if source_details is None:
+                        Log.exception(ClientError.ERROR_FILE_COPY_SOURCE_NOT_FOUND)
+
+                self.__copy_multipart__(
+                    source_bucket=source_bucket,
+                    source_filename=source_filename,
+                    destination_bucket=destination_bucket,
+                    destination_filename=destination_filename,
+                    transfer_config=transfer_config,
+                    source_details=source_details
+                )
         except Exception as copy_exception:
             Log.exception(ClientError.ERROR_FILE_COPY_UNHANDLED_EXCEPTION, copy_exception)
 
         # Make sure the file exists at the destination
-        if self.file_exists(bucket=destination_bucket, filename=destination_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_COPY_FAILED)
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.file_exists(bucket=destination_bucket, filename=destination_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_COPY_FAILED)
 
-    def file_download(self, bucket, remote_filename, local_filename, allow_overwrite=True) -> None:
+    @Log.span('s3.file_download')
+    def file_download(self, bucket, remote_filename, local_filename, allow_overwrite=True, verification_policy=None, transfer_config=None) -> None:
         """
         Download a file
 
         :type bucket:str
         :param bucket: Bucket from which the file should be downloaded
 
-        :type remote_filename:str
-        :param remote_filename: Path of the file to be downloaded in S3 bucket
+        :type remote_filename: str or FileInfo
+        :param remote_filename: Path of the file to be downloaded in S3 bucket, or the details of the file returned by a
+            listing in which case the file is already known to exist and is not checked again
 
         :type local_filename: str
         :param local_filename: Download filename on local sftp_filesystem
@@ -496,19 +927,38 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants
+
         :return: None
         """
-        # Sanitize the filenames
-        remote_filename = self.sanitize_filename(remote_filename)
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+        transfer_config = TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
 
         # If we are not in overwrite mode, we need to check if the file exists already
         if allow_overwrite is False:
             if os.path.exists(local_filename) is True:
                 Log.exception(ClientError.ERROR_FILE_DOWNLOAD_ALREADY_EXISTS)
 
-        # Make sure the file exists at the source
-        if self.file_exists(bucket=bucket, filename=remote_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_DOWNLOAD_SOURCE_NOT_FOUND)
+        remote_file_info = None
+
+        if isinstance(remote_filename, FileInfo) is True:
+            # The file was found by a listing, there is no need to check it exists or request its details again
+            remote_file_info = remote_filename
+            remote_filename = remote_filename.key
+        else:
+            # Sanitize the filenames
+            remote_filename = self.sanitize_filename(remote_filename)
+
+            # Make sure the file exists at the source
+            if VerificationPolicy.is_pre_check_required(verification_policy) is True:
+                if self.file_exists(bucket=bucket, filename=remote_filename) is False:
+                    Log.exception(ClientError.ERROR_FILE_DOWNLOAD_SOURCE_NOT_FOUND)
 
         # Download the file
         try:
@@ -516,19 +966,292 @@ class Client:
             destination_path = LocalDiskClient.sanitize_path(os.path.dirname(local_filename))
             LocalDiskClient.create_path(destination_path, allow_overwrite=True)
 
-            self.__get_boto3_s3_client__().download_file(
-                Bucket=bucket,
-                Key=remote_filename,
-                Filename=local_filename
+            self.__check_connections__(Client.__get_transfer_workers__(transfer_config))
+
+            if remote_file_info is None:
+                self.__get_boto3_s3_client__().download_file(
+                    Bucket=bucket,
+                    Key=remote_filename,
+                    Filename=local_filename,
+                    Config=transfer_config
+                )
+            else:
+                # Supply the listed details to the transfer so they do not need to be requested before downloading
+                with create_transfer_manager(self.__get_boto3_s3_client__(), transfer_config) as transfer_manager:
+                    transfer_manager.download(
+                        bucket=bucket,
+                        key=remote_filename,
+                        fileobj=local_filename,
+                        subscribers=[FileInfoSubscriber(file_info=remote_file_info)]
+                    ).result()
+        except Exception as download_exception:
+            Log.exception(ClientError.ERROR_FILE_DOWNLOAD_UNHANDLED_EXCEPTION, download_exception)
+
+        # Make sure the file now exists locally
+        if os.path.exists(local_filename) is False:
+            Log.exception(ClientError.ERROR_FILE_DOWNLOAD_FAILED)
+
+    @Log.span('s3.file_download_ranged')
+    def file_download_ranged(self, bucket, remote_filename, local_filename, allow_overwrite=True, transfer_config=None, max_attempts=3) -> None:
+        """
+        Download a single file by requesting byte ranges of it concurrently, writing each range directly to its place in
+        the local file
+
+        :type bucket: str
+        :param bucket: Bucket from which the file should be downloaded
+
+        :type remote_filename: str or FileInfo
+        :param remote_filename: Path of the file to be downloaded in S3 bucket, or the details of the file returned by a
+            listing in which case the file is already known to exist and its size does not need to be requested
+
+        :type local_filename: str
+        :param local_filename: Download filename on local filesystem
+
+        :type allow_overwrite: bool
+        :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants. Each range is
+            multipart_chunksize bytes and max_concurrency ranges are downloaded at once
+
+        :type max_attempts: int
+        :param max_attempts: Maximum number of times each range is requested if reading it fails
+
+        :return: None
+        """
+        transfer_config = TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
+
+        # If we are not in overwrite mode, we need to check if the file exists already
+        if allow_overwrite is False:
+            if os.path.exists(local_filename) is True:
+                Log.exception(ClientError.ERROR_FILE_DOWNLOAD_ALREADY_EXISTS)
+
+        remote_filename, size, etag = self.__get_ranged_source__(
+            bucket=bucket,
+            filename=remote_filename,
+            not_found_error=ClientError.ERROR_FILE_DOWNLOAD_SOURCE_NOT_FOUND,
+            unhandled_error=ClientError.ERROR_FILE_DOWNLOAD_UNHANDLED_EXCEPTION
+        )
+
+        try:
+            # Make sure the local download path exists
+            destination_path = LocalDiskClient.sanitize_path(os.path.dirname(local_filename))
+            LocalDiskClient.create_path(destination_path, allow_overwrite=True)
+
+            # Allocate the whole file up front so each range can be written at its offset as it arrives
+            descriptor = os.open(local_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                os.ftruncate(descriptor, size)
+
+                def write(offset, data):
+                    while len(data) > 0:
+                        written = os.pwrite(descriptor, data, offset)
+                        data = data[written:]
+                        offset += written
+
+                self.__download_ranges__(
+                    bucket=bucket,
+                    filename=remote_filename,
+                    size=size,
+                    etag=etag,
+                    write=write,
+                    transfer_config=transfer_config,
+                    max_attempts=max_attempts
+                )
+            finally:
+                os.close(descriptor)
+        except Exception as download_exception:
+            # Do not leave a partially downloaded file behind
+            if os.path.exists(local_filename) is True:
+                os.remove(local_filename)
+            Log.exception(ClientError.ERROR_FILE_DOWNLOAD_UNHANDLED_EXCEPTION, download_exception)
+
+        # Make sure the file now exists locally
+        if os.path.exists(local_filename) is False:
+            Log.exception(ClientError.ERROR_FILE_DOWNLOAD_FAILED)
+
+    @Log.span('s3.file_download_resumable')
+    def file_download_resumable(self, bucket, remote_filename, local_filename, allow_overwrite=True, transfer_config=None, max_attempts=3) -> None:
+        """
+        Download a single file in concurrent byte ranges, saving progress so an interrupted download continues from the
+        ranges already downloaded when it is attempted again
+
+        The file is downloaded to '<local_filename>.part' and its progress saved to '<local_filename>.part.json', the
+        file is only moved to the local filename once complete. Progress is discarded if the remote file has changed.
+
+        :type bucket: str
+        :param bucket: Bucket from which the file should be downloaded
+
+        :type remote_filename: str or FileInfo
+        :param remote_filename: Path of the file to be downloaded in S3 bucket, or the details of the file returned by a
+            listing in which case the file is already known to exist and its size does not need to be requested
+
+        :type local_filename: str
+        :param local_filename: Download filename on local filesystem
+
+        :type allow_overwrite: bool
+        :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants. Each range is
+            multipart_chunksize bytes and max_concurrency ranges are downloaded at once
+
+        :type max_attempts: int
+        :param max_attempts: Maximum number of times each range is requested if reading it fails
+
+        :return: None
+        """
+        transfer_config = TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
+
+        # If we are not in overwrite mode, we need to check if the file exists already
+        if allow_overwrite is False:
+            if os.path.exists(local_filename) is True:
+                Log.exception(ClientError.ERROR_FILE_DOWNLOAD_ALREADY_EXISTS)
+
+        remote_filename, size, etag = self.__get_ranged_source__(
+            bucket=bucket,
+            filename=remote_filename,
+            not_found_error=ClientError.ERROR_FILE_DOWNLOAD_SOURCE_NOT_FOUND,
+            unhandled_error=ClientError.ERROR_FILE_DOWNLOAD_UNHANDLED_EXCEPTION
+        )
+
+        part_filename = '{local_filename}.part'.format(local_filename=local_filename)
+        checkpoint = TransferCheckpoint(filename='{part_filename}.json'.format(part_filename=part_filename))
+
+        progress = {
+            'bucket': bucket,
+            'filename': remote_filename,
+            'etag': etag,
+            'size': size,
+            'range_size': transfer_config.multipart_chunksize,
+            'completed': []
+        }
+
+        try:
+            # Make sure the local download path exists
+            destination_path = LocalDiskClient.sanitize_path(os.path.dirname(local_filename))
+            LocalDiskClient.create_path(destination_path, allow_overwrite=True)
+
+            # Continue from the saved progress if it was for the same version of the file and the partial file remains
+            saved_progress = checkpoint.load()
+            is_resumed = (
+                saved_progress is not None and
+                os.path.exists(part_filename) is True and
+                os.path.getsize(part_filename) == size and
+                all(saved_progress.get(key) == progress[key] for key in ('bucket', 'filename', 'etag', 'size', 'range_size'))
             )
+
+            if is_resumed is True:
+                progress['completed'] = saved_progress['completed']
+                Log.debug(
+                    'Resuming download of {filename}, {count} ranges already downloaded',
+                    filename=remote_filename,
+                    count=len(progress['completed'])
+                )
+
+            descriptor = os.open(part_filename, os.O_WRONLY | os.O_CREAT, 0o666)
+            try:
+                if is_resumed is False:
+                    os.ftruncate(descriptor, 0)
+                    os.ftruncate(descriptor, size)
+
+                def write(offset, data):
+                    while len(data) > 0:
+                        written = os.pwrite(descriptor, data, offset)
+                        data = data[written:]
+                        offset += written
+
+                range_size = progress['range_size']
+
+                def range_completed(offset):
+                    # Ranges are recorded by index rather than offset to keep the checkpoint small
+                    progress['completed'].append(offset // range_size)
+                    checkpoint.save(progress)
+
+                try:
+                    self.__download_ranges__(
+                        bucket=bucket,
+                        filename=remote_filename,
+                        size=size,
+                        etag=etag,
+                        write=write,
+                        transfer_config=transfer_config,
+                        max_attempts=max_attempts,
+                        completed_offsets=set(index * range_size for index in progress['completed']),
+                        callback=range_completed
+                    )
+                finally:
+                    # Saves are throttled while downloading, make sure all completed ranges are recorded
+                    checkpoint.save(progress, force=True)
+            finally:
+                os.close(descriptor)
+
+            os.replace(part_filename, local_filename)
+            checkpoint.delete()
         except Exception as download_exception:
+            # The partial file and progress are kept so the download can be resumed
             Log.exception(ClientError.ERROR_FILE_DOWNLOAD_UNHANDLED_EXCEPTION, download_exception)
 
         # Make sure the file now exists locally
         if os.path.exists(local_filename) is False:
             Log.exception(ClientError.ERROR_FILE_DOWNLOAD_FAILED)
 
-    def file_download_recursive(self, bucket, remote_path, local_path, callback=None, allow_overwrite=True) -> None:
+    @Log.span('s3.file_read')
+    def file_read(self, bucket, filename, transfer_config=None, max_attempts=3) -> bytearray:
+        """
+        Read the contents of a file into memory by requesting byte ranges of it concurrently
+
+        :type bucket: str
+        :param bucket: Bucket containing the file
+
+        :type filename: str or FileInfo
+        :param filename: Path/filename of the file, or the details of the file returned by a listing in which case the
+            file is already known to exist and its size does not need to be requested
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants. Each range is
+            multipart_chunksize bytes and max_concurrency ranges are downloaded at once
+
+        :type max_attempts: int
+        :param max_attempts: Maximum number of times each range is requested if reading it fails
+
+        :return: bytearray
+        """
+        transfer_config = TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
+
+        filename, size, etag = self.__get_ranged_source__(
+            bucket=bucket,
+            filename=filename,
+            not_found_error=ClientError.ERROR_FILE_READ_SOURCE_NOT_FOUND,
+            unhandled_error=ClientError.ERROR_FILE_READ_UNHANDLED_EXCEPTION
+        )
+
+        contents = bytearray(size)
+        view = memoryview(contents)
+
+        def write(offset, data):
+            view[offset:offset + len(data)] = data
+
+        try:
+            self.__download_ranges__(
+                bucket=bucket,
+                filename=filename,
+                size=size,
+                etag=etag,
+                write=write,
+                transfer_config=transfer_config,
+                max_attempts=max_attempts
+            )
+        except Exception as read_exception:
+            Log.exception(ClientError.ERROR_FILE_READ_UNHANDLED_EXCEPTION, read_exception)
+
+        return contents
+
+    @Log.span('s3.file_download_recursive')
+    def file_download_recursive(self, bucket, remote_path, local_path, callback=None, allow_overwrite=True, max_workers=1, transfer_config=None, snapshot=True) -> BatchResult:
         """
         Recursively download all files found in the specified remote path to the specified local path
 
@@ -547,41 +1270,179 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
-        :return: None
+        :type max_workers: int
+        :param max_workers: Maximum number of files downloaded at once. When greater than 1, files that fail to download
+            are recorded in the result instead of raising an exception, the callback is executed on the calling thread in
+            the order downloads complete, and each file is downloaded on a single thread
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants
+
+        :type snapshot: bool
+        :param snapshot: If true, the full listing is read before the first file is downloaded, so files created in the
+            path while downloading (e.g. by the callback) are not downloaded. If false, files are downloaded as each page
+            of the listing is received, which suits large paths where the callback does not write to the path
+
+        :return: BatchResult
         """
         # Sanitize the paths
         local_path = LocalDiskClient.sanitize_path(local_path)
         remote_path = self.sanitize_path(remote_path)
 
-        # List files in current path
-        files_found = self.file_list(bucket=bucket, path=remote_path, recursive=True)
+        if callback is not None and callable(callback) is False:
+            Log.exception(ClientError.ERROR_FILE_DOWNLOAD_CALLBACK_NOT_CALLABLE)
+
+        result = BatchResult()
+
+        # List the files in the current path, requesting the next page while the current page is processed
+        listing = self.iter_files(bucket=bucket, path=remote_path, recursive=True, details=True, prefetch=True)
+        files_found = listing
+
+        if snapshot is True:
+            # Read every page before downloading so files written to the path by the callback are not found again
+            files_found = iter(list(listing))
+
+        try:
+            if max_workers > 1:
+                # Each worker downloads one file at a time, so the number of requests made at once is the number of workers
+                single_threaded_config = Client.__get_single_threaded_config__(
+                    TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
+                )
+
+                def get_transfers():
+                    # Describe the download of each file as it is listed
+                    for current_file_info in files_found:
+                        current_local_filename = Client.__create_local_filename__(local_path=local_path, remote_filename=current_file_info.key)
+
+                        yield (
+                            self.file_download,
+                            {
+                                'bucket': bucket,
+                                'remote_filename': current_file_info,
+                                'local_filename': current_local_filename,
+                                'allow_overwrite': allow_overwrite,
+                                'transfer_config': single_threaded_config
+                            },
+                            current_local_filename,
+                            current_file_info.key
+                        )
+
+                self.__transfer_concurrent__(
+                    transfers=get_transfers(),
+                    callback=callback,
+                    max_workers=max_workers,
+                    result=result
+                )
+                return result
+
+            # Iterate these files
+            for current_file_info in files_found:
+                current_local_filename = Client.__create_local_filename__(local_path=local_path, remote_filename=current_file_info.key)
+
+                # Download the current file, passing the listed details avoids checking the file exists again
+                self.file_download(
+                    bucket=bucket,
+                    remote_filename=current_file_info,
+                    local_filename=current_local_filename,
+                    allow_overwrite=allow_overwrite,
+                    transfer_config=transfer_config
+                )
+
+                result.add_success(current_file_info.key)
+
+                # If a callback_staked was supplied execute it
+                if callback is not None:
+                    # If the callback_staked returns false, stop iterating
+                    if callback(local_filename=current_local_filename, remote_filename=current_file_info.key) is False:
+                        result.stopped = True
+                        break
+        finally:
+            listing.close()
+
+        return result
+
+    def file_open(
+            self,
+            bucket,
+            filename,
+            mode='rb',
+            encoding=None,
+            block_size=8 * 1024 * 1024,
+            read_ahead=1,
+            cache_blocks=4
+    ):
+        """
+        Open a file for reading without downloading it, the file is read in blocks as it is used
+
+        :type bucket: str
+        :param bucket: Bucket containing the file
+
+        :type filename: str or FileInfo
+        :param filename: Path/filename of the file, or the details of the file returned by a listing in which case the
+            file is already known to exist and its size does not need to be requested
+
+        :type mode: str
+        :param mode: Either 'rb' to read bytes or 'r' to read text
 
-        # Iterate these files
-        for current_remote_filename in files_found:
-            # The local filename will stored in the same folder structure as on the SFTP server
-            current_local_path = LocalDiskClient.sanitize_path(local_path + os.path.dirname(current_remote_filename))
-            current_local_filename = LocalDiskClient.sanitize_filename(current_local_path + os.path.basename(current_remote_filename))
+        :type encoding: str or None
+        :param encoding: Encoding of the file when reading text, if None the locale encoding is used
 
-            # Make sure the current files path exists locally before we start downloading
-            LocalDiskClient.create_path(path=current_local_path, allow_overwrite=True)
+        :type block_size: int
+        :param block_size: Number of bytes requested at once
 
-            # Download the current file
-            self.file_download(
+        :type read_ahead: int
+        :param read_ahead: Number of blocks following the block being read that are requested in the background, 0 to
+            only request blocks as they are read
+
+        :type cache_blocks: int
+        :param cache_blocks: Maximum number of blocks held in memory, including those being read ahead
+
+        :return: io.BufferedReader or io.TextIOWrapper
+        """
+        if mode not in ('rb', 'r'):
+            Log.exception(ClientError.ERROR_FILE_OPEN_MODE_UNSUPPORTED)
+
+        if isinstance(filename, FileInfo) is True:
+            # The file was found by a listing, there is no need to check it exists or request its details again
+            size = filename.size
+            etag = filename.etag
+            filename = filename.key
+        else:
+            filename = self.sanitize_filename(filename)
+
+            file_details = None
+            try:
+                file_details = self.__get_file_details__(bucket=bucket, filename=filename)
+            except Exception as open_exception:
+                Log.exception(ClientError.ERROR_FILE_OPEN_UNHANDLED_EXCEPTION, open_exception)
+
+            if file_details is None:
+                Log.exception(ClientError.ERROR_FILE_OPEN_SOURCE_NOT_FOUND)
+
+            size = file_details['ContentLength']
+            etag = file_details.get('ETag')
+
+        file = io.BufferedReader(
+            ObjectReader(
+                boto3_s3_client=self.__get_boto3_s3_client__(),
                 bucket=bucket,
-                remote_filename=current_remote_filename,
-                local_filename=current_local_filename,
-                allow_overwrite=allow_overwrite
+                filename=filename,
+                size=size,
+                etag=etag,
+                block_size=block_size,
+                read_ahead=read_ahead,
+                cache_blocks=cache_blocks
             )
+        )
 
-            # If a callback_staked was supplied execute it
-            if callback is not None:
-                if callable(callback) is False:
-                    Log.exception(ClientError.ERROR_FILE_DOWNLOAD_CALLBACK_NOT_CALLABLE)
-                # If the callback_staked returns false, stop iterating
-                if callback(local_filename=current_local_filename, remote_filename=current_remote_filename) is False:
-                    break
+        if mode == 'r':
+            return io.TextIOWrapper(file, encoding=encoding)
 
-    def file_upload(self, bucket, remote_filename, local_filename, allow_overwrite=True) -> None:
+        return file
+
+    @Log.span('s3.file_upload')
+    def file_upload(self, bucket, remote_filename, local_filename, allow_overwrite=True, verification_policy=None, transfer_config=None) -> None:
         """
         Upload a local file to the specified location
 
@@ -597,8 +1458,19 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+        transfer_config = TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
+
         # Sanitize the bucket path
         local_filename = LocalDiskClient.sanitize_filename(local_filename)
         remote_filename = self.sanitize_filename(remote_filename)
@@ -614,19 +1486,343 @@ class Client:
 
         # Upload the file
         try:
-            self.__get_boto3_s3_client__().upload_file(Bucket=bucket, Key=remote_filename, Filename=local_filename)
+            self.__check_connections__(Client.__get_transfer_workers__(transfer_config))
+            self.__get_boto3_s3_client__().upload_file(Bucket=bucket, Key=remote_filename, Filename=local_filename, Config=transfer_config)
         except Exception as upload_exception:
             Log.exception(ClientError.ERROR_FILE_UPLOAD_UNHANDLED_EXCEPTION, upload_exception)
 
         # Make sure the uploaded file exists
-        if self.file_exists(bucket=bucket, filename=remote_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_UPLOAD_FAILED, remote_filename)
-
-    def file_get_tags(self, bucket, filename) -> dict:
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.file_exists(bucket=bucket, filename=remote_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_UPLOAD_FAILED, remote_filename)
+
+    @Log.span('s3.file_upload_resumable')
+    def file_upload_resumable(
+            self,
+            bucket,
+            remote_filename,
+            local_filename,
+            allow_overwrite=True,
+            verification_policy=None,
+            transfer_config=None,
+            checkpoint_filename=None,
+            checkpoint_bucket=None
+    ) -> None:
         """
-        Return a list of tags on the specified file
+        Upload a local file in concurrent parts, saving progress so an interrupted upload only sends the parts that are
+        missing when it is attempted again
 
-        :type bucket:str
+        Files below the multipart threshold are uploaded in a single request. An interrupted multipart upload is not
+        aborted, so that it can be resumed; a lifecycle rule aborting incomplete multipart uploads should be used to
+        remove uploads that are never resumed.
+
+        :type bucket: str
+        :param bucket: Bucket where file should be uploaded
+
+        :type remote_filename: str
+        :param remote_filename: Destination filename in S3 bucket
+
+        :type local_filename: str
+        :param local_filename: File on local filesystem to be uploaded
+
+        :type allow_overwrite: bool
+        :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants
+
+        :type checkpoint_filename: str or None
+        :param checkpoint_filename: Filename the progress is saved to. Defaults to '<local_filename>.upload.json', or
+            '<remote_filename>.upload.json' if a checkpoint bucket is specified
+
+        :type checkpoint_bucket: str or None
+        :param checkpoint_bucket: Optional bucket the progress is saved to, allowing the upload to be resumed from
+            another host. If None the progress is saved on the local filesystem
+
+        :return: None
+        """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+        transfer_config = TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
+
+        # Sanitize the filenames
+        local_filename = LocalDiskClient.sanitize_filename(local_filename)
+        remote_filename = self.sanitize_filename(remote_filename)
+
+        # Make sure the local file exists
+        if LocalDiskClient.file_exists(local_filename) is False:
+            Log.exception(ClientError.ERROR_FILE_UPLOAD_SOURCE_NOT_FOUND)
+
+        size = os.path.getsize(local_filename)
+
+        if size < transfer_config.multipart_threshold:
+            # There is nothing to resume for a file uploaded in a single request
+            self.file_upload(
+                bucket=bucket,
+                remote_filename=remote_filename,
+                local_filename=local_filename,
+                allow_overwrite=allow_overwrite,
+                verification_policy=verification_policy,
+                transfer_config=transfer_config
+            )
+            return
+
+        # Make sure the file doesn't already exist if overwrite is disabled
+        if allow_overwrite is False:
+            if self.file_exists(bucket=bucket, filename=remote_filename) is True:
+                Log.exception(ClientError.ERROR_FILE_UPLOAD_ALREADY_EXISTS)
+
+        if checkpoint_filename is None:
+            checkpoint_filename = '{filename}.upload.json'.format(
+                filename=remote_filename if checkpoint_bucket is not None else local_filename
+            )
+
+        checkpoint = TransferCheckpoint(
+            filename=checkpoint_filename,
+            bucket=checkpoint_bucket,
+            boto3_s3_client=self.__get_boto3_s3_client__()
+        )
+
+        # Increase the part size if needed so the file does not exceed the maximum number of parts
+        part_size = max(
+            transfer_config.multipart_chunksize,
+            Client.MULTIPART_MINIMUM_PART_SIZE,
+            -(-size // Client.MULTIPART_MAXIMUM_PARTS)
+        )
+
+        progress = {
+            'bucket': bucket,
+            'filename': remote_filename,
+            'size': size,
+            'modified': os.path.getmtime(local_filename),
+            'part_size': part_size,
+            'upload_id': None,
+            'parts': {}
+        }
+
+        try:
+            # Continue the saved upload if it was for the same version of the local file and it has not been aborted
+            saved_progress = checkpoint.load()
+            if saved_progress is not None:
+                if all(saved_progress.get(key) == progress[key] for key in ('bucket', 'filename', 'size', 'modified', 'part_size')):
+                    uploaded_parts = self.__list_uploaded_parts__(
+                        bucket=bucket,
+                        filename=remote_filename,
+                        upload_id=saved_progress['upload_id'],
+                        size=size,
+                        part_size=part_size
+                    )
+                    if uploaded_parts is not None:
+                        progress['upload_id'] = saved_progress['upload_id']
+                        progress['parts'] = uploaded_parts
+                        Log.debug(
+                            'Resuming upload of {filename}, {count} parts already uploaded',
+                            filename=remote_filename,
+                            count=len(uploaded_parts)
+                        )
+
+            if progress['upload_id'] is None:
+                progress['upload_id'] = self.__get_boto3_s3_client__().create_multipart_upload(
+                    Bucket=bucket,
+                    Key=remote_filename
+                )['UploadId']
+                checkpoint.save(progress, force=True)
+
+            self.__upload_missing_parts__(
+                bucket=bucket,
+                local_filename=local_filename,
+                progress=progress,
+                checkpoint=checkpoint,
+                max_workers=transfer_config.max_concurrency if transfer_config.use_threads is True else 1
+            )
+
+            parts = [{'PartNumber': int(part_number), 'ETag': etag} for part_number, etag in progress['parts'].items()]
+
+            self.__get_boto3_s3_client__().complete_multipart_upload(
+                Bucket=bucket,
+                Key=remote_filename,
+                UploadId=progress['upload_id'],
+                MultipartUpload={'Parts': sorted(parts, key=lambda part: part['PartNumber'])}
+            )
+
+            checkpoint.delete()
+        except Exception as upload_exception:
+            # The upload and progress are kept so the upload can be resumed
+            Log.exception(ClientError.ERROR_FILE_UPLOAD_UNHANDLED_EXCEPTION, upload_exception)
+
+        # Make sure the uploaded file exists
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.file_exists(bucket=bucket, filename=remote_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_UPLOAD_FAILED, remote_filename)
+
+    @Log.span('s3.file_upload_stream')
+    def file_upload_stream(self, bucket, remote_filename, source, allow_overwrite=True, verification_policy=None, transfer_config=None) -> None:
+        """
+        Upload data read from a file-like object or generated by an iterator, without writing it to local disk
+
+        Data is uploaded in parts as it is read, so no more than the parts being uploaded are held in memory at once.
+        Data smaller than a single part is uploaded in a single request.
+
+        :type bucket: str
+        :param bucket: Bucket where file should be uploaded
+
+        :type remote_filename: str
+        :param remote_filename: Destination filename in S3 bucket
+
+        :type source: io.IOBase or Iterable[bytes]
+        :param source: A file-like object opened for reading bytes, or an iterator of bytes
+
+        :type allow_overwrite: bool
+        :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants. The part size is the
+            multipart_chunksize (at least 5 MB), limiting the upload to 10000 parts, and max_concurrency parts are
+            uploaded at once
+
+        :return: None
+        """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+        transfer_config = TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
+
+        remote_filename = self.sanitize_filename(remote_filename)
+
+        # Make sure the file doesn't already exist if overwrite is disabled
+        if allow_overwrite is False:
+            if self.file_exists(bucket=bucket, filename=remote_filename) is True:
+                Log.exception(ClientError.ERROR_FILE_UPLOAD_ALREADY_EXISTS)
+
+        part_size = max(transfer_config.multipart_chunksize, Client.MULTIPART_MINIMUM_PART_SIZE)
+        parts = Client.__iter_parts__(source=source, part_size=part_size)
+
+        try:
+            first_part = next(parts, b'')
+            second_part = next(parts, None)
+
+            if second_part is None:
+                # All of the data fitted in a single part
+                self.__get_boto3_s3_client__().put_object(Bucket=bucket, Key=remote_filename, Body=first_part)
+            else:
+                max_workers = Client.__get_transfer_workers__(transfer_config)
+
+                def get_parts():
+                    yield first_part
+                    yield second_part
+                    yield from parts
+
+                self.__upload_multipart__(
+                    bucket=bucket,
+                    filename=remote_filename,
+                    parts=get_parts(),
+                    max_workers=max_workers
+                )
+        except Exception as upload_exception:
+            Log.exception(ClientError.ERROR_FILE_UPLOAD_UNHANDLED_EXCEPTION, upload_exception)
+
+        # Make sure the uploaded file exists
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.file_exists(bucket=bucket, filename=remote_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_UPLOAD_FAILED, remote_filename)
+
+    @Log.span('s3.file_upload_recursive')
+    def file_upload_recursive(self, bucket, local_path, remote_path, callback=None, allow_overwrite=True, max_workers=1, transfer_config=None) -> BatchResult:
+        """
+        Recursively upload all files found in the specified local path to the specified remote path
+
+        :type bucket: str
+        :param bucket: The bucket to upload files to
+
+        :type local_path: str
+        :param local_path: Path on local file system to be uploaded
+
+        :type remote_path: str
+        :param remote_path: Path in the bucket where contents are to be uploaded
+
+        :type callback: function/None
+        :param callback: Optional function to call after each file has uploaded successfully, executed on the calling
+            thread in the order uploads complete. If the callback returns False no further files are uploaded
+
+        :type allow_overwrite: bool
+        :param allow_overwrite: Flag indicating files are allowed to be overwritten if they exist. If False, files that
+            already exist are recorded as failures in the result
+
+        :type max_workers: int
+        :param max_workers: Maximum number of files uploaded at once. When greater than 1 each file is uploaded on a single
+            thread
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the clients transfer configuration for this call,
+            either a transfer configuration or one of the TransferProfile class constants
+
+        :return: BatchResult
+        """
+        transfer_config = TransferProfile.get_transfer_config(transfer_config, self.__transfer_config__)
+
+        # Each worker uploads one file at a time, so the number of requests made at once is the number of workers
+        if max_workers > 1:
+            transfer_config = Client.__get_single_threaded_config__(transfer_config)
+
+        # Sanitize the paths
+        local_path = LocalDiskClient.sanitize_path(local_path)
+        remote_path = self.sanitize_path(remote_path)
+
+        if callback is not None and callable(callback) is False:
+            Log.exception(ClientError.ERROR_FILE_UPLOAD_CALLBACK_NOT_CALLABLE)
+
+        if LocalDiskClient.file_exists(local_path) is False:
+            Log.exception(ClientError.ERROR_FILE_UPLOAD_SOURCE_NOT_FOUND)
+
+        # List the destination once rather than checking each file exists before it is uploaded
+        existing_files = set()
+        if allow_overwrite is False:
+            existing_files = set(self.iter_files(bucket=bucket, path=remote_path, recursive=True))
+
+        result = BatchResult()
+
+        def get_transfers():
+            for current_local_filename in Client.__iter_local_files__(local_path):
+                relative_filename = os.path.relpath(current_local_filename, local_path).replace(os.sep, '/')
+                current_remote_filename = self.sanitize_filename(remote_path + relative_filename)
+
+                if current_remote_filename in existing_files:
+                    result.add_failure(current_remote_filename, Exception(ClientError.ERROR_FILE_UPLOAD_ALREADY_EXISTS))
+                    continue
+
+                yield (
+                    self.__get_boto3_s3_client__().upload_file,
+                    {
+                        'Bucket': bucket,
+                        'Key': current_remote_filename,
+                        'Filename': current_local_filename,
+                        'Config': transfer_config
+                    },
+                    current_local_filename,
+                    current_remote_filename
+                )
+
+        self.__transfer_concurrent__(
+            transfers=get_transfers(),
+            callback=callback,
+            max_workers=max_workers,
+            result=result
+        )
+
+        return result
+
+    def file_get_tags(self, bucket, filename) -> dict:
+        """
+        Return a list of tags on the specified file
+
+        :type bucket:str
         :param bucket: Bucket in which the file is contained
 
         :type filename:str
@@ -638,8 +1834,8 @@ class Client:
         filename = Client.sanitize_filename(filename)
 
         Log.trace('Retrieving tags for S3 file...')
-        Log.debug('Bucket Name: {bucket_name}'.format(bucket_name=bucket))
-        Log.debug('Bucket Filename: {bucket_filename}'.format(bucket_filename=filename))
+        Log.debug('Bucket Name: {bucket_name}', bucket_name=bucket)
+        Log.debug('Bucket Filename: {bucket_filename}', bucket_filename=filename)
 
         # Make sure the file exists before we try to do this
         Log.debug('Checking File Exists Before Reading Tags...')
@@ -669,7 +1865,7 @@ class Client:
         for tag in object_tags['TagSet']:
             key = tag['Key']
             value = tag['Value']
-            Log.debug('- {key}: {value}'.format(key=key, value=value))
+            Log.debug('- {key}: {value}', key=key, value=value)
             tags[key] = value
 
         # Return the tags we found
@@ -694,8 +1890,8 @@ class Client:
         filename = self.sanitize_filename(filename)
 
         Log.trace('Setting AWS S3 file tags...')
-        Log.debug('Bucket Name: {bucket_name}'.format(bucket_name=bucket))
-        Log.debug('Bucket Filename: {bucket_filename}'.format(bucket_filename=filename))
+        Log.debug('Bucket Name: {bucket_name}', bucket_name=bucket)
+        Log.debug('Bucket Filename: {bucket_filename}', bucket_filename=filename)
 
         # Make sure the file exists before we try to do this
         Log.debug('Checking File Exists Before Setting Tags...')
@@ -706,7 +1902,7 @@ class Client:
         # Create list object to pass to S3 with key/value pairs
         tag_set = []
         for key in tags.keys():
-            Log.debug('Tag: {key}={value}'.format(key=key, value=tags[key]))
+            Log.debug('Tag: {key}={value}', key=key, value=tags[key])
             tag_set.append({'Key': key, 'Value': tags[key]})
 
         try:
@@ -738,13 +1934,926 @@ class Client:
 
     # Internal methods
 
+    def __transfer_concurrent__(self, transfers, callback, max_workers, result) -> None:
+        """
+        Perform transfers on a pool of worker threads, executing the callback on the calling thread as each completes
+
+        :type transfers: Iterator[tuple]
+        :param transfers: The transfers to perform, each a function, the keyword arguments to call it with, and the
+            local and remote filenames being transferred
+
+        :type callback: function/None
+        :param callback: Optional function to call after each file has transferred successfully
+
+        :type max_workers: int
+        :param max_workers: Maximum number of files transferred at once
+
+        :type result: BatchResult
+        :param result: Result the outcome of each transfer is recorded in
+
+        :return: None
+        """
+        self.__check_connections__(max_workers)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='EasyFilesystemS3Transfer')
+
+        # Transfers that have been submitted but not yet processed, limited so the source is not read far ahead
+        submitted = {}
+
+        try:
+            for function, arguments, local_filename, remote_filename in transfers:
+                # Run each transfer in a copy of the current context so bound log fields are retained
+                future = executor.submit(contextvars.copy_context().run, function, **arguments)
+                submitted[future] = (local_filename, remote_filename)
+
+                while len(submitted) >= max_workers * 2 and result.stopped is False:
+                    Client.__process_completed_transfers__(submitted=submitted, callback=callback, result=result)
+
+                if result.stopped is True:
+                    break
+
+            if result.stopped is True:
+                # Abandon the transfers that have not started
+                for future in [future for future in submitted if future.cancel() is True]:
+                    del submitted[future]
+
+            # Record the outcome of every transfer that started, the callback is not executed once it has asked to stop
+            while len(submitted) > 0:
+                Client.__process_completed_transfers__(submitted=submitted, callback=callback, result=result)
+        finally:
+            # If a transfer could not be processed, abandon any transfers that have not started, and wait for those in
+            # progress to finish
+            for future in submitted:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def __process_completed_transfers__(submitted, callback, result) -> None:
+        """
+        Wait for at least one transfer to complete, record its outcome and execute the callback
+
+        :type submitted: dict
+        :param submitted: Local and remote filenames of submitted transfers, keyed by future
+
+        :type callback: function/None
+        :param callback: Optional function to call after each file has transferred successfully
+
+        :type result: BatchResult
+        :param result: Result the outcome of each transfer is recorded in
+
+        :return: None
+        """
+        completed, _ = wait(submitted, return_when=FIRST_COMPLETED)
+
+        for future in completed:
+            local_filename, remote_filename = submitted.pop(future)
+
+            transfer_exception = future.exception()
+            if transfer_exception is not None:
+                Log.error('Failed to transfer {remote_filename}: {exception}', remote_filename=remote_filename, exception=transfer_exception)
+                result.add_failure(remote_filename, transfer_exception)
+                continue
+
+            result.add_success(remote_filename)
+
+            # Once the callback has asked to stop, remaining transfers are recorded but not passed to the callback
+            if callback is not None and result.stopped is False:
+                if callback(local_filename=local_filename, remote_filename=remote_filename) is False:
+                    result.stopped = True
+
+    def __upload_multipart__(self, bucket, filename, parts, max_workers) -> None:
+        """
+        Upload parts concurrently as they are produced, aborting the upload if any part fails
+
+        :type bucket: str
+        :param bucket: Bucket where file should be uploaded
+
+        :type filename: str
+        :param filename: Destination filename in S3 bucket
+
+        :type parts: Iterator[bytes]
+        :param parts: The data of each part in order
+
+        :type max_workers: int
+        :param max_workers: Maximum number of parts uploaded at once, which is also the number of parts held in memory
+
+        :return: None
+        """
+        upload_id = self.__get_boto3_s3_client__().create_multipart_upload(Bucket=bucket, Key=filename)['UploadId']
+
+        self.__check_connections__(max_workers)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='EasyFilesystemS3Upload')
+
+        # Part numbers of the parts being uploaded, keyed by future
+        submitted = {}
+
+        try:
+            completed_parts = []
+
+            for part_number, data in enumerate(parts, start=1):
+                if part_number > Client.MULTIPART_MAXIMUM_PARTS:
+                    raise Exception(ClientError.ERROR_FILE_UPLOAD_TOO_MANY_PARTS)
+
+                # Run each upload in a copy of the current context so bound log fields are retained
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    self.__get_boto3_s3_client__().upload_part,
+                    Bucket=bucket,
+                    Key=filename,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=data
+                )
+                submitted[future] = part_number
+
+                # Wait for a part to finish before reading another, so memory use is bounded
+                while len(submitted) >= max_workers:
+                    Client.__process_completed_parts__(submitted=submitted, completed_parts=completed_parts)
+
+            while len(submitted) > 0:
+                Client.__process_completed_parts__(submitted=submitted, completed_parts=completed_parts)
+
+            self.__get_boto3_s3_client__().complete_multipart_upload(
+                Bucket=bucket,
+                Key=filename,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': sorted(completed_parts, key=lambda part: part['PartNumber'])}
+            )
+        except Exception:
+            # Stop uploading the remaining parts and discard those already uploaded so they are not stored indefinitely
+            for future in submitted:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.__get_boto3_s3_client__().abort_multipart_upload(Bucket=bucket, Key=filename, UploadId=upload_id)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def __process_completed_parts__(submitted, completed_parts) -> None:
+        """
+        Wait for at least one part to finish uploading and record its ETag, raising an exception if the upload failed
+
+        :type submitted: dict
+        :param submitted: Part numbers of the parts being uploaded, keyed by future
+
+        :type completed_parts: list
+        :param completed_parts: Part numbers and ETags of the uploaded parts
+
+        :return: None
+        """
+        completed, _ = wait(submitted, return_when=FIRST_COMPLETED)
+
+        for future in completed:
+            part_number = submitted.pop(future)
+            completed_parts.append({'PartNumber': part_number, 'ETag': future.result()['ETag']})
+
+    @staticmethod
+    def __iter_parts__(source, part_size) -> Iterator[bytes]:
+        """
+        Divide data read from a file-like object or iterator into parts of the specified size, the last part may be smaller
+
+        :type source: io.IOBase or Iterable[bytes]
+        :param source: A file-like object opened for reading bytes, or an iterator of bytes
+
+        :type part_size: int
+        :param part_size: Size of each part in bytes
+
+        :return: Iterator[bytes]
+        """
+        if hasattr(source, 'read') is True:
+            def get_chunks():
+                while True:
+                    chunk = source.read(part_size)
+                    if not chunk:
+                        return
+                    yield chunk
+
+            chunks = get_chunks()
+        else:
+            chunks = iter(source)
+
+        part = bytearray()
+
+        for chunk in chunks:
+            part += chunk
+
+            while len(part) >= part_size:
+                yield bytes(part[:part_size])
+                del part[:part_size]
+
+        if len(part) > 0:
+            yield bytes(part)
+
+    def __get_ranged_source__(self, bucket, filename, not_found_error, unhandled_error) -> tuple:
+        """
+        Return the filename, size and ETag of a file to be downloaded in ranges, requesting them if a listed file was not
+        supplied
+
+        :type bucket: str
+        :param bucket: Bucket containing the file
+
+        :type filename: str or FileInfo
+        :param filename: Path/filename of the file, or the details of the file returned by a listing
+
+        :type not_found_error: str
+        :param not_found_error: Error raised if the file does not exist
+
+        :type unhandled_error: str
+        :param unhandled_error: Error raised if the details of the file could not be requested
+
+        :return: tuple
+        """
+        if isinstance(filename, FileInfo) is True:
+            return filename.key, filename.size, filename.etag
+
+        filename = self.sanitize_filename(filename)
+
+        file_details = None
+        try:
+            file_details = self.__get_file_details__(bucket=bucket, filename=filename)
+        except Exception as details_exception:
+            Log.exception(unhandled_error, details_exception)
+
+        if file_details is None:
+            Log.exception(not_found_error)
+
+        return filename, file_details['ContentLength'], file_details.get('ETag')
+
+    def __download_ranges__(self, bucket, filename, size, etag, write, transfer_config, max_attempts, completed_offsets=None, callback=None) -> None:
+        """
+        Download byte ranges of a file concurrently, passing the data of each range to the write function as it arrives
+
+        :type bucket: str
+        :param bucket: Bucket containing the file
+
+        :type filename: str
+        :param filename: Path/filename of the file
+
+        :type size: int
+        :param size: Size of the file in bytes
+
+        :type etag: str or None
+        :param etag: ETag of the file, if known ranges are only read from this version of the file
+
+        :type write: Callable
+        :param write: Function called with the offset and data of each chunk received, from the worker threads
+
+        :type transfer_config: TransferConfig
+        :param transfer_config: Range size and number of ranges downloaded at once
+
+        :type max_attempts: int
+        :param max_attempts: Maximum number of times each range is requested if reading it fails
+
+        :type completed_offsets: set or None
+        :param completed_offsets: Optional offsets of ranges that have already been downloaded and are skipped
+
+        :type callback: Callable or None
+        :param callback: Optional function called on the calling thread with the offset of each range as it completes
+
+        :return: None
+        """
+        range_size = transfer_config.multipart_chunksize
+        max_workers = Client.__get_transfer_workers__(transfer_config)
+
+        self.__check_connections__(max_workers)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='EasyFilesystemS3Range')
+
+        # Offsets of the ranges being downloaded, keyed by future
+        submitted = {}
+
+        try:
+            for start in range(0, size, range_size):
+                if completed_offsets is not None and start in completed_offsets:
+                    continue
+
+                # Run each range in a copy of the current context so bound log fields are retained
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    self.__download_range__,
+                    bucket=bucket,
+                    filename=filename,
+                    start=start,
+                    end=min(start + range_size, size) - 1,
+                    etag=etag,
+                    write=write,
+                    max_attempts=max_attempts
+                )
+                submitted[future] = start
+
+            for future in as_completed(submitted):
+                future.result()
+                if callback is not None:
+                    callback(submitted[future])
+        finally:
+            # If a range failed, abandon those that have not started
+            for future in submitted:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def __download_range__(self, bucket, filename, start, end, etag, write, max_attempts) -> None:
+        """
+        Download a byte range of a file, requesting the range again if the connection fails while it is being read
+
+        Errors returned by S3 are not retried here, botocore has already retried those that can succeed and others (e.g.
+        the file changing while it is downloaded) will not succeed if retried.
+
+        :type bucket: str
+        :param bucket: Bucket containing the file
+
+        :type filename: str
+        :param filename: Path/filename of the file
+
+        :type start: int
+        :param start: Offset of the first byte of the range
+
+        :type end: int
+        :param end: Offset of the last byte of the range
+
+        :type etag: str or None
+        :param etag: ETag of the file, if known the range is only read from this version of the file
+
+        :type write: Callable
+        :param write: Function called with the offset and data of each chunk received
+
+        :type max_attempts: int
+        :param max_attempts: Maximum number of times the range is requested
+
+        :return: None
+        """
+        arguments = {
+            'Bucket': bucket,
+            'Key': filename,
+            'Range': 'bytes={start}-{end}'.format(start=start, end=end)
+        }
+
+        if etag is not None:
+            arguments['IfMatch'] = etag
+
+        attempt = 1
+
+        while True:
+            offset = start
+            try:
+                body = self.__get_boto3_s3_client__().get_object(**arguments)['Body']
+                for chunk in body.iter_chunks(Client.RANGE_CHUNK_SIZE):
+                    write(offset, chunk)
+                    offset += len(chunk)
+
+                if offset != end + 1:
+                    raise Exception('Received {received} of {expected} bytes'.format(received=offset - start, expected=end + 1 - start))
+
+                return
+            except BotocoreClientError:
+                raise
+            except Exception as range_exception:
+                if attempt >= max_attempts:
+                    raise
+
+                Log.warning(
+                    'Failed to download bytes {start}-{end} of {filename}, retrying: {exception}',
+                    start=start,
+                    end=end,
+                    filename=filename,
+                    exception=range_exception
+                )
+
+                time.sleep(Client.RANGE_RETRY_DELAY * 2 ** (attempt - 1))
+                attempt += 1
+
+    def __list_uploaded_parts__(self, bucket, filename, upload_id, size, part_size):
+        """
+        Return the ETags of the complete parts of a multipart upload keyed by part number, or None if the upload no
+        longer exists
+
+        :type bucket: str
+        :param bucket: Bucket the file is being uploaded to
+
+        :type filename: str
+        :param filename: Destination filename in S3 bucket
+
+        :type upload_id: str
+        :param upload_id: ID of the multipart upload
+
+        :type size: int
+        :param size: Size of the file being uploaded
+
+        :type part_size: int
+        :param part_size: Size of each part
+
+        :return: dict or None
+        """
+        uploaded_parts = {}
+
+        try:
+            paginator = self.__get_boto3_s3_client__().get_paginator('list_parts')
+            for page in paginator.paginate(Bucket=bucket, Key=filename, UploadId=upload_id):
+                for part in page.get('Parts', []):
+                    # Only keep parts that were uploaded in full
+                    start = (part['PartNumber'] - 1) * part_size
+                    if part['Size'] == min(part_size, size - start):
+                        uploaded_parts[str(part['PartNumber'])] = part['ETag']
+        except BotocoreClientError as list_exception:
+            if list_exception.response.get('Error', {}).get('Code') == 'NoSuchUpload':
+                return None
+            raise
+
+        return uploaded_parts
+
+    def __upload_missing_parts__(self, bucket, local_filename, progress, checkpoint, max_workers) -> None:
+        """
+        Upload the parts of a local file that are missing from a multipart upload, saving progress as each part completes
+
+        :type bucket: str
+        :param bucket: Bucket the file is being uploaded to
+
+        :type local_filename: str
+        :param local_filename: File on local filesystem being uploaded
+
+        :type progress: dict
+        :param progress: Progress of the upload, updated with the ETag of each part uploaded
+
+        :type checkpoint: TransferCheckpoint
+        :param checkpoint: Checkpoint the progress is saved to
+
+        :type max_workers: int
+        :param max_workers: Maximum number of parts uploaded at once, which is also the number of parts held in memory
+
+        :return: None
+        """
+        size = progress['size']
+        part_size = progress['part_size']
+
+        def upload_part(part_number):
+            with open(local_filename, 'rb') as local_file:
+                local_file.seek((part_number - 1) * part_size)
+                data = local_file.read(part_size)
+
+            return self.__get_boto3_s3_client__().upload_part(
+                Bucket=bucket,
+                Key=progress['filename'],
+                UploadId=progress['upload_id'],
+                PartNumber=part_number,
+                Body=data
+            )['ETag']
+
+        self.__check_connections__(max_workers)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='EasyFilesystemS3Upload')
+
+        # Part numbers of the parts being uploaded, keyed by future
+        submitted = {}
+
+        try:
+            # Parts are read by the worker uploading them, so only the parts being uploaded are held in memory
+            for part_number in range(1, -(-size // part_size) + 1):
+                if str(part_number) not in progress['parts']:
+                    # Run each upload in a copy of the current context so bound log fields are retained
+                    future = executor.submit(contextvars.copy_context().run, upload_part, part_number)
+                    submitted[future] = part_number
+
+            for future in as_completed(submitted):
+                progress['parts'][str(submitted[future])] = future.result()
+                checkpoint.save(progress)
+        finally:
+            # If a part failed, abandon those that have not started
+            for future in submitted:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+            # Saves are throttled while uploading, make sure all completed parts are recorded
+            checkpoint.save(progress, force=True)
+
+    def __get_file_details__(self, bucket, filename):
+        """
+        Retrieve the details of a file, returning None if the file does not exist
+
+        :type bucket: str
+        :param bucket: Bucket containing the file
+
+        :type filename: str
+        :param filename: Path/filename of the file
+
+        :return: dict or None
+        """
+        try:
+            return self.__get_boto3_s3_client__().head_object(Bucket=bucket, Key=filename)
+        except BotocoreClientError as head_exception:
+            if head_exception.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+
+    def __copy_multipart__(self, source_bucket, source_filename, destination_bucket, destination_filename, transfer_config, source_details) -> None:
+        """
+        Copy a large file server side by copying its parts concurrently, aborting the upload if any part fails
+
+        :type source_bucket: str
+        :param source_bucket: The bucket the file should be copied from
+
+        :type source_filename: str
+        :param source_filename: The source path/filename
+
+        :type destination_bucket: str
+        :param destination_bucket: The bucket the file should be copied to
+
+        :type destination_filename: str
+        :param destination_filename: The destination path/filename
+
+        :type transfer_config: TransferConfig
+        :param transfer_config: Part size and number of parts copied at once
+
+        :type source_details: dict
+        :param source_details: The result of a HEAD request for the source file
+
+        :return: None
+        """
+        size = source_details['ContentLength']
+
+        # Increase the part size if needed so the parts are not too small and the file does not exceed the maximum number
+        # of parts
+        part_size = max(
+            transfer_config.multipart_chunksize,
+            Client.MULTIPART_MINIMUM_PART_SIZE,
+            -(-size // Client.MULTIPART_MAXIMUM_PARTS)
+        )
+
+        # A multipart upload does not copy the source details, so carry them over, including the encryption settings and
+        # website redirect the source was stored with
+        create_arguments = {}
+        for name in (
+                'CacheControl',
+                'ContentDisposition',
+                'ContentEncoding',
+                'ContentLanguage',
+                'ContentType',
+                'Metadata',
+                'StorageClass',
+                'ServerSideEncryption',
+                'SSEKMSKeyId',
+                'BucketKeyEnabled',
+                'WebsiteRedirectLocation'
+        ):
+            if name in source_details:
+                create_arguments[name] = source_details[name]
+
+        upload_id = self.__get_boto3_s3_client__().create_multipart_upload(
+            Bucket=destination_bucket,
+            Key=destination_filename,
+            **create_arguments
+        )['UploadId']
+
+        max_workers = Client.__get_transfer_workers__(transfer_config)
+        self.__check_connections__(max_workers)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='EasyFilesystemS3Copy')
+
+        try:
+            submitted = []
+            for part_number, start in enumerate(range(0, size, part_size), start=1):
+                # Copying only from the same version of the source file prevents a part being taken from a newer version
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    self.__get_boto3_s3_client__().upload_part_copy,
+                    Bucket=destination_bucket,
+                    Key=destination_filename,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    CopySource={'Bucket': source_bucket, 'Key': source_filename},
+                    CopySourceRange='bytes={start}-{end}'.format(start=start, end=min(start + part_size, size) - 1),
+                    CopySourceIfMatch=source_details['ETag']
+                )
+                submitted.append((part_number, future))
+
+            parts = []
+            for part_number, future in submitted:
+                parts.append({'PartNumber': part_number, 'ETag': future.result()['CopyPartResult']['ETag']})
+
+            self.__get_boto3_s3_client__().complete_multipart_upload(
+                Bucket=destination_bucket,
+                Key=destination_filename,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+        except Exception:
+            # Stop copying the remaining parts and discard those already copied so they are not stored indefinitely
+            for _, future in submitted:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.__get_boto3_s3_client__().abort_multipart_upload(
+                Bucket=destination_bucket,
+                Key=destination_filename,
+                UploadId=upload_id
+            )
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+    def __delete_batch__(self, bucket, filenames) -> list:
+        """
+        Delete a batch of files in a single request, returning the errors reported for any files that were not deleted
+
+        :type bucket: str
+        :param bucket: Bucket from which the files should be deleted
+
+        :type filenames: list[str]
+        :param filenames: Up to 1000 files to delete
+
+        :return: list[dict]
+        """
+        delete_result = self.__get_boto3_s3_client__().delete_objects(
+            Bucket=bucket,
+            Delete={
+                'Objects': [{'Key': filename} for filename in filenames],
+                'Quiet': True
+            }
+        )
+
+        return delete_result.get('Errors', [])
+
+    @staticmethod
+    def __process_completed_deletes__(submitted, result) -> None:
+        """
+        Wait for at least one batch of deletes to complete and record the outcome of each file in it
+
+        :type submitted: dict
+        :param submitted: Filenames of each submitted batch, keyed by future
+
+        :type result: BatchResult
+        :param result: Result the outcome of each file is recorded in
+
+        :return: None
+        """
+        completed, _ = wait(submitted, return_when=FIRST_COMPLETED)
+
+        for future in completed:
+            filenames = submitted.pop(future)
+
+            delete_exception = future.exception()
+            if delete_exception is not None:
+                Log.error('Failed to delete {count} files: {exception}', count=len(filenames), exception=delete_exception)
+                for filename in filenames:
+                    result.add_failure(filename, delete_exception)
+                continue
+
+            errors = {}
+            for error in future.result():
+                errors[error.get('Key')] = Exception('{code}: {message}'.format(code=error.get('Code'), message=error.get('Message')))
+
+            for filename in filenames:
+                if filename in errors:
+                    Log.error('Failed to delete {filename}: {exception}', filename=filename, exception=errors[filename])
+                    result.add_failure(filename, errors[filename])
+                else:
+                    result.add_success(filename)
+
+    @staticmethod
+    def __iter_batches__(items, batch_size) -> Iterator[list]:
+        """
+        Divide items into lists of up to the specified size
+
+        :type items: Iterable
+        :param items: The items to divide
+
+        :type batch_size: int
+        :param batch_size: Maximum number of items in each batch
+
+        :return: Iterator[list]
+        """
+        batch = []
+
+        for item in items:
+            batch.append(item)
+
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if len(batch) > 0:
+            yield batch
+
+    @staticmethod
+    def __iter_local_files__(path) -> Iterator[str]:
+        """
+        Recursively iterate over the files in a local path
+
+        :type path: str
+        :param path: The local path
+
+        :return: Iterator[str]
+        """
+        paths = [path]
+
+        while len(paths) > 0:
+            with os.scandir(paths.pop()) as entries:
+                for entry in entries:
+                    # Symbolic links to directories are not followed, matching os.walk
+                    if entry.is_dir(follow_symlinks=False) is True:
+                        paths.append(entry.path)
+                    elif entry.is_file() is True:
+                        yield entry.path
+
+    @staticmethod
+    def __create_local_filename__(local_path, remote_filename) -> str:
+        """
+        Return the local filename a remote file is downloaded to, creating its path if it does not exist
+
+        :type local_path: str
+        :param local_path: Path on local file system where contents are to be downloaded
+
+        :type remote_filename: str
+        :param remote_filename: The remote file
+
+        :return: str
+        """
+        # The local filename will stored in the same folder structure as on the SFTP server
+        local_file_path = LocalDiskClient.sanitize_path(local_path + os.path.dirname(remote_filename))
+        local_filename = LocalDiskClient.sanitize_filename(local_file_path + os.path.basename(remote_filename))
+
+        # Make sure the current files path exists locally before we start downloading
+        LocalDiskClient.create_path(path=local_file_path, allow_overwrite=True)
+
+        return local_filename
+
+    def __list_shard__(self, bucket, prefix, lower, upper, include_directories, details, output, stopped) -> None:
+        """
+        List a single shard of a parallel listing, writing each page of results to the output queue
+
+        :type bucket: str
+        :param bucket: The bucket from which the objects are to be listed
+
+        :type prefix: str
+        :param prefix: The path being listed
+
+        :type lower: str or None
+        :param lower: If set, the first filename included in the shard
+
+        :type upper: str or None
+        :param upper: If set, the first filename after the end of the shard
+
+        :type include_directories: bool
+        :param include_directories: If true, directories will be included in the results
+
+        :type details: bool
+        :param details: If true, FileInfo objects describing each file are returned instead of filenames
+
+        :type output: queue.Queue
+        :param output: Queue to which pages of results are written
+
+        :type stopped: threading.Event
+        :param stopped: Event set when the listing is no longer required
+
+        :return: None
+        """
+        if stopped.is_set() is True:
+            return
+
+        # S3 can only start a listing after a key, start just before the lower bound so it is included
+        start_after = None
+        if lower is not None:
+            start_after = lower[:-1] + chr(ord(lower[-1]) - 1) if ord(lower[-1]) > 0 else lower[:-1]
+
+        try:
+            page = []
+
+            for file_info in self.iter_files(
+                bucket=bucket,
+                path=prefix,
+                include_directories=include_directories,
+                recursive=True,
+                details=True,
+                start_after=start_after
+            ):
+                if lower is not None and file_info.key < lower:
+                    continue
+                if upper is not None and file_info.key >= upper:
+                    break
+
+                page.append(file_info if details is True else file_info.key)
+
+                if len(page) >= 1000:
+                    if Client.__put_shard_output__(output=output, item=('page', page), stopped=stopped) is False:
+                        return
+                    page = []
+
+            if len(page) > 0:
+                if Client.__put_shard_output__(output=output, item=('page', page), stopped=stopped) is False:
+                    return
+
+            Client.__put_shard_output__(output=output, item=('done', None), stopped=stopped)
+        except Exception as list_exception:
+            Client.__put_shard_output__(output=output, item=('error', list_exception), stopped=stopped)
+
+    @staticmethod
+    def __put_shard_output__(output, item, stopped) -> bool:
+        """
+        Write to a shards output queue, waiting for space unless the listing is stopped
+
+        :type output: queue.Queue
+        :param output: The output queue
+
+        :type item: tuple
+        :param item: The item to write
+
+        :type stopped: threading.Event
+        :param stopped: Event set when the listing is no longer required
+
+        :return: bool
+        """
+        while stopped.is_set() is False:
+            try:
+                output.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    @staticmethod
+    def __iter_shard_output__(output, count_shards) -> Iterator:
+        """
+        Yield the files written to an output queue until the specified number of shards have completed
+
+        :type output: queue.Queue
+        :param output: The output queue
+
+        :type count_shards: int
+        :param count_shards: Number of shards writing to the queue
+
+        :return: Iterator[str] or Iterator[FileInfo]
+        """
+        while count_shards > 0:
+            item_type, value = output.get()
+
+            if item_type == 'page':
+                yield from value
+            elif item_type == 'done':
+                count_shards -= 1
+            else:
+                Log.exception(ClientError.ERROR_FILE_LIST_UNHANDLED_EXCEPTION, value)
+
+    def __get_boto3_config__(self):
+        """
+        Retrieve the botocore configuration used when creating the Boto3 S3 client
+
+        :return: Config
+        """
+        return Config(max_pool_connections=self.__max_pool_connections__)
+
+    def __check_connections__(self, count) -> None:
+        """
+        Warn if the connection pool cannot serve the number of requests about to be made at once, as requests would wait
+        for a connection to become available
+
+        :type count: int
+        :param count: Number of requests made at once
+
+        :return: None
+        """
+        if self.__max_pool_connections__ < count:
+            Log.warning(
+                'Making {count} requests at once but only {max_pool_connections} connections are available',
+                count=count,
+                max_pool_connections=self.__max_pool_connections__
+            )
+
+    @staticmethod
+    def __get_transfer_workers__(transfer_config) -> int:
+        """
+        Return the number of requests a transfer makes at once
+
+        :type transfer_config: TransferConfig
+        :param transfer_config: Multipart settings of the transfer
+
+        :return: int
+        """
+        return transfer_config.max_concurrency if transfer_config.use_threads is True else 1
+
+    @staticmethod
+    def __get_single_threaded_config__(transfer_config) -> TransferConfig:
+        """
+        Return a copy of the transfer configuration that transfers each file on the calling thread, used when several
+        files are transferred at once so the number of requests made at once is the number of files
+
+        :type transfer_config: TransferConfig
+        :param transfer_config: Multipart settings to copy
+
+        :return: TransferConfig
+        """
+        single_threaded_config = copy.copy(transfer_config)
+        single_threaded_config.use_threads = False
+        return single_threaded_config
+
     def __get_boto3_s3_client__(self):
         """
         Retrieve Boto3 S3 client
 
         :return:
         """
-        if self.__boto3_s3_client__ is None:
+        if self.__boto3_s3_client__ is not None:
+            return self.__boto3_s3_client__
+
+        # The client may be requested by several threads at once, make sure only one client is created
+        with self.__boto3_s3_client_lock__:
+            if self.__boto3_s3_client__ is not None:
+                return self.__boto3_s3_client__
+
             if self.__assumed_role_arn__ is not None:
                 # Assume IAM role for this connection
                 sts_default_provider_chain = boto3.client('sts')
@@ -758,9 +2867,15 @@ class Client:
                     aws_access_key_id=credentials['AccessKeyId'],
                     aws_secret_access_key=credentials['SecretAccessKey'],
                     aws_session_token=credentials['SessionToken'],
+                    endpoint_url=self.__endpoint_url__,
+                    config=self.__get_boto3_config__()
                 )
             else:
                 # Use default permissions assigned to this Lambda
-                self.__boto3_s3_client__ = boto3.session.Session().client('s3')
+                self.__boto3_s3_client__ = boto3.session.Session().client(
+                    's3',
+                    endpoint_url=self.__endpoint_url__,
+                    config=self.__get_boto3_config__()
+                )
 
         return self.__boto3_s3_client__
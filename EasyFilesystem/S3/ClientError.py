@@ -1,6 +1,9 @@
 class ClientError:
     ERROR_UNHANDLED_EXCEPTION = ' Please review additional error messages.'
 
+    # Transfer Profile Errors
+    ERROR_TRANSFER_PROFILE_UNKNOWN = 'An unknown S3 transfer profile was specified.'
+
     # Bucket List Errors
     ERROR_BUCKET_LIST = 'An unexpected error occurred during listing of available S3 buckets.'
     ERROR_BUCKET_LIST_UNHANDLED_EXCEPTION = ERROR_BUCKET_LIST + ERROR_UNHANDLED_EXCEPTION
@@ -65,6 +68,8 @@ class ClientError:
     ERROR_FILE_UPLOAD_SOURCE_NOT_FOUND = ERROR_FILE_UPLOAD + ' The source file could not be found.'
     ERROR_FILE_UPLOAD_ALREADY_EXISTS = ERROR_FILE_UPLOAD + ' The destination file already exists.'
     ERROR_FILE_UPLOAD_FAILED = ERROR_FILE_UPLOAD + ' The upload failed.'
+    ERROR_FILE_UPLOAD_CALLBACK_NOT_CALLABLE = ERROR_FILE_UPLOAD + ' The callback function was not a callable object.'
+    ERROR_FILE_UPLOAD_TOO_MANY_PARTS = ERROR_FILE_UPLOAD + ' The file exceeded the maximum number of parts, increase the part size.'
 
     # File Download Errors
     ERROR_FILE_DOWNLOAD = 'An unexpected error occurred while download a file from S3.'
@@ -74,6 +79,17 @@ class ClientError:
     ERROR_FILE_DOWNLOAD_ALREADY_EXISTS = ERROR_FILE_DOWNLOAD + ' The destination file already exists.'
     ERROR_FILE_DOWNLOAD_FAILED = ERROR_FILE_DOWNLOAD + ' The download failed.'
 
+    # File Read Errors
+    ERROR_FILE_READ = 'An unexpected error occurred while reading S3 file.'
+    ERROR_FILE_READ_UNHANDLED_EXCEPTION = ERROR_FILE_READ + ERROR_UNHANDLED_EXCEPTION
+    ERROR_FILE_READ_SOURCE_NOT_FOUND = ERROR_FILE_READ + ' The requested file could not be found.'
+
+    # File Open Errors
+    ERROR_FILE_OPEN = 'An unexpected error occurred while opening S3 file.'
+    ERROR_FILE_OPEN_UNHANDLED_EXCEPTION = ERROR_FILE_OPEN + ERROR_UNHANDLED_EXCEPTION
+    ERROR_FILE_OPEN_SOURCE_NOT_FOUND = ERROR_FILE_OPEN + ' The requested file could not be found.'
+    ERROR_FILE_OPEN_MODE_UNSUPPORTED = ERROR_FILE_OPEN + ' Files can only be opened for reading in binary (rb) or text (r) mode.'
+
     # Create Path Errors
     ERROR_CREATE_PATH = 'An unexpected error occurred while attempting to create a path in S3.'
     ERROR_CREATE_PATH_UNHANDLED_EXCEPTION = ERROR_CREATE_PATH + ERROR_UNHANDLED_EXCEPTION
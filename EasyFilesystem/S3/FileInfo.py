@@ -0,0 +1,64 @@
+class FileInfo:
+    """
+    Details of an object returned by an S3 listing
+
+    Listings already return the size, ETag, modification time and storage class of every object, keeping them means
+    callers do not need to request the same details again for each object.
+    """
+    __slots__ = ('key', 'size', 'etag', 'last_modified', 'storage_class')
+
+    def __init__(self, key, size=0, etag=None, last_modified=None, storage_class=None):
+        """
+        :type key: str
+        :param key: Path/filename of the object in the bucket
+
+        :type size: int
+        :param size: Size of the object in bytes
+
+        :type etag: str or None
+        :param etag: ETag of the object
+
+        :type last_modified: datetime.datetime or None
+        :param last_modified: Time the object was last modified
+
+        :type storage_class: str or None
+        :param storage_class: Storage class of the object
+        """
+        self.key = key
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.storage_class = storage_class
+
+    def __str__(self) -> str:
+        return self.key
+
+    def __repr__(self) -> str:
+        return 'FileInfo(key={key!r}, size={size!r})'.format(key=self.key, size=self.size)
+
+    @staticmethod
+    def from_object_details(object_details):
+        """
+        Create file details from an entry in the 'Contents' of a list_objects_v2 result
+
+        :type object_details: dict
+        :param object_details: The listed object
+
+        :return: FileInfo
+        """
+        return FileInfo(
+            key=object_details['Key'],
+            size=object_details.get('Size', 0),
+            etag=object_details.get('ETag'),
+            last_modified=object_details.get('LastModified'),
+            storage_class=object_details.get('StorageClass')
+        )
+
+    @property
+    def is_directory(self) -> bool:
+        """
+        Flag indicating the object is a directory
+
+        :return: bool
+        """
+        return self.key.endswith('/')
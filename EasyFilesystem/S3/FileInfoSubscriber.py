@@ -0,0 +1,24 @@
+from s3transfer.subscribers import BaseSubscriber
+
+
+class FileInfoSubscriber(BaseSubscriber):
+    """
+    Provide the listed details of an object to a managed transfer when it is queued
+
+    When the size and ETag are already known the transfer manager does not need to request them with a HeadObject call
+    before starting the transfer.
+    """
+
+    def __init__(self, file_info):
+        """
+        :type file_info: FileInfo
+        :param file_info: Details of the object being transferred
+        """
+        self.file_info = file_info
+
+    def on_queued(self, future, **kwargs):
+        future.meta.provide_transfer_size(self.file_info.size)
+
+        # Older versions of s3transfer do not use the ETag
+        if self.file_info.etag is not None and hasattr(future.meta, 'provide_object_etag') is True:
+            future.meta.provide_object_etag(self.file_info.etag)
@@ -1,10 +1,24 @@
+from typing import Iterator
+
 from EasyFilesystem.BaseFilesystem import BaseFilesystem
+from EasyFilesystem.BatchResult import BatchResult
 from EasyFilesystem.S3.Client import Client
+from EasyFilesystem.S3.FileInfo import FileInfo
+from EasyFilesystem.VerificationPolicy import VerificationPolicy
 from EasyLog.Log import Log
 
 
 class Filesystem(BaseFilesystem):
-    def __init__(self, bucket_name, base_path='', assumed_role=None):
+    def __init__(
+            self,
+            bucket_name,
+            base_path='',
+            assumed_role=None,
+            max_pool_connections=None,
+            verification_policy=VerificationPolicy.STRICT,
+            transfer_config=None,
+            endpoint_url=None
+    ):
         """
         Instantiate S3 sftp_filesystem
 
@@ -13,11 +27,32 @@ class Filesystem(BaseFilesystem):
 
         :type base_path: str
         :param base_path: Base path inside the the bucket to serve as the sftp_filesystem root
+
+        :type max_pool_connections: int or None
+        :param max_pool_connections: Maximum number of connections kept open to S3. If None the pool is sized for the
+            larger of the botocore default and the max_concurrency of the transfer configuration
+
+        :type verification_policy: str
+        :param verification_policy: Default verification policy for file operations, one of the VerificationPolicy class
+            constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Default multipart settings for uploads, downloads and copies, either a transfer
+            configuration or one of the TransferProfile class constants. If None the boto3 defaults are used
+
+        :type endpoint_url: str or None
+        :param endpoint_url: Optional URL of an S3 compatible endpoint to connect to instead of AWS
         """
         super().__init__()
 
         # Grab S3 client
-        self.__client__ = Client(assumed_role_arn=assumed_role)
+        self.__client__ = Client(
+            assumed_role_arn=assumed_role,
+            max_pool_connections=max_pool_connections,
+            verification_policy=verification_policy,
+            transfer_config=transfer_config,
+            endpoint_url=endpoint_url
+        )
 
         # Sanitize the supplied base path
         self.__base_path__ = Client.sanitize_path(base_path)
@@ -30,13 +65,19 @@ class Filesystem(BaseFilesystem):
         Cleanup sftp_filesystem, removing any temporary files
         """
         for temp_path in self.__temp_paths__:
-            self.__client__.path_delete(
-                bucket=self.__bucket__,
-                path=temp_path,
-                allow_missing=True
-            )
-
-    def create_path(self, path, allow_overwrite=False) -> None:
+            # Exceptions cannot be raised from here, a failed cleanup should not prevent the other paths being removed
+            # noinspection PyBroadException
+            try:
+                self.__client__.path_delete(
+                    bucket=self.__bucket__,
+                    path=temp_path,
+                    allow_missing=True,
+                    recursive=True
+                )
+            except Exception as delete_exception:
+                Log.warning('Failed to delete temporary path {temp_path}: {exception}', temp_path=temp_path, exception=delete_exception)
+
+    def create_path(self, path, allow_overwrite=False, verification_policy=None) -> None:
         """
         Create path in remote sftp_filesystem
 
@@ -45,10 +86,19 @@ class Filesystem(BaseFilesystem):
 
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the path is allowed to be overwritten if it exists. If False, and the path exists an exception will be thrown
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
         """
         path = self.__rebase_path__(path)
 
-        self.__client__.create_path(bucket=self.__bucket__, path=path, allow_overwrite=allow_overwrite)
+        self.__client__.create_path(
+            bucket=self.__bucket__,
+            path=path,
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy
+        )
 
     def create_temp_path(self, prefix='', temp_path=None, auto_create=True) -> str:
         """
@@ -82,7 +132,7 @@ class Filesystem(BaseFilesystem):
 
         return temp_path
 
-    def file_list(self, path, recursive=False) -> list:
+    def file_list(self, path, recursive=False, details=False) -> list:
         """
         List a list of all files accessible in the sftp_filesystem sftp_filesystem
 
@@ -92,6 +142,9 @@ class Filesystem(BaseFilesystem):
         :type recursive: bool
         :param recursive: If True the listing will proceed recursively down through all sub-folders
 
+        :type details: bool
+        :param details: If True, FileInfo objects describing each file are returned instead of filenames
+
         :return: list
         """
         path = self.__rebase_path__(path)
@@ -99,7 +152,70 @@ class Filesystem(BaseFilesystem):
         return self.__client__.file_list(
             bucket=self.__bucket__,
             path=path,
-            recursive=recursive
+            recursive=recursive,
+            details=details
+        )
+
+    def iter_files(self, path, recursive=False, details=False, prefetch=False) -> Iterator:
+        """
+        Iterate over all files accessible in the sftp_filesystem, yielding each file as soon as it has been listed
+
+        :type path: str
+        :param path: The path in the sftp_filesystem to list
+
+        :type recursive: bool
+        :param recursive: If True the listing will proceed recursively down through all sub-folders
+
+        :type details: bool
+        :param details: If True, FileInfo objects describing each file are yielded instead of filenames
+
+        :type prefetch: bool
+        :param prefetch: If True, the next page of results is requested in the background while the current page is
+            being processed
+
+        :return: Iterator[str] or Iterator[FileInfo]
+        """
+        path = self.__rebase_path__(path)
+
+        return self.__client__.iter_files(
+            bucket=self.__bucket__,
+            path=path,
+            recursive=recursive,
+            details=details,
+            prefetch=prefetch
+        )
+
+    def iter_files_parallel(self, path, details=False, split_points=None, max_workers=8, ordered=False) -> Iterator:
+        """
+        Recursively iterate over all files accessible in the sftp_filesystem, listing shards of the path concurrently
+
+        :type path: str
+        :param path: The path in the sftp_filesystem to list
+
+        :type details: bool
+        :param details: If True, FileInfo objects describing each file are yielded instead of filenames
+
+        :type split_points: list[str] or tuple[str] or None
+        :param split_points: Optional filename prefixes, relative to the path, at which the path is divided into shards.
+            If None the path is divided into its immediate sub-directories
+
+        :type max_workers: int
+        :param max_workers: Maximum number of shards listed at once
+
+        :type ordered: bool
+        :param ordered: If True files are returned in the same order as a sequential listing
+
+        :return: Iterator[str] or Iterator[FileInfo]
+        """
+        path = self.__rebase_path__(path)
+
+        return self.__client__.iter_files_parallel(
+            bucket=self.__bucket__,
+            path=path,
+            details=details,
+            split_points=split_points,
+            max_workers=max_workers,
+            ordered=ordered
         )
 
     def path_exists(self, path) -> bool:
@@ -129,7 +245,7 @@ class Filesystem(BaseFilesystem):
 
         return self.__client__.file_exists(bucket=self.__bucket__, filename=filename)
 
-    def path_delete(self, path, allow_missing=False) -> None:
+    def path_delete(self, path, allow_missing=False, recursive=False, verification_policy=None) -> None:
         """
         Delete a path
 
@@ -138,12 +254,25 @@ class Filesystem(BaseFilesystem):
 
         :type allow_missing: bool
         :param allow_missing: Boolean flag, if False and the file cannot be found to delete an exception will be raised
+
+        :type recursive: bool
+        :param recursive: If True, the path and every file below it are deleted
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
         """
         path = self.__rebase_path__(path)
 
-        self.__client__.path_delete(bucket=self.__bucket__, path=path, allow_missing=allow_missing)
+        self.__client__.path_delete(
+            bucket=self.__bucket__,
+            path=path,
+            allow_missing=allow_missing,
+            recursive=recursive,
+            verification_policy=verification_policy
+        )
 
-    def file_delete(self, filename, allow_missing=False) -> None:
+    def file_delete(self, filename, allow_missing=False, verification_policy=None) -> None:
         """
         Delete a file
 
@@ -152,25 +281,62 @@ class Filesystem(BaseFilesystem):
 
         :type allow_missing: bool
         :param allow_missing: Boolean flag, if False and the file cannot be found to delete an exception will be raised
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
         """
         filename = self.__rebase_path__(filename)
 
-        self.__client__.file_delete(bucket=self.__bucket__, filename=filename, allow_missing=allow_missing)
+        self.__client__.file_delete(
+            bucket=self.__bucket__,
+            filename=filename,
+            allow_missing=allow_missing,
+            verification_policy=verification_policy
+        )
 
-    def file_move(self, source_filename, destination_filename, allow_overwrite=True) -> None:
+    def files_delete(self, filenames, max_workers=4) -> BatchResult:
+        """
+        Delete many files using batched requests. Files that do not exist are treated as successfully deleted
+
+        :type filenames: list[str] or Iterator[str]
+        :param filenames: Paths of the files to be deleted
+
+        :type max_workers: int
+        :param max_workers: Maximum number of batches deleted at once
+
+        :return: BatchResult
+        """
+        return self.__client__.files_delete(
+            bucket=self.__bucket__,
+            filenames=(self.__rebase_path__(filename) for filename in filenames),
+            max_workers=max_workers
+        )
+
+    def file_move(self, source_filename, destination_filename, allow_overwrite=True, verification_policy=None, transfer_config=None) -> None:
         """
         Move a file to the specified destination
 
-        :type source_filename:str
-        :param source_filename: The source filename
+        :type source_filename: str or FileInfo
+        :param source_filename: The source path/filename, or the details of the file returned by a listing
 
         :type destination_filename:str
         :param destination_filename: The destination filename
 
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
         """
-        source_filename = self.__rebase_path__(source_filename)
+        # Listed files already include the base path in their key, so only filenames are rebased
+        if isinstance(source_filename, FileInfo) is False:
+            source_filename = self.__rebase_path__(source_filename)
         destination_filename = self.__rebase_path__(destination_filename)
 
         self.__client__.file_move(
@@ -178,23 +344,35 @@ class Filesystem(BaseFilesystem):
             source_filename=source_filename,
             destination_bucket=self.__bucket__,
             destination_filename=destination_filename,
-            allow_overwrite=allow_overwrite
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy,
+            transfer_config=transfer_config
         )
 
-    def file_copy(self, source_filename, destination_filename, allow_overwrite=True) -> None:
+    def file_copy(self, source_filename, destination_filename, allow_overwrite=True, verification_policy=None, transfer_config=None) -> None:
         """
         Copy file to the specified destination
 
-        :type source_filename:str
-        :param source_filename: The source path/filename
+        :type source_filename: str or FileInfo
+        :param source_filename: The source path/filename, or the details of the file returned by a listing
 
         :type destination_filename:str
         :param destination_filename: The destination path.filename
 
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
         """
-        source_filename = self.__rebase_path__(source_filename)
+        # Listed files already include the base path in their key, so only filenames are rebased
+        if isinstance(source_filename, FileInfo) is False:
+            source_filename = self.__rebase_path__(source_filename)
         destination_filename = self.__rebase_path__(destination_filename)
 
         self.__client__.file_copy(
@@ -202,33 +380,49 @@ class Filesystem(BaseFilesystem):
             source_filename=source_filename,
             destination_bucket=self.__bucket__,
             destination_filename=destination_filename,
-            allow_overwrite=allow_overwrite)
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy,
+            transfer_config=transfer_config
+        )
 
-    def file_download(self, local_filename, remote_filename, allow_overwrite=True) -> None:
+    def file_download(self, local_filename, remote_filename, allow_overwrite=True, verification_policy=None, transfer_config=None) -> None:
         """
         Download a file from SFTP server
 
         :type local_filename: str
         :param local_filename: Filename/path of the destination on the local sftp_filesystem
 
-        :type remote_filename: str
-        :param remote_filename: Filename/path of the file to download from the SFTP server
+        :type remote_filename: str or FileInfo
+        :param remote_filename: Filename/path of the file to download from the SFTP server, or the details of the file
+            returned by a listing
 
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
+
         :return: None
         """
-        remote_filename = self.__rebase_path__(remote_filename)
+        # Listed files already include the base path in their key, so only filenames are rebased
+        if isinstance(remote_filename, FileInfo) is False:
+            remote_filename = self.__rebase_path__(remote_filename)
 
         return self.__client__.file_download(
             bucket=self.__bucket__,
             local_filename=local_filename,
             remote_filename=remote_filename,
-            allow_overwrite=allow_overwrite
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy,
+            transfer_config=transfer_config
         )
 
-    def file_download_recursive(self, remote_path, local_path, callback=None, allow_overwrite=True) -> None:
+    def file_download_recursive(self, remote_path, local_path, callback=None, allow_overwrite=True, max_workers=1, transfer_config=None, snapshot=True) -> BatchResult:
         """
         Recursively download all files found in the specified remote path to the specified local path
 
@@ -244,19 +438,35 @@ class Filesystem(BaseFilesystem):
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
-        :return: None
+        :type max_workers: int
+        :param max_workers: Maximum number of files downloaded at once. When greater than 1, files that fail to download
+            are recorded in the result instead of raising an exception, and each file is downloaded on a single thread
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
+
+        :type snapshot: bool
+        :param snapshot: If true, the full listing is read before the first file is downloaded, so files created in the
+            path while downloading are not downloaded. If false, files are downloaded as each page of the listing is
+            received
+
+        :return: BatchResult
         """
         Log.test('Recursive Download Starting...')
         remote_path = self.__rebase_path__(remote_path)
-        self.__client__.file_download_recursive(
+        return self.__client__.file_download_recursive(
             bucket=self.__bucket__,
             remote_path=remote_path,
             local_path=local_path,
             callback=callback,
-            allow_overwrite=allow_overwrite
+            allow_overwrite=allow_overwrite,
+            max_workers=max_workers,
+            transfer_config=transfer_config,
+            snapshot=snapshot
         )
 
-    def file_upload(self, remote_filename, local_filename, allow_overwrite=True) -> None:
+    def file_upload(self, remote_filename, local_filename, allow_overwrite=True, verification_policy=None, transfer_config=None) -> None:
         """
         Upload a file to remote sftp_filesystem
 
@@ -269,6 +479,14 @@ class Filesystem(BaseFilesystem):
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be raised
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
+
         :return: None
         """
         remote_filename = self.__rebase_path__(remote_filename)
@@ -277,11 +495,276 @@ class Filesystem(BaseFilesystem):
             bucket=self.__bucket__,
             local_filename=local_filename,
             remote_filename=remote_filename,
-            allow_overwrite=allow_overwrite
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy,
+            transfer_config=transfer_config
         )
 
     # S3 specific method
 
+    def file_download_ranged(self, local_filename, remote_filename, allow_overwrite=True, transfer_config=None, max_attempts=3) -> None:
+        """
+        Download a single file by requesting byte ranges of it concurrently
+
+        :type local_filename: str
+        :param local_filename: Filename/path of the destination on the local filesystem
+
+        :type remote_filename: str or FileInfo
+        :param remote_filename: Filename/path of the file to download, or the details of the file returned by a listing
+
+        :type allow_overwrite: bool
+        :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
+
+        :type max_attempts: int
+        :param max_attempts: Maximum number of times each range is requested if reading it fails
+
+        :return: None
+        """
+        # Listed files already include the base path in their key, so only filenames are rebased
+        if isinstance(remote_filename, FileInfo) is False:
+            remote_filename = self.__rebase_path__(remote_filename)
+
+        return self.__client__.file_download_ranged(
+            bucket=self.__bucket__,
+            local_filename=local_filename,
+            remote_filename=remote_filename,
+            allow_overwrite=allow_overwrite,
+            transfer_config=transfer_config,
+            max_attempts=max_attempts
+        )
+
+    def file_download_resumable(self, local_filename, remote_filename, allow_overwrite=True, transfer_config=None, max_attempts=3) -> None:
+        """
+        Download a single file in concurrent byte ranges, continuing from the ranges already downloaded if a previous
+        attempt was interrupted
+
+        :type local_filename: str
+        :param local_filename: Filename/path of the destination on the local filesystem
+
+        :type remote_filename: str or FileInfo
+        :param remote_filename: Filename/path of the file to download, or the details of the file returned by a listing
+
+        :type allow_overwrite: bool
+        :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
+
+        :type max_attempts: int
+        :param max_attempts: Maximum number of times each range is requested if reading it fails
+
+        :return: None
+        """
+        # Listed files already include the base path in their key, so only filenames are rebased
+        if isinstance(remote_filename, FileInfo) is False:
+            remote_filename = self.__rebase_path__(remote_filename)
+
+        return self.__client__.file_download_resumable(
+            bucket=self.__bucket__,
+            local_filename=local_filename,
+            remote_filename=remote_filename,
+            allow_overwrite=allow_overwrite,
+            transfer_config=transfer_config,
+            max_attempts=max_attempts
+        )
+
+    def file_read(self, filename, transfer_config=None, max_attempts=3) -> bytearray:
+        """
+        Read the contents of a file into memory by requesting byte ranges of it concurrently
+
+        :type filename: str or FileInfo
+        :param filename: Filename/path of the file, or the details of the file returned by a listing
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
+
+        :type max_attempts: int
+        :param max_attempts: Maximum number of times each range is requested if reading it fails
+
+        :return: bytearray
+        """
+        # Listed files already include the base path in their key, so only filenames are rebased
+        if isinstance(filename, FileInfo) is False:
+            filename = self.__rebase_path__(filename)
+
+        return self.__client__.file_read(
+            bucket=self.__bucket__,
+            filename=filename,
+            transfer_config=transfer_config,
+            max_attempts=max_attempts
+        )
+
+    def file_upload_resumable(
+            self,
+            remote_filename,
+            local_filename,
+            allow_overwrite=True,
+            verification_policy=None,
+            transfer_config=None,
+            checkpoint_filename=None,
+            checkpoint_bucket=None
+    ) -> None:
+        """
+        Upload a local file in concurrent parts, only sending the parts that are missing if a previous attempt was
+        interrupted
+
+        :type remote_filename: str
+        :param remote_filename: Filename/path where the file should be uploaded
+
+        :type local_filename: str
+        :param local_filename: Filename/path of file to be uploaded from local filesystem
+
+        :type allow_overwrite: bool
+        :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be raised
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
+
+        :type checkpoint_filename: str or None
+        :param checkpoint_filename: Filename the progress is saved to, see S3 Client.file_upload_resumable
+
+        :type checkpoint_bucket: str or None
+        :param checkpoint_bucket: Optional bucket the progress is saved to, if None the progress is saved on the local
+            filesystem
+
+        :return: None
+        """
+        remote_filename = self.__rebase_path__(remote_filename)
+
+        return self.__client__.file_upload_resumable(
+            bucket=self.__bucket__,
+            remote_filename=remote_filename,
+            local_filename=local_filename,
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy,
+            transfer_config=transfer_config,
+            checkpoint_filename=checkpoint_filename,
+            checkpoint_bucket=checkpoint_bucket
+        )
+
+    def file_upload_stream(self, remote_filename, source, allow_overwrite=True, verification_policy=None, transfer_config=None) -> None:
+        """
+        Upload data read from a file-like object or generated by an iterator, without writing it to local disk
+
+        :type remote_filename: str
+        :param remote_filename: Filename/path where the file should be uploaded
+
+        :type source: io.IOBase or Iterable[bytes]
+        :param source: A file-like object opened for reading bytes, or an iterator of bytes
+
+        :type allow_overwrite: bool
+        :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be raised
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
+
+        :return: None
+        """
+        remote_filename = self.__rebase_path__(remote_filename)
+
+        return self.__client__.file_upload_stream(
+            bucket=self.__bucket__,
+            remote_filename=remote_filename,
+            source=source,
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy,
+            transfer_config=transfer_config
+        )
+
+    def file_upload_recursive(self, local_path, remote_path, callback=None, allow_overwrite=True, max_workers=1, transfer_config=None) -> BatchResult:
+        """
+        Recursively upload all files found in the specified local path to the specified remote path
+
+        :type local_path: str
+        :param local_path: Path on local file system to be uploaded
+
+        :type remote_path: str
+        :param remote_path: Path where contents are to be uploaded
+
+        :type callback: Callable or None
+        :param callback: Optional function to call after each file has uploaded successfully. If the callback returns
+            False no further files are uploaded
+
+        :type allow_overwrite: bool
+        :param allow_overwrite: Flag indicating files are allowed to be overwritten if they exist. If False, files that
+            already exist are recorded as failures in the result
+
+        :type max_workers: int
+        :param max_workers: Maximum number of files uploaded at once. When greater than 1 each file is uploaded on a single
+            thread
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: Optional multipart settings overriding the filesystems transfer configuration for this
+            call, either a transfer configuration or one of the TransferProfile class constants
+
+        :return: BatchResult
+        """
+        remote_path = self.__rebase_path__(remote_path)
+
+        return self.__client__.file_upload_recursive(
+            bucket=self.__bucket__,
+            local_path=local_path,
+            remote_path=remote_path,
+            callback=callback,
+            allow_overwrite=allow_overwrite,
+            max_workers=max_workers,
+            transfer_config=transfer_config
+        )
+
+    def file_open(self, filename, mode='rb', encoding=None, block_size=8 * 1024 * 1024, read_ahead=1, cache_blocks=4):
+        """
+        Open a file for reading without downloading it, the file is read in blocks as it is used
+
+        :type filename: str or FileInfo
+        :param filename: Filename/path of the file, or the details of the file returned by a listing
+
+        :type mode: str
+        :param mode: Either 'rb' to read bytes or 'r' to read text
+
+        :type encoding: str or None
+        :param encoding: Encoding of the file when reading text, if None the locale encoding is used
+
+        :type block_size: int
+        :param block_size: Number of bytes requested at once
+
+        :type read_ahead: int
+        :param read_ahead: Number of blocks following the block being read that are requested in the background
+
+        :type cache_blocks: int
+        :param cache_blocks: Maximum number of blocks held in memory, including those being read ahead
+
+        :return: io.BufferedReader or io.TextIOWrapper
+        """
+        # Listed files already include the base path in their key, so only filenames are rebased
+        if isinstance(filename, FileInfo) is False:
+            filename = self.__rebase_path__(filename)
+
+        return self.__client__.file_open(
+            bucket=self.__bucket__,
+            filename=filename,
+            mode=mode,
+            encoding=encoding,
+            block_size=block_size,
+            read_ahead=read_ahead,
+            cache_blocks=cache_blocks
+        )
+
     def file_get_tags(self, filename) -> dict:
         """
         Return a list of tags on the specified file
@@ -0,0 +1,193 @@
+import contextvars
+import io
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class ObjectReader(io.RawIOBase):
+    """
+    Seekable read only stream over an S3 object, reading it in blocks using ranged GET requests
+
+    Recently read blocks are cached so seeking back over them does not request them again, and the blocks following
+    the one being read are requested in the background so sequential reads do not wait on each request. Every block is
+    requested from the same version of the object, reads fail if the object is replaced while it is open.
+    """
+
+    def __init__(self, boto3_s3_client, bucket, filename, size, etag, block_size=8 * 1024 * 1024, read_ahead=1, cache_blocks=4):
+        """
+        :type boto3_s3_client: S3.Client
+        :param boto3_s3_client: The Boto3 S3 client used to request blocks
+
+        :type bucket: str
+        :param bucket: Bucket containing the object
+
+        :type filename: str
+        :param filename: Path/filename of the object
+
+        :type size: int
+        :param size: Size of the object in bytes
+
+        :type etag: str or None
+        :param etag: ETag of the object, if known blocks are only read from this version of the object
+
+        :type block_size: int
+        :param block_size: Number of bytes requested at once
+
+        :type read_ahead: int
+        :param read_ahead: Number of blocks following the current block requested in the background, 0 to disable
+
+        :type cache_blocks: int
+        :param cache_blocks: Maximum number of blocks held in memory, including those being read ahead
+        """
+        super().__init__()
+        self.__boto3_s3_client__ = boto3_s3_client
+        self.__bucket__ = bucket
+        self.__filename__ = filename
+        self.__size__ = size
+        self.__etag__ = etag
+        self.__block_size__ = block_size
+        self.__read_ahead__ = read_ahead
+        self.__cache_blocks__ = max(cache_blocks, read_ahead + 1)
+        self.__position__ = 0
+        self.__blocks__ = OrderedDict()
+        self.__executor__ = None
+
+        if read_ahead > 0:
+            self.__executor__ = ThreadPoolExecutor(max_workers=read_ahead, thread_name_prefix='EasyFilesystemS3Reader')
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.__position__
+
+    def seek(self, offset, whence=io.SEEK_SET) -> int:
+        if self.closed is True:
+            raise ValueError('I/O operation on closed file.')
+
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.__position__ + offset
+        elif whence == io.SEEK_END:
+            position = self.__size__ + offset
+        else:
+            raise ValueError('Invalid whence ({whence}, should be 0, 1 or 2)'.format(whence=whence))
+
+        if position < 0:
+            raise ValueError('Negative seek position {position}'.format(position=position))
+
+        self.__position__ = position
+
+        return position
+
+    def readinto(self, buffer) -> int:
+        if self.closed is True:
+            raise ValueError('I/O operation on closed file.')
+
+        buffer = memoryview(buffer).cast('B')
+        count = 0
+
+        # Fill the buffer from as many blocks as needed, stopping at the end of the object
+        while count < len(buffer) and self.__position__ < self.__size__:
+            block_index, block_offset = divmod(self.__position__, self.__block_size__)
+            block = self.__get_block__(block_index)
+
+            length = min(len(buffer) - count, len(block) - block_offset)
+            buffer[count:count + length] = block[block_offset:block_offset + length]
+
+            count += length
+            self.__position__ += length
+
+        return count
+
+    def close(self) -> None:
+        if self.closed is False and self.__executor__ is not None:
+            # Blocks still being read ahead are no longer needed
+            for block in self.__blocks__.values():
+                block.cancel()
+            self.__executor__.shutdown(wait=True)
+
+        self.__blocks__.clear()
+        super().close()
+
+    # Internal methods
+
+    def __get_block__(self, block_index) -> bytes:
+        """
+        Return a block of the object, requesting it and those following it if they are not already cached
+
+        :type block_index: int
+        :param block_index: Index of the block
+
+        :return: bytes
+        """
+        block = self.__request_block__(block_index)
+
+        # Request the following blocks so they are available by the time they are read
+        count_blocks = -(-self.__size__ // self.__block_size__)
+        for read_ahead_index in range(block_index + 1, min(block_index + 1 + self.__read_ahead__, count_blocks)):
+            self.__request_block__(read_ahead_index)
+
+        try:
+            return block.result()
+        except Exception:
+            # Do not cache the failure, so the block is requested again if it is read again
+            self.__blocks__.pop(block_index, None)
+            raise
+
+    def __request_block__(self, block_index):
+        """
+        Return the future of a block, requesting the block if it is not cached and evicting the least recently used block
+        if the cache is full
+
+        :type block_index: int
+        :param block_index: Index of the block
+
+        :return: Future
+        """
+        if block_index in self.__blocks__:
+            self.__blocks__.move_to_end(block_index)
+            return self.__blocks__[block_index]
+
+        if self.__executor__ is not None:
+            # Run the request in a copy of the current context so bound log fields are retained
+            block = self.__executor__.submit(contextvars.copy_context().run, self.__read_block__, block_index)
+        else:
+            block = Future()
+            block.set_result(self.__read_block__(block_index))
+
+        self.__blocks__[block_index] = block
+
+        while len(self.__blocks__) > self.__cache_blocks__:
+            _, evicted_block = self.__blocks__.popitem(last=False)
+            evicted_block.cancel()
+
+        return block
+
+    def __read_block__(self, block_index) -> bytes:
+        """
+        Request a block of the object
+
+        :type block_index: int
+        :param block_index: Index of the block
+
+        :return: bytes
+        """
+        start = block_index * self.__block_size__
+        end = min(start + self.__block_size__, self.__size__) - 1
+
+        arguments = {
+            'Bucket': self.__bucket__,
+            'Key': self.__filename__,
+            'Range': 'bytes={start}-{end}'.format(start=start, end=end)
+        }
+
+        if self.__etag__ is not None:
+            arguments['IfMatch'] = self.__etag__
+
+        return self.__boto3_s3_client__.get_object(**arguments)['Body'].read()
@@ -0,0 +1,96 @@
+import json
+import os
+import time
+
+from botocore.exceptions import ClientError as BotocoreClientError
+
+
+class TransferCheckpoint:
+    """
+    Progress of a transfer saved as JSON, either to a local file or to an object in S3, so an interrupted transfer can be
+    resumed by a later process
+
+    Saves made while a transfer is in progress are throttled to one per save interval, so the cost of saving does not
+    grow with the number of parts or ranges transferred. At most the progress made during one interval is lost if the
+    process is stopped, and is transferred again when the transfer is resumed.
+    """
+    # Minimum number of seconds between saves that are not forced
+    SAVE_INTERVAL = 5.0
+
+    def __init__(self, filename, bucket=None, boto3_s3_client=None):
+        """
+        :type filename: str
+        :param filename: Local filename of the checkpoint, or its path/filename in the bucket if a bucket is specified
+
+        :type bucket: str or None
+        :param bucket: Optional bucket the checkpoint is saved in, if None the checkpoint is saved on the local filesystem
+
+        :type boto3_s3_client: S3.Client or None
+        :param boto3_s3_client: The Boto3 S3 client used to save the checkpoint, required if a bucket is specified
+        """
+        self.filename = filename
+        self.bucket = bucket
+        self.__boto3_s3_client__ = boto3_s3_client
+        self.__saved__ = None
+
+    def load(self):
+        """
+        Load the saved progress, returning None if no progress has been saved
+
+        :return: dict or None
+        """
+        if self.bucket is None:
+            if os.path.exists(self.filename) is False:
+                return None
+            with open(self.filename, 'r') as checkpoint_file:
+                return json.load(checkpoint_file)
+
+        try:
+            checkpoint_object = self.__boto3_s3_client__.get_object(Bucket=self.bucket, Key=self.filename)
+        except BotocoreClientError as load_exception:
+            if load_exception.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+
+        return json.loads(checkpoint_object['Body'].read())
+
+    def save(self, progress, force=False) -> None:
+        """
+        Save the progress of the transfer, replacing any previously saved progress
+
+        :type progress: dict
+        :param progress: The progress to save, which must be serializable as JSON
+
+        :type force: bool
+        :param force: Flag indicating the progress must be saved now. If False, the save is skipped if the progress was
+            saved less than the save interval ago
+
+        :return: None
+        """
+        now = time.monotonic()
+        if force is False and self.__saved__ is not None and now - self.__saved__ < TransferCheckpoint.SAVE_INTERVAL:
+            return
+        self.__saved__ = now
+
+        contents = json.dumps(progress, separators=(',', ':'))
+
+        if self.bucket is not None:
+            self.__boto3_s3_client__.put_object(Bucket=self.bucket, Key=self.filename, Body=contents.encode('utf-8'))
+            return
+
+        # Write to a temporary file first so an interrupted save never leaves a partial checkpoint behind
+        temp_filename = '{filename}.tmp'.format(filename=self.filename)
+        with open(temp_filename, 'w') as checkpoint_file:
+            checkpoint_file.write(contents)
+        os.replace(temp_filename, self.filename)
+
+    def delete(self) -> None:
+        """
+        Delete the saved progress once the transfer has completed
+
+        :return: None
+        """
+        if self.bucket is not None:
+            self.__boto3_s3_client__.delete_object(Bucket=self.bucket, Key=self.filename)
+        elif os.path.exists(self.filename) is True:
+            os.remove(self.filename)
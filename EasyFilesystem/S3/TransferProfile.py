@@ -0,0 +1,54 @@
+from boto3.s3.transfer import TransferConfig
+
+from EasyFilesystem.S3.ClientError import ClientError
+from EasyLog.Log import Log
+
+
+class TransferProfile:
+    """
+    Named multipart settings used for managed S3 uploads, downloads and copies
+
+    DEFAULT uses the boto3 defaults (8 MB threshold/parts, 10 threads). LARGE_FILES suits multi-gigabyte files, using
+    larger parts so fewer requests are made and more parts are transferred at once. SMALL_FILES avoids splitting files
+    under 64 MB into parts. SINGLE_THREADED transfers each file on the calling thread, which suits callers already
+    transferring many files concurrently.
+    """
+    DEFAULT = 'default'
+    LARGE_FILES = 'large-files'
+    SMALL_FILES = 'small-files'
+    SINGLE_THREADED = 'single-threaded'
+
+    MB = 1024 * 1024
+
+    @staticmethod
+    def get_transfer_config(transfer_config, default=None) -> TransferConfig:
+        """
+        Return the transfer configuration for a profile, returning the default configuration if none was specified
+
+        :type transfer_config: TransferConfig or str or None
+        :param transfer_config: A transfer configuration, or the name of one of the TransferProfile class constants
+
+        :type default: TransferConfig or None
+        :param default: The configuration to use if no transfer configuration was specified, DEFAULT if None
+
+        :return: TransferConfig
+        """
+        if transfer_config is None:
+            return default if default is not None else TransferConfig()
+
+        if isinstance(transfer_config, TransferConfig) is True:
+            return transfer_config
+
+        if transfer_config == TransferProfile.DEFAULT:
+            return TransferConfig()
+
+        if transfer_config == TransferProfile.LARGE_FILES:
+            return TransferConfig(multipart_threshold=64 * TransferProfile.MB, multipart_chunksize=64 * TransferProfile.MB, max_concurrency=16)
+
+        if transfer_config == TransferProfile.SMALL_FILES:
+            return TransferConfig(multipart_threshold=64 * TransferProfile.MB, multipart_chunksize=16 * TransferProfile.MB, max_concurrency=4)
+
+        if transfer_config == TransferProfile.SINGLE_THREADED:
+            return TransferConfig(multipart_threshold=64 * TransferProfile.MB, multipart_chunksize=16 * TransferProfile.MB, use_threads=False)
+
+        Log.exception(ClientError.ERROR_TRANSFER_PROFILE_UNKNOWN)
@@ -5,6 +5,8 @@ import socket
 import uuid
 import warnings
 
+from EasyFilesystem.BatchResult import BatchResult
+from EasyFilesystem.VerificationPolicy import VerificationPolicy
 from EasyLocalDisk.Client import Client as LocalDiskClient
 from EasyLog.Log import Log
 from EasyFilesystem.Sftp.ClientError import ClientError
@@ -15,10 +17,15 @@ from pysftp import Connection
 
 # noinspection DuplicatedCode
 class Client:
-    def __init__(self):
+    def __init__(self, verification_policy=VerificationPolicy.STRICT):
         """
         Setup SFTP client
+
+        :type verification_policy: str
+        :param verification_policy: Default verification policy for file operations, one of the VerificationPolicy class
+            constants. STRICT checks the source and destination exist before and after each operation
         """
+        self.__verification_policy__ = VerificationPolicy.sanitize(verification_policy)
         self.__sftp_connection__ = None
         self.__fingerprint_validation__ = True
 
@@ -81,7 +88,7 @@ class Client:
         # Concatenate them together
         return '{path}{filename}'.format(path=path, filename=filename)
 
-    def create_path(self, path, allow_overwrite=False) -> None:
+    def create_path(self, path, allow_overwrite=False, verification_policy=None) -> None:
         """
         Create path in remote sftp_filesystem
 
@@ -91,8 +98,14 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the path is allowed to be overwritten if it exists. If False, and the path exists an exception will be thrown
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+
         # Sanitize the supplied path
         path = Client.sanitize_path(path)
 
@@ -108,8 +121,9 @@ class Client:
             Log.exception(ClientError.ERROR_CREATE_PATH_UNHANDLED_EXCEPTION, create_path_exception)
 
         # Make sure the path exists
-        if self.file_exists(filename=path) is False:
-            Log.exception(ClientError.ERROR_CREATE_PATH_FAILED)
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.file_exists(filename=path) is False:
+                Log.exception(ClientError.ERROR_CREATE_PATH_FAILED)
 
     def create_temp_path(self, prefix='', temp_path=None) -> str:
         """
@@ -151,6 +165,7 @@ class Client:
                 # If we fail to create a path more than 10 times, something is wrong
                 Log.exception(ClientError.ERROR_CREATE_TEMP_PATH_FAILED)
 
+    @Log.span('sftp.file_list')
     def file_list(self, path, recursive=False):
         """
         List a list of all files accessible in the sftp_filesystem sftp_filesystem
@@ -184,6 +199,7 @@ class Client:
 
         return files
 
+    @Log.span('sftp.path_exists')
     def path_exists(self, path) -> bool:
         """
         Check if path exists
@@ -201,6 +217,7 @@ class Client:
         except Exception as exists_exception:
             Log.exception(ClientError.ERROR_PATH_EXISTS_UNHANDLED_EXCEPTION, exists_exception)
 
+    @Log.span('sftp.file_exists')
     def file_exists(self, filename) -> bool:
         """
         Check if file exists
@@ -218,7 +235,8 @@ class Client:
         except Exception as exists_exception:
             Log.exception(ClientError.ERROR_FILE_EXISTS_UNHANDLED_EXCEPTION, exists_exception)
 
-    def path_delete(self, path, allow_missing=False) -> None:
+    @Log.span('sftp.path_delete')
+    def path_delete(self, path, allow_missing=False, verification_policy=None) -> None:
         """
         Delete a path from S3 bucket
 
@@ -228,18 +246,26 @@ class Client:
         :type allow_missing: bool
         :param allow_missing: Boolean flag, if False and the file cannot be found to delete an exception will be raised
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+
         # Sanitize the path
         path = self.sanitize_path(path)
 
-        # Make sure the file exists before we try to delete it
-        if self.path_exists(path=path) is False:
-            # If this is fine, get out of here- the file is already gone
-            if allow_missing is True:
-                return
+        # Make sure the file exists before we try to delete it. When trusting the server a missing path is only checked
+        # for if it is allowed, otherwise the error returned by the server is relied on
+        if allow_missing is True or VerificationPolicy.is_pre_check_required(verification_policy) is True:
+            if self.path_exists(path=path) is False:
+                # If this is fine, get out of here- the file is already gone
+                if allow_missing is True:
+                    return
 
-            Log.exception(ClientError.ERROR_PATH_DELETE_NOT_FOUND)
+                Log.exception(ClientError.ERROR_PATH_DELETE_NOT_FOUND)
 
         # Delete the path
         try:
@@ -248,10 +274,12 @@ class Client:
             Log.exception(ClientError.ERROR_PATH_DELETE_UNHANDLED_EXCEPTION, delete_exception)
 
         # Make sure the file no longer exists after deleting
-        if self.path_exists(path=path) is True:
-            Log.exception(ClientError.ERROR_PATH_DELETE_FAILED)
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.path_exists(path=path) is True:
+                Log.exception(ClientError.ERROR_PATH_DELETE_FAILED)
 
-    def file_delete(self, filename, allow_missing=False) -> None:
+    @Log.span('sftp.file_delete')
+    def file_delete(self, filename, allow_missing=False, verification_policy=None) -> None:
         """
         Delete a file from SFTP server
 
@@ -261,17 +289,25 @@ class Client:
         :type allow_missing: bool
         :param allow_missing: Boolean flag, if False and the file cannot be found to delete an exception will be raised
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+
         # Sanitize the filename
         filename = Client.sanitize_filename(filename)
 
-        # Make sure the file exists before we try to delete it
-        if self.file_exists(filename) is False:
-            # If this is fine, get out of here- the file is already gone
-            if allow_missing is True:
-                return
-            Log.exception(ClientError.ERROR_FILE_DELETE_NOT_FOUND)
+        # Make sure the file exists before we try to delete it. When trusting the server a missing file is only checked
+        # for if it is allowed, otherwise the error returned by the server is relied on
+        if allow_missing is True or VerificationPolicy.is_pre_check_required(verification_policy) is True:
+            if self.file_exists(filename) is False:
+                # If this is fine, get out of here- the file is already gone
+                if allow_missing is True:
+                    return
+                Log.exception(ClientError.ERROR_FILE_DELETE_NOT_FOUND)
 
         # Delete the file
         try:
@@ -280,10 +316,12 @@ class Client:
             Log.exception(ClientError.ERROR_FILE_DELETE_UNHANDLED_EXCEPTION, delete_exception)
 
         # Make sure the file no longer exists after deleting
-        if self.file_exists(filename) is True:
-            Log.exception(ClientError.ERROR_FILE_DELETE_FAILED)
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.file_exists(filename) is True:
+                Log.exception(ClientError.ERROR_FILE_DELETE_FAILED)
 
-    def file_move(self, source_filename, destination_filename, allow_overwrite=True) -> None:
+    @Log.span('sftp.file_move')
+    def file_move(self, source_filename, destination_filename, allow_overwrite=True, verification_policy=None) -> None:
         """
         Move a file from one location in the sftp_filesystem to another
 
@@ -296,8 +334,14 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+
         # Sanitize the filenames
         source_filename = Client.sanitize_filename(source_filename)
         destination_filename = Client.sanitize_filename(destination_filename)
@@ -312,8 +356,9 @@ class Client:
                 Log.exception(ClientError.ERROR_FILE_MOVE_ALREADY_EXISTS)
 
         # Make sure the source file exists
-        if self.file_exists(source_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_MOVE_SOURCE_NOT_FOUND)
+        if VerificationPolicy.is_pre_check_required(verification_policy) is True:
+            if self.file_exists(source_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_MOVE_SOURCE_NOT_FOUND)
 
         # Move the file
         try:
@@ -321,15 +366,17 @@ class Client:
         except Exception as move_exception:
             Log.exception(ClientError.ERROR_FILE_MOVE_UNHANDLED_EXCEPTION, move_exception)
 
-        # Make sure the file exists at its destination
-        if self.file_exists(destination_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_MOVE_COPY_FAILED)
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            # Make sure the file exists at its destination
+            if self.file_exists(destination_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_MOVE_COPY_FAILED)
 
-        # Make sure the source file no longer exists
-        if self.file_exists(source_filename) is True:
-            Log.exception(ClientError.ERROR_FILE_MOVE_DELETE_FAILED)
+            # Make sure the source file no longer exists
+            if self.file_exists(source_filename) is True:
+                Log.exception(ClientError.ERROR_FILE_MOVE_DELETE_FAILED)
 
-    def file_copy(self, source_filename, destination_filename, allow_overwrite=True) -> None:
+    @Log.span('sftp.file_copy')
+    def file_copy(self, source_filename, destination_filename, allow_overwrite=True, verification_policy=None) -> None:
         """
         Copy a file from one location in the sftp_filesystem to another
 
@@ -343,8 +390,14 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+
         # Sanitize the filenames
         source_filename = Client.sanitize_filename(source_filename)
         destination_filename = Client.sanitize_filename(destination_filename)
@@ -359,8 +412,15 @@ class Client:
                 Log.exception(ClientError.ERROR_FILE_COPY_ALREADY_EXISTS)
 
         # Make sure the source file exists
-        if self.file_exists(source_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_COPY_SOURCE_NOT_FOUND)
+        if VerificationPolicy.is_pre_check_required(verification_policy) is True:
+            if self.file_exists(source_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_COPY_SOURCE_NOT_FOUND)
+
+        # Unless verifying strictly, the download and upload do not need to repeat the checks already made by the copy
+        if VerificationPolicy.is_post_check_required(verification_policy) is False:
+            step_verification_policy = VerificationPolicy.TRUST
+        else:
+            step_verification_policy = VerificationPolicy.STRICT
 
         # To copy a file we need to download/upload it, storing it in a temporary file. Create a unique location to store it.
         temp_folder = LocalDiskClient.create_temp_path()
@@ -368,8 +428,8 @@ class Client:
 
         try:
             # Download/upload the file
-            self.file_download(local_filename=temp_filename, remote_filename=source_filename)
-            self.file_upload(local_filename=temp_filename, remote_filename=destination_filename)
+            self.file_download(local_filename=temp_filename, remote_filename=source_filename, verification_policy=step_verification_policy)
+            self.file_upload(local_filename=temp_filename, remote_filename=destination_filename, verification_policy=step_verification_policy)
             # Delete the temporary file
             LocalDiskClient.file_delete(temp_folder)
         except Exception as copy_exception:
@@ -384,10 +444,12 @@ class Client:
             Log.exception(ClientError.ERROR_FILE_COPY_UNHANDLED_EXCEPTION, copy_exception)
 
         # Make sure the file exists at the destination
-        if self.file_exists(source_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_COPY_FAILED)
+        if VerificationPolicy.is_post_check_required(verification_policy) is True:
+            if self.file_exists(destination_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_COPY_FAILED)
 
-    def file_download(self, local_filename, remote_filename, allow_overwrite=True) -> None:
+    @Log.span('sftp.file_download')
+    def file_download(self, local_filename, remote_filename, allow_overwrite=True, verification_policy=None) -> None:
         """
         Download a file
 
@@ -400,8 +462,14 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be raised
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+
         # Sanitize the filenames
         remote_filename = Client.sanitize_filename(remote_filename)
 
@@ -411,8 +479,9 @@ class Client:
                 Log.exception(ClientError.ERROR_FILE_DOWNLOAD_ALREADY_EXISTS)
 
         # Make sure the file exists at the source
-        if self.file_exists(remote_filename) is False:
-            Log.exception(ClientError.ERROR_FILE_DOWNLOAD_SOURCE_NOT_FOUND)
+        if VerificationPolicy.is_pre_check_required(verification_policy) is True:
+            if self.file_exists(remote_filename) is False:
+                Log.exception(ClientError.ERROR_FILE_DOWNLOAD_SOURCE_NOT_FOUND)
 
         # Download the file
         try:
@@ -427,7 +496,8 @@ class Client:
         if os.path.exists(local_filename) is False:
             Log.exception(ClientError.ERROR_FILE_DOWNLOAD_FAILED)
 
-    def file_download_recursive(self, remote_path, local_path, callback=None, allow_overwrite=True) -> None:
+    @Log.span('sftp.file_download_recursive')
+    def file_download_recursive(self, remote_path, local_path, callback=None, allow_overwrite=True) -> BatchResult:
         """
         Recursively download all files found in the specified remote path to the specified local path
 
@@ -443,16 +513,18 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
-        :return: None
+        :return: BatchResult
         """
         # Sanitize the paths
         local_path = LocalDiskClient.sanitize_path(local_path)
         remote_path = Client.sanitize_path(remote_path)
 
+        result = BatchResult()
+
         # List files in current path
         files_found = self.file_list(path=remote_path, recursive=True)
 
-        Log.test('Found {count} File(s)'.format(count=len(files_found)))
+        Log.test('Found {count} File(s)', count=len(files_found))
         # Iterate these files
         for current_remote_filename in files_found:
             # The local filename will stored in the same folder structure as on the SFTP server
@@ -465,15 +537,21 @@ class Client:
             # Download the current file
             self.file_download(local_filename=current_local_filename, remote_filename=current_remote_filename, allow_overwrite=allow_overwrite)
 
+            result.add_success(current_remote_filename)
+
             # If a callback_staked was supplied execute it
             if callback is not None:
                 if callable(callback) is False:
                     Log.exception(ClientError.ERROR_FILE_DOWNLOAD_CALLBACK_NOT_CALLABLE)
                 # If the callback_staked returns false, stop iterating
                 if callback(local_filename=current_local_filename, remote_filename=current_remote_filename) is False:
+                    result.stopped = True
                     break
 
-    def file_upload(self, local_filename, remote_filename, allow_overwrite=True) -> None:
+        return result
+
+    @Log.span('sftp.file_upload')
+    def file_upload(self, local_filename, remote_filename, allow_overwrite=True, verification_policy=None) -> None:
         """
         Upload a file to remote sftp_filesystem
 
@@ -486,8 +564,14 @@ class Client:
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be raised
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the clients policy for this call, one of the
+            VerificationPolicy class constants
+
         :return: None
         """
+        verification_policy = VerificationPolicy.sanitize(verification_policy, self.__verification_policy__)
+
         # Sanitize the filenames
         local_filename = LocalDiskClient.sanitize_filename(local_filename)
         remote_filename = Client.sanitize_filename(remote_filename)
@@ -605,12 +689,12 @@ class Client:
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
 
-            Log.debug('SFTP Server: {username}@{address}:{port}'.format(address=address, port=port, username=username))
-            Log.debug('RSA Key Length: {key_length} Bytes'.format(key_length=len(rsa_private_key)))
+            Log.debug('SFTP Server: {username}@{address}:{port}', address=address, port=port, username=username)
+            Log.debug('RSA Key Length: {key_length} Bytes', key_length=len(rsa_private_key))
 
             if fingerprint is not None:
-                Log.debug('Host Fingerprint: {fingerprint}'.format(fingerprint=fingerprint))
-                Log.debug('Host Fingerprint Type: {fingerprint_type}'.format(fingerprint_type=fingerprint_type))
+                Log.debug('Host Fingerprint: {fingerprint}', fingerprint=fingerprint)
+                Log.debug('Host Fingerprint Type: {fingerprint_type}', fingerprint_type=fingerprint_type)
 
             try:
                 address = Client.__sanitize_sftp_address__(address)
@@ -676,8 +760,8 @@ class Client:
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
 
-            Log.debug('SFTP Server: {username}@{address}:{port}'.format(address=address, port=port, username=username))
-            Log.debug('Host Fingerprint: {fingerprint} ({fingerprint_type})'.format(fingerprint=fingerprint, fingerprint_type=fingerprint_type))
+            Log.debug('SFTP Server: {username}@{address}:{port}', address=address, port=port, username=username)
+            Log.debug('Host Fingerprint: {fingerprint} ({fingerprint_type})', fingerprint=fingerprint, fingerprint_type=fingerprint_type)
 
             address = Client.__sanitize_sftp_address__(address)
             port = Client.__sanitize_sftp_port__(port)
@@ -1,5 +1,7 @@
 from EasyFilesystem.BaseFilesystem import BaseFilesystem
+from EasyFilesystem.BatchResult import BatchResult
 from EasyFilesystem.Sftp.Client import Client
+from EasyFilesystem.VerificationPolicy import VerificationPolicy
 from EasyLog.Log import Log
 
 
@@ -14,7 +16,8 @@ class Filesystem(BaseFilesystem):
             fingerprint_type=None,
             validate_fingerprint=True,
             port=22,
-            base_path=''
+            base_path='',
+            verification_policy=VerificationPolicy.STRICT
     ):
         """
         Setup SFTP server
@@ -45,6 +48,10 @@ class Filesystem(BaseFilesystem):
 
         :type base_path: str
         :param base_path: Base SFTP file path, all uploads/downloads will have this path prepended
+
+        :type verification_policy: str
+        :param verification_policy: Default verification policy for file operations, one of the VerificationPolicy class
+            constants
         """
         super().__init__()
 
@@ -52,7 +59,7 @@ class Filesystem(BaseFilesystem):
         self.__base_path__ = Client.sanitize_path(base_path)
 
         # Grab SFTP client
-        self.__client__ = Client()
+        self.__client__ = Client(verification_policy=verification_policy)
 
         # If requested, disable fingerprint checking
         if validate_fingerprint is False:
@@ -80,7 +87,7 @@ class Filesystem(BaseFilesystem):
                 allow_missing=True
             )
 
-    def create_path(self, path, allow_overwrite=False) -> None:
+    def create_path(self, path, allow_overwrite=False, verification_policy=None) -> None:
         """
         Create path in remote sftp_filesystem
 
@@ -89,8 +96,16 @@ class Filesystem(BaseFilesystem):
 
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the path is allowed to be overwritten if it exists. If False, and the path exists an exception will be thrown
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
         """
-        self.__client__.create_path(path=self.__rebase_path__(path), allow_overwrite=allow_overwrite)
+        self.__client__.create_path(
+            path=self.__rebase_path__(path),
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy
+        )
 
     def create_temp_path(self, prefix='', temp_path=None) -> str:
         """
@@ -148,7 +163,7 @@ class Filesystem(BaseFilesystem):
         filename = self.__rebase_path__(filename)
         return self.__client__.file_exists(filename=filename)
 
-    def path_delete(self, path, allow_missing=False) -> None:
+    def path_delete(self, path, allow_missing=False, verification_policy=None) -> None:
         """
         Delete a path
 
@@ -157,10 +172,18 @@ class Filesystem(BaseFilesystem):
 
         :type allow_missing: bool
         :param allow_missing: Boolean flag, if False and the file cannot be found to delete an exception will be raised
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
         """
-        self.__client__.path_delete(path=self.__rebase_path__(path), allow_missing=allow_missing)
+        self.__client__.path_delete(
+            path=self.__rebase_path__(path),
+            allow_missing=allow_missing,
+            verification_policy=verification_policy
+        )
 
-    def file_delete(self, filename, allow_missing=False) -> None:
+    def file_delete(self, filename, allow_missing=False, verification_policy=None) -> None:
         """
         Delete a file
 
@@ -169,10 +192,18 @@ class Filesystem(BaseFilesystem):
 
         :type allow_missing: bool
         :param allow_missing: Boolean flag, if False and the file cannot be found to delete an exception will be raised
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
         """
-        self.__client__.file_delete(filename=self.__rebase_path__(filename), allow_missing=allow_missing)
+        self.__client__.file_delete(
+            filename=self.__rebase_path__(filename),
+            allow_missing=allow_missing,
+            verification_policy=verification_policy
+        )
 
-    def file_move(self, source_filename, destination_filename, allow_overwrite=True) -> None:
+    def file_move(self, source_filename, destination_filename, allow_overwrite=True, verification_policy=None) -> None:
         """
         Move a file to the specified destination
 
@@ -184,14 +215,19 @@ class Filesystem(BaseFilesystem):
 
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
         """
         self.__client__.file_move(
             source_filename=self.__rebase_path__(source_filename),
             destination_filename=self.__rebase_path__(destination_filename),
-            allow_overwrite=allow_overwrite
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy
         )
 
-    def file_copy(self, source_filename, destination_filename, allow_overwrite=True) -> None:
+    def file_copy(self, source_filename, destination_filename, allow_overwrite=True, verification_policy=None) -> None:
         """
         Copy file to the specified destination
 
@@ -203,14 +239,19 @@ class Filesystem(BaseFilesystem):
 
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
+
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
         """
         self.__client__.file_copy(
             source_filename=self.__rebase_path__(source_filename),
             destination_filename=self.__rebase_path__(destination_filename),
-            allow_overwrite=allow_overwrite
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy
         )
 
-    def file_download(self, local_filename, remote_filename, allow_overwrite=True) -> None:
+    def file_download(self, local_filename, remote_filename, allow_overwrite=True, verification_policy=None) -> None:
         """
         Download a file from SFTP server
 
@@ -223,15 +264,20 @@ class Filesystem(BaseFilesystem):
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
+
         :return: None
         """
         return self.__client__.file_download(
             local_filename=local_filename,
             remote_filename=self.__rebase_path__(remote_filename),
-            allow_overwrite=allow_overwrite
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy
         )
 
-    def file_download_recursive(self, remote_path, local_path, callback=None, allow_overwrite=True) -> None:
+    def file_download_recursive(self, remote_path, local_path, callback=None, allow_overwrite=True, snapshot=True) -> BatchResult:
         """
         Recursively download all files found in the specified remote path to the specified local path
 
@@ -247,18 +293,21 @@ class Filesystem(BaseFilesystem):
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be thrown
 
-        :return: None
+        :type snapshot: bool
+        :param snapshot: Has no effect, the full listing is always read before the first file is downloaded
+
+        :return: BatchResult
         """
         Log.test('Recursive Download Starting...')
 
-        self.__client__.file_download_recursive(
+        return self.__client__.file_download_recursive(
             remote_path=self.__rebase_path__(remote_path),
             local_path=local_path,
             callback=callback,
             allow_overwrite=allow_overwrite
         )
 
-    def file_upload(self, remote_filename, local_filename, allow_overwrite=True) -> None:
+    def file_upload(self, remote_filename, local_filename, allow_overwrite=True, verification_policy=None) -> None:
         """
         Upload a file to remote sftp_filesystem
 
@@ -271,12 +320,17 @@ class Filesystem(BaseFilesystem):
         :type allow_overwrite: bool
         :param allow_overwrite: Flag indicating the file is allowed to be overwritten if it exists. If False, and the file exists an exception will be raised
 
+        :type verification_policy: str or None
+        :param verification_policy: Optional verification policy overriding the filesystems policy for this call, one of
+            the VerificationPolicy class constants
+
         :return: None
         """
         return self.__client__.file_upload(
             local_filename=local_filename,
             remote_filename=self.__rebase_path__(remote_filename),
-            allow_overwrite=allow_overwrite
+            allow_overwrite=allow_overwrite,
+            verification_policy=verification_policy
         )
 
     # Internal helper methods
@@ -0,0 +1,60 @@
+from EasyFilesystem.BaseFilesystemError import BaseFilesystemError
+from EasyLog.Log import Log
+
+
+class VerificationPolicy:
+    """
+    Policies controlling which remote existence checks are made around file operations
+
+    STRICT checks before and after every operation, PRE_ONLY checks before an operation but relies on the operation
+    raising an error if it fails, and TRUST makes no checks other than those required to honour allow_overwrite=False
+    and allow_missing=False. Checks of the local filesystem are always made as they do not require a request.
+    """
+    STRICT = 'strict'
+    TRUST = 'trust'
+    PRE_ONLY = 'pre-only'
+
+    @staticmethod
+    def sanitize(verification_policy, default=None) -> str:
+        """
+        Validate a verification policy, returning the default policy if none was specified
+
+        :type verification_policy: str or None
+        :param verification_policy: The verification policy
+
+        :type default: str or None
+        :param default: The policy to use if no verification policy was specified, STRICT if None
+
+        :return: str
+        """
+        if verification_policy is None:
+            verification_policy = default if default is not None else VerificationPolicy.STRICT
+
+        if verification_policy not in (VerificationPolicy.STRICT, VerificationPolicy.TRUST, VerificationPolicy.PRE_ONLY):
+            Log.exception(BaseFilesystemError.ERROR_VERIFICATION_POLICY_UNKNOWN)
+
+        return verification_policy
+
+    @staticmethod
+    def is_pre_check_required(verification_policy) -> bool:
+        """
+        Flag indicating the remote source/destination should be checked before an operation
+
+        :type verification_policy: str
+        :param verification_policy: The verification policy
+
+        :return: bool
+        """
+        return verification_policy != VerificationPolicy.TRUST
+
+    @staticmethod
+    def is_post_check_required(verification_policy) -> bool:
+        """
+        Flag indicating the result of an operation should be checked after it completes
+
+        :type verification_policy: str
+        :param verification_policy: The verification policy
+
+        :return: bool
+        """
+        return verification_policy == VerificationPolicy.STRICT
@@ -0,0 +1,146 @@
+import queue
+import sys
+import threading
+
+
+class AsyncWriter:
+    """
+    Write log entries to stdout from a dedicated background thread
+
+    Entries are placed on a bounded queue by the logging thread and are formatted and written in batches by the
+    writer thread, so slow output streams do not stall the code doing the logging.
+    """
+    # Queue full policies
+    POLICY_BLOCK = 'block'
+    POLICY_DROP = 'drop'
+
+    # Marker placed on the queue to stop the writer thread
+    __STOP__ = object()
+
+    def __init__(self, formatter, queue_size=10000, batch_size=500, full_policy=POLICY_BLOCK):
+        """
+        Start the writer thread
+
+        :type formatter: Callable
+        :param formatter: Function accepting a LogEntry and returning the string to be written
+
+        :type queue_size: int
+        :param queue_size: Maximum number of entries waiting to be written
+
+        :type batch_size: int
+        :param batch_size: Maximum number of entries written to the stream at once
+
+        :type full_policy: str
+        :param full_policy: Action taken when the queue is full. POLICY_BLOCK waits for space to become available,
+            POLICY_DROP discards the entry
+        """
+        if full_policy not in (AsyncWriter.POLICY_BLOCK, AsyncWriter.POLICY_DROP):
+            raise Exception('Unknown queue full policy specified')
+
+        if int(queue_size) < 1 or int(batch_size) < 1:
+            raise Exception('Invalid queue or batch size specified')
+
+        self.__formatter__ = formatter
+        self.__queue__ = queue.Queue(maxsize=int(queue_size))
+        self.__batch_size__ = int(batch_size)
+        self.__full_policy__ = full_policy
+        self.__dropped_count__ = 0
+        self.__dropped_lock__ = threading.Lock()
+
+        self.__thread__ = threading.Thread(target=self.__run__, name='EasyLogAsyncWriter', daemon=True)
+        self.__thread__.start()
+
+    def write(self, entry) -> bool:
+        """
+        Queue an entry to be written
+
+        :type entry: LogEntry
+        :param entry: The entry to write
+
+        :return: bool False if the entry was dropped
+        """
+        if self.__full_policy__ == AsyncWriter.POLICY_BLOCK:
+            self.__queue__.put(entry)
+            return True
+
+        try:
+            self.__queue__.put_nowait(entry)
+        except queue.Full:
+            with self.__dropped_lock__:
+                self.__dropped_count__ += 1
+            return False
+
+        return True
+
+    def flush(self) -> None:
+        """
+        Wait until all queued entries have been written
+
+        :return: None
+        """
+        if self.__thread__.is_alive() is True:
+            self.__queue__.join()
+
+    def stop(self) -> None:
+        """
+        Write all queued entries and stop the writer thread
+
+        :return: None
+        """
+        if self.__thread__.is_alive() is True:
+            self.__queue__.put(AsyncWriter.__STOP__)
+            self.__thread__.join()
+
+    def get_dropped_count(self) -> int:
+        """
+        Return the number of entries discarded because the queue was full
+
+        :return: int
+        """
+        return self.__dropped_count__
+
+    # Internal methods
+
+    def __run__(self) -> None:
+        """
+        Writer thread main loop
+
+        :return: None
+        """
+        while True:
+            # Wait for an entry, then grab whatever else is waiting up to the batch size
+            batch = [self.__queue__.get()]
+            while len(batch) < self.__batch_size__:
+                try:
+                    batch.append(self.__queue__.get_nowait())
+                except queue.Empty:
+                    break
+
+            is_stopping = False
+            lines = []
+            for entry in batch:
+                if entry is AsyncWriter.__STOP__:
+                    is_stopping = True
+                    continue
+                # noinspection PyBroadException
+                try:
+                    lines.append(self.__formatter__(entry))
+                except Exception:
+                    # A single bad entry must not take down the writer
+                    pass
+
+            # noinspection PyBroadException
+            try:
+                if len(lines) > 0:
+                    lines.append('')
+                    sys.stdout.write('\n'.join(lines))
+                    sys.stdout.flush()
+            except Exception:
+                # There is nowhere left to report a failure to write the log
+                pass
+
+            for _ in batch:
+                self.__queue__.task_done()
+
+            if is_stopping is True:
+                return
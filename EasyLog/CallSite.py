@@ -0,0 +1,49 @@
+class CallSite:
+    """
+    Lightweight description of the location a log message was raised from
+
+    Only the callers code object and line number are stored, the filename and function name are resolved from the
+    code object when they are first requested. Unlike inspect.stack() no source files are read from disk.
+    """
+    __slots__ = ('code', 'lineno')
+
+    def __init__(self, code, lineno):
+        """
+        :type code: code
+        :param code: The code object of the calling frame
+
+        :type lineno: int
+        :param lineno: The line number being executed in the calling frame
+        """
+        self.code = code
+        self.lineno = lineno
+
+    @staticmethod
+    def from_frame(frame):
+        """
+        Create a call site from a frame object
+
+        :type frame: frame
+        :param frame: The frame to describe
+
+        :return: CallSite
+        """
+        return CallSite(code=frame.f_code, lineno=frame.f_lineno)
+
+    @property
+    def filename(self) -> str:
+        """
+        Full path of the calling source file
+
+        :return: str
+        """
+        return self.code.co_filename
+
+    @property
+    def function(self) -> str:
+        """
+        Name of the calling function
+
+        :return: str
+        """
+        return self.code.co_name
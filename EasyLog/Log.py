@@ -1,6 +1,20 @@
+import atexit
+import contextlib
+import contextvars
 import inspect
+import logging
 import os
-
+import sys
+import threading
+import time
+
+from collections import deque
+from EasyLog.AsyncWriter import AsyncWriter
+from EasyLog.CallSite import CallSite
+from EasyLog.LogEntry import LogEntry
+from EasyLog.RateLimiter import RateLimiter
+from EasyLog.Span import Span
+from EasyLog.SpanStatistics import SpanStatistics
 from time import strftime
 
 
@@ -15,21 +29,126 @@ class Log:
     LEVEL_DEBUG = 3
     LEVEL_TRACE = 4
 
+    # Call site capture modes
+    CAPTURE_FRAME = 'frame'
+    CAPTURE_STACK = 'stack'
+    CAPTURE_NONE = 'none'
+
+    # Log history modes
+    HISTORY_DISABLED = 'disabled'
+    HISTORY_RING = 'ring'
+    HISTORY_FULL = 'full'
+
+    # Default number of entries retained by the ring buffer log history
+    HISTORY_RING_CAPACITY = 1000
+
+    # Environment variables used to configure logging
+    ENVIRONMENT_LEVEL = 'EASY_LOG_LEVEL'
+    ENVIRONMENT_HISTORY = 'EASY_LOG_HISTORY'
+    ENVIRONMENT_HISTORY_CAPACITY = 'EASY_LOG_HISTORY_CAPACITY'
+
+    # Async writer queue full policies
+    QUEUE_FULL_BLOCK = AsyncWriter.POLICY_BLOCK
+    QUEUE_FULL_DROP = AsyncWriter.POLICY_DROP
+
+    # Output destinations
+    OUTPUT_STDOUT = 'stdout'
+    OUTPUT_LOGGING = 'logging'
+
+    # Standard library logging levels used for levels that have no direct equivalent
+    LOGGING_LEVEL_TEST = 25
+    LOGGING_LEVEL_TRACE = 5
+
+    # Output formats
+    FORMAT_TEXT = 'text'
+    FORMAT_JSON = 'json'
+
     # Private class variables
-    __history__ = []
+    __logger__ = None
+    __rate_limiter__ = None
+    __span_statistics__ = SpanStatistics()
+    __format__ = FORMAT_TEXT
+    __buffer__ = []
+    __buffer_size__ = 1
+    __buffer_lock__ = threading.Lock()
+    __writer__ = None
+    __is_flush_registered__ = False
+    __history__ = None
+    __history_mode__ = None
     __level__ = None
+    __capture_mode__ = CAPTURE_FRAME
 
     __function_name__ = None
+    __context__ = contextvars.ContextVar('easy_log_context', default=None)
 
     @staticmethod
     def set_function_name(function_name) -> None:
         """
-        Set function name for prefixing in log
+        Set function name for prefixing in log. This applies to all threads, use Log.bind(function_name=...) to set
+        the function name for the current thread or task only
 
         :return: None
         """
         Log.__function_name__ = function_name
 
+    @staticmethod
+    @contextlib.contextmanager
+    def bind(**fields):
+        """
+        Context manager binding fields to every message logged by the current thread or asyncio task until it exits.
+        Bound fields are included in structured output, and a bound function_name replaces the function name set
+        with Log.set_function_name(). Typical fields are function_name, correlation_id, file_key and worker_id
+
+        :param fields: The fields to bind
+
+        :return: None
+        """
+        token = Log.set_context(**fields)
+
+        try:
+            yield
+        finally:
+            Log.reset_context(token)
+
+    @staticmethod
+    def set_context(**fields) -> contextvars.Token:
+        """
+        Bind fields to every message logged by the current thread or asyncio task, in addition to any already bound
+
+        :param fields: The fields to bind
+
+        :return: Token that can be passed to Log.reset_context() to restore the previous fields
+        """
+        context = Log.__context__.get()
+
+        if context is not None:
+            fields = dict(context, **fields)
+
+        return Log.__context__.set(fields)
+
+    @staticmethod
+    def reset_context(token) -> None:
+        """
+        Restore the fields that were bound before Log.set_context() was called
+
+        :type token: contextvars.Token
+        :param token: The token returned by Log.set_context()
+
+        :return: None
+        """
+        Log.__context__.reset(token)
+
+    @staticmethod
+    def get_context() -> dict:
+        """
+        Return the fields bound to the current thread or asyncio task
+
+        :return: dict
+        """
+        context = Log.__context__.get()
+
+        return dict(context) if context is not None else {}
+
     @staticmethod
     def set_level(level) -> None:
         """
@@ -46,117 +165,530 @@ class Log:
         Log.__level__ = level
 
     @staticmethod
-    def info(message) -> None:
+    def reset_level() -> None:
+        """
+        Clear the logging display level so it is selected again based on the current context when next required
+
+        :return: None
+        """
+        Log.__level__ = None
+
+    @staticmethod
+    def set_capture_mode(capture_mode) -> None:
+        """
+        Set the method used to determine where each log message was raised from
+
+        :type capture_mode: str
+        :param capture_mode: Capture mode, one of the CAPTURE class constants. CAPTURE_FRAME (the default) reads the
+            callers filename, function and line number directly from its frame, CAPTURE_STACK uses inspect.stack()
+            and CAPTURE_NONE disables call site details altogether
+
+        :return: None
+        """
+        if capture_mode not in (Log.CAPTURE_FRAME, Log.CAPTURE_STACK, Log.CAPTURE_NONE):
+            raise Exception('Unknown capture mode specified')
+
+        Log.__capture_mode__ = capture_mode
+
+    @staticmethod
+    def set_history_mode(history_mode, capacity=None) -> None:
+        """
+        Set how log messages are retained in the log history. If not set, the mode is read from the EASY_LOG_HISTORY
+        environment variable (with the ring buffer capacity in EASY_LOG_HISTORY_CAPACITY), defaulting to full retention
+
+        :type history_mode: str
+        :param history_mode: History mode, one of the HISTORY class constants. HISTORY_FULL retains every message,
+            HISTORY_RING retains only the most recent messages and HISTORY_DISABLED retains nothing
+
+        :type capacity: int or None
+        :param capacity: Maximum number of messages retained in HISTORY_RING mode
+
+        :return: None
+        """
+        if history_mode not in (Log.HISTORY_DISABLED, Log.HISTORY_RING, Log.HISTORY_FULL):
+            raise Exception('Unknown history mode specified')
+
+        # Carry any existing messages over to the new history
+        existing_history = Log.__history__ if Log.__history__ is not None else ()
+
+        if history_mode == Log.HISTORY_RING:
+            if capacity is None:
+                capacity = Log.HISTORY_RING_CAPACITY
+            if int(capacity) < 1:
+                raise Exception('Invalid history capacity specified')
+            Log.__history__ = deque(existing_history, maxlen=int(capacity))
+        elif history_mode == Log.HISTORY_FULL:
+            Log.__history__ = deque(existing_history)
+        else:
+            Log.__history__ = None
+
+        Log.__history_mode__ = history_mode
+
+    @staticmethod
+    def enable_history(capacity=None) -> None:
+        """
+        Record log messages in the log history, regardless of the current log level
+
+        :type capacity: int or None
+        :param capacity: If set, only this number of the most recent messages will be retained
+
+        :return: None
+        """
+        if capacity is None:
+            Log.set_history_mode(Log.HISTORY_FULL)
+        else:
+            Log.set_history_mode(Log.HISTORY_RING, capacity=capacity)
+
+    @staticmethod
+    def disable_history() -> None:
+        """
+        Stop recording log messages in the log history. Messages below the current log level will be discarded
+        without any further processing
+
+        :return: None
+        """
+        Log.set_history_mode(Log.HISTORY_DISABLED)
+
+    @staticmethod
+    def set_output(output, logger='EasyLog') -> None:
+        """
+        Set where displayed messages are sent
+
+        :type output: str
+        :param output: Output destination, one of the OUTPUT class constants. OUTPUT_STDOUT (the default) writes
+            formatted messages to stdout, OUTPUT_LOGGING passes unformatted records to a standard library logger so
+            its handlers (e.g. a QueueHandler) perform the formatting
+
+        :type logger: str or logging.Logger
+        :param logger: The logger, or name of the logger, records are passed to when using OUTPUT_LOGGING
+
+        :return: None
+        """
+        if output not in (Log.OUTPUT_STDOUT, Log.OUTPUT_LOGGING):
+            raise Exception('Unknown output specified')
+
+        if output == Log.OUTPUT_STDOUT:
+            Log.__logger__ = None
+            return
+
+        # Write anything still waiting before switching output
+        Log.flush()
+
+        logging.addLevelName(Log.LOGGING_LEVEL_TEST, 'TEST')
+        logging.addLevelName(Log.LOGGING_LEVEL_TRACE, 'TRACE')
+
+        Log.__logger__ = logger if isinstance(logger, logging.Logger) is True else logging.getLogger(logger)
+
+    @staticmethod
+    def set_format(output_format) -> None:
+        """
+        Set the format used when displaying messages
+
+        :type output_format: str
+        :param output_format: Output format, one of the FORMAT class constants. FORMAT_TEXT (the default) displays human
+            readable messages, FORMAT_JSON displays each message as a single line JSON object
+
+        :return: None
+        """
+        if output_format not in (Log.FORMAT_TEXT, Log.FORMAT_JSON):
+            raise Exception('Unknown output format specified')
+
+        Log.__format__ = output_format
+
+    @staticmethod
+    def set_buffer_size(buffer_size) -> None:
+        """
+        Set the number of displayed messages collected before they are written to stdout in a single write. Buffered
+        messages are written when Log.flush() is called, when an exception is logged and when the process exits
+
+        :type buffer_size: int
+        :param buffer_size: Number of messages to buffer, 1 writes every message immediately
+
+        :return: None
+        """
+        if int(buffer_size) < 1:
+            raise Exception('Invalid buffer size specified')
+
+        Log.flush()
+        Log.__buffer_size__ = int(buffer_size)
+
+        if Log.__buffer_size__ > 1 and Log.__is_flush_registered__ is False:
+            atexit.register(Log.flush)
+            Log.__is_flush_registered__ = True
+
+    @staticmethod
+    def enable_async_writer(queue_size=10000, batch_size=500, full_policy=QUEUE_FULL_BLOCK) -> None:
+        """
+        Write displayed messages from a background thread instead of the thread doing the logging. Any messages still
+        waiting to be written are flushed when the process exits
+
+        :type queue_size: int
+        :param queue_size: Maximum number of messages waiting to be written
+
+        :type batch_size: int
+        :param batch_size: Maximum number of messages written at once
+
+        :type full_policy: str
+        :param full_policy: Action taken when the queue is full, one of the QUEUE_FULL class constants. QUEUE_FULL_BLOCK
+            waits for space in the queue, QUEUE_FULL_DROP discards the message
+
+        :return: None
+        """
+        # Stop any existing writer so its messages are not lost
+        Log.disable_async_writer()
+
+        Log.__writer__ = AsyncWriter(
+            formatter=Log.__format_entry__,
+            queue_size=queue_size,
+            batch_size=batch_size,
+            full_policy=full_policy
+        )
+
+        if Log.__is_flush_registered__ is False:
+            atexit.register(Log.flush)
+            Log.__is_flush_registered__ = True
+
+    @staticmethod
+    def disable_async_writer() -> None:
+        """
+        Write any queued messages and return to writing messages from the thread doing the logging
+
+        :return: None
+        """
+        writer = Log.__writer__
+
+        if writer is not None:
+            Log.__writer__ = None
+            writer.stop()
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Wait until all displayed messages have been written. This should be called before returning from a Lambda
+        handler when the async writer is enabled
+
+        :return: None
+        """
+        Log.__write_buffer__()
+
+        writer = Log.__writer__
+
+        if writer is not None:
+            writer.flush()
+
+    @staticmethod
+    def get_dropped_count() -> int:
+        """
+        Return the number of messages discarded by the async writer because its queue was full
+
+        :return: int
+        """
+        if Log.__writer__ is None:
+            return 0
+
+        return Log.__writer__.get_dropped_count()
+
+    @staticmethod
+    def set_rate_limit(first=10, every=100) -> None:
+        """
+        Limit the number of messages logged from each call site. The first messages from each call site are always
+        logged, after which only one in every N messages is logged. Exception and error messages are never limited
+
+        :type first: int
+        :param first: Number of messages always logged from each call site
+
+        :type every: int
+        :param every: Once the first messages have been logged, log one in every this many messages
+
+        :return: None
+        """
+        Log.__rate_limiter__ = RateLimiter(first=first, every=every)
+
+    @staticmethod
+    def disable_rate_limit() -> None:
+        """
+        Log every message regardless of how often its call site is reached
+
+        :return: None
+        """
+        Log.__rate_limiter__ = None
+
+    @staticmethod
+    def get_suppressed_summary() -> list:
+        """
+        Return the number of messages seen and suppressed at each call site that has been rate limited, ordered by
+        the number of suppressed messages
+
+        :return: list[dict]
+        """
+        if Log.__rate_limiter__ is None:
+            return []
+
+        return Log.__rate_limiter__.get_summary()
+
+    @staticmethod
+    def log_suppressed_summary() -> None:
+        """
+        Log the number of messages suppressed at each rate limited call site at info level
+
+        :return: None
+        """
+        for call_site in Log.get_suppressed_summary():
+            Log.log(
+                level=Log.LEVEL_INFO,
+                message='Suppressed {suppressed} of {count} messages from {filename}:{line_number} {function}() {message}',
+                extra=call_site,
+                kwargs=dict(call_site, filename=os.path.basename(call_site['filename']))
+            )
+
+    @staticmethod
+    def span(name, **fields) -> Span:
+        """
+        Time an operation. The returned span can be used as a context manager or as a function decorator, and
+        records nothing unless spans have been enabled with Log.enable_spans()
+
+        :type name: str
+        :param name: Name of the operation, durations are aggregated by name
+
+        :param fields: Additional fields describing the operation, included in the trace message logged when the
+            span completes
+
+        :return: Span
+        """
+        return Span(name=name, fields=fields, statistics=Log.__span_statistics__)
+
+    @staticmethod
+    def enable_spans(log_completed=False) -> None:
+        """
+        Start recording the duration of spans
+
+        :type log_completed: bool
+        :param log_completed: If True a trace message is logged as each span completes
+
+        :return: None
+        """
+        Log.__span_statistics__.listener = Log.__log_span__ if log_completed is True else None
+        Log.__span_statistics__.enabled = True
+
+    @staticmethod
+    def disable_spans() -> None:
+        """
+        Stop recording the duration of spans. Previously recorded durations are retained
+
+        :return: None
+        """
+        Log.__span_statistics__.enabled = False
+
+    @staticmethod
+    def get_span_summary() -> dict:
+        """
+        Return the count, total, p50, p95 and max duration (in seconds) of every span recorded, along with the names
+        of any spans it was nested inside, ordered by total duration
+
+        :return: dict
+        """
+        return Log.__span_statistics__.get_summary()
+
+    @staticmethod
+    def log_span_summary() -> None:
+        """
+        Log the span summary at info level
+
+        :return: None
+        """
+        for name, statistics in Log.get_span_summary().items():
+            Log.info(
+                'Span {name}: count={count} total={total:.3f}s p50={p50:.3f}s p95={p95:.3f}s max={max:.3f}s',
+                name=name,
+                extra={'span': name, 'span_statistics': statistics},
+                **statistics
+            )
+
+    @staticmethod
+    def clear_span_summary() -> None:
+        """
+        Discard all recorded span durations
+
+        :return: None
+        """
+        Log.__span_statistics__.clear()
+
+    @staticmethod
+    def info(message, *args, extra=None, **kwargs) -> None:
         """
         Info level logging function
 
-        :type message: str or Exception
-        :param message: The message to be logged
+        :type message: str or Exception or Callable
+        :param message: The message to be logged. A callable is called when the message is displayed, or when it is
+            retained in the log history, which is enabled by default (see log())
+
+        :type extra: dict or None
+        :param extra: Additional fields to be included in structured output
+
+        :param args: Positional arguments used to format the message
+        :param kwargs: Keyword arguments used to format the message
 
         :return: None
         """
-        # This has to be the first line in the function otherwise this will return the wrong stack frame
-        stack_frame = inspect.stack()[1]
+        # Skip all processing if the message will neither be displayed or recorded
+        if Log.__is_required__(Log.LEVEL_INFO) is False:
+            return
 
         Log.log(
             level=Log.LEVEL_INFO,
-            stack_frame=stack_frame,
-            message=message
+            stack_frame=Log.__get_stack_frame__(),
+            message=message,
+            extra=extra,
+            args=args,
+            kwargs=kwargs
         )
 
     @staticmethod
-    def error(message) -> None:
+    def error(message, *args, extra=None, **kwargs) -> None:
         """
         Error level logging function
 
         :param message: Message to print
-        :type message: str/Exception
+        :type message: str/Exception/Callable
+
+        :param extra: Additional fields to be included in structured output
+        :type extra: dict or None
+
+        :param args: Positional arguments used to format the message
+        :param kwargs: Keyword arguments used to format the message
 
         :return: None
         """
-        # This has to be the first line in the function otherwise this will return the wrong stack frame
-        stack_frame = inspect.stack()[1]
+        # Skip all processing if the message will neither be displayed or recorded
+        if Log.__is_required__(Log.LEVEL_ERROR) is False:
+            return
 
         Log.log(
             level=Log.LEVEL_ERROR,
-            stack_frame=stack_frame,
-            message=message
+            stack_frame=Log.__get_stack_frame__(),
+            message=message,
+            extra=extra,
+            args=args,
+            kwargs=kwargs
         )
 
     @staticmethod
-    def warning(message) -> None:
+    def warning(message, *args, extra=None, **kwargs) -> None:
         """
         Warning level logging function
 
         :param message: Message to print
-        :type message: str/Exception
+        :type message: str/Exception/Callable
+
+        :param extra: Additional fields to be included in structured output
+        :type extra: dict or None
+
+        :param args: Positional arguments used to format the message
+        :param kwargs: Keyword arguments used to format the message
 
         :return: None
         """
-        # This has to be the first line in the function otherwise this will return the wrong stack frame
-        stack_frame = inspect.stack()[1]
+        # Skip all processing if the message will neither be displayed or recorded
+        if Log.__is_required__(Log.LEVEL_WARNING) is False:
+            return
 
         Log.log(
             level=Log.LEVEL_WARNING,
-            stack_frame=stack_frame,
-            message=message
+            stack_frame=Log.__get_stack_frame__(),
+            message=message,
+            extra=extra,
+            args=args,
+            kwargs=kwargs
         )
 
     @staticmethod
-    def debug(message) -> None:
+    def debug(message, *args, extra=None, **kwargs) -> None:
         """
         Debug level logging function
 
-        :param message: Message to print
-        :type message: str/Exception
+        :param message: Message to print. A callable is called when the message is displayed, or when it is retained in
+            the log history, which is enabled by default (see log())
+        :type message: str/Exception/Callable
+
+        :param extra: Additional fields to be included in structured output
+        :type extra: dict or None
+
+        :param args: Positional arguments used to format the message
+        :param kwargs: Keyword arguments used to format the message
 
         :return: None
         """
-        # This has to be the first line in the function otherwise this will return the wrong stack frame
-        stack_frame = inspect.stack()[1]
+        # Skip all processing if the message will neither be displayed or recorded
+        if Log.__is_required__(Log.LEVEL_DEBUG) is False:
+            return
 
         Log.log(
             level=Log.LEVEL_DEBUG,
-            stack_frame=stack_frame,
-            message=message
+            stack_frame=Log.__get_stack_frame__(),
+            message=message,
+            extra=extra,
+            args=args,
+            kwargs=kwargs
         )
 
     @staticmethod
-    def test(message) -> None:
+    def test(message, *args, extra=None, **kwargs) -> None:
         """
         Unit test level logging function
 
-        :param message: Message to print
-        :type message: str/Exception
+        :param message: Message to print. A callable is called when the message is displayed, or when it is retained in
+            the log history, which is enabled by default (see log())
+        :type message: str/Exception/Callable
+
+        :param extra: Additional fields to be included in structured output
+        :type extra: dict or None
+
+        :param args: Positional arguments used to format the message
+        :param kwargs: Keyword arguments used to format the message
 
         :return: None
         """
-        # This has to be the first line in the function otherwise this will return the wrong stack frame
-        stack_frame = inspect.stack()[1]
+        # Skip all processing if the message will neither be displayed or recorded
+        if Log.__is_required__(Log.LEVEL_TEST) is False:
+            return
 
         Log.log(
             level=Log.LEVEL_TEST,
-            stack_frame=stack_frame,
-            message=message
+            stack_frame=Log.__get_stack_frame__(),
+            message=message,
+            extra=extra,
+            args=args,
+            kwargs=kwargs
         )
 
     @staticmethod
-    def trace(message) -> None:
+    def trace(message, *args, extra=None, **kwargs) -> None:
         """
         Trace level logging function
 
-        :param message: Message to print
-        :type message: str/Exception
+        :param message: Message to print. A callable is called when the message is displayed, or when it is retained in
+            the log history, which is enabled by default (see log())
+        :type message: str/Exception/Callable
+
+        :param extra: Additional fields to be included in structured output
+        :type extra: dict or None
+
+        :param args: Positional arguments used to format the message
+        :param kwargs: Keyword arguments used to format the message
 
         :return: None
         """
-        # This has to be the first line in the function otherwise this will return the wrong stack frame
-        stack_frame = inspect.stack()[1]
+        # Skip all processing if the message will neither be displayed or recorded
+        if Log.__is_required__(Log.LEVEL_TRACE) is False:
+            return
 
         Log.log(
             level=Log.LEVEL_TRACE,
-            stack_frame=stack_frame,
-            message=message
+            stack_frame=Log.__get_stack_frame__(),
+            message=message,
+            extra=extra,
+            args=args,
+            kwargs=kwargs
         )
 
     @staticmethod
@@ -172,12 +704,9 @@ class Log:
 
         :return: None
         """
-        # This has to be the first line in the function otherwise this will return the wrong stack frame
-        stack_frame = inspect.stack()[1]
-
         Log.log(
             level=Log.LEVEL_EXCEPTION,
-            stack_frame=stack_frame,
+            stack_frame=Log.__get_stack_frame__(),
             message=message
         )
 
@@ -220,76 +749,77 @@ class Log:
         return level_name
 
     @staticmethod
-    def log(level, message, stack_frame=None) -> None:
-        # If no logging level is defined, select one based on the current context
-        if Log.__level__ is None:
-            # Work out if we are in a unit test
-            current_stack = inspect.stack()
-            is_unit_test = False
-            for stack_frame in current_stack:
-                for program_line in stack_frame[4]:
-                    if "unittest" in program_line:
-                        is_unit_test = True
-                        break
-
-            if is_unit_test is True:
-                # Running unit tests, disable logging
-                print('Running unit tests, logging test messages only...')
-                Log.__level__ = Log.LEVEL_TEST
-            else:
-                # Not running unit tests, default to maximum logging level
-                print('No logging level has been defined, defaulting to maximum logging...')
-                Log.__level__ = Log.LEVEL_TRACE
+    def log(level, message, stack_frame=None, extra=None, args=None, kwargs=None) -> None:
+        """
+        Log a message
 
-        # Convert the log level to a human readable string
-        level_name = Log.get_log_level_name(level)
+        If args or kwargs are supplied the message is treated as a str.format() template, otherwise if the message is
+        callable it is called with no arguments and its result is logged
 
-        # Retrieve current timestamp
-        timestamp = strftime("%Y-%m-%d %H:%M:%S")
+        A message that is neither displayed nor retained in the log history is never rendered. A retained message is
+        rendered as soon as it is logged if it is callable or not a str, or if any argument is not a scalar, so the
+        history never holds on to its arguments. Other messages are rendered once displayed or read from the history.
+        The history is retained by default (HISTORY_FULL), so a callable message below the current log level is only
+        left uncalled once the history has been disabled
 
-        # Trim whitespace off the message
-        message = str(message).strip()
+        :type level: int
+        :param level: Logging level, one of the LEVEL class constants
 
-        # Create history entry
-        history = {
-            'message': message,
-            'message_formatted': '',
-            'level': level_name,
-            'timestamp': timestamp,
-            'filename': '',
-            'function': '',
-            'line_number': '',
-        }
+        :type message: str or Exception or Callable
+        :param message: The message, message template or a function returning the message
 
-        # Create a display formatted version of the message
-        message_formatted = message
+        :type stack_frame: CallSite or inspect.FrameInfo or None
+        :param stack_frame: The location the message was logged from
 
-        # If we received a stack frame, add its details to the log entry
-        if stack_frame is not None:
-            history['filename'] = stack_frame.filename
-            history['function'] = stack_frame.function
-            history['line_number'] = stack_frame.lineno
-            message_formatted = '[{level_name}: {filename}] {function}():{line_number} - {message_formatted}'.format(
-                level_name=level_name,
-                filename=os.path.basename(history['filename']),
-                function=history['function'],
-                line_number=history['line_number'],
-                message_formatted=message_formatted
-            )
+        :type extra: dict or None
+        :param extra: Additional fields to be included in structured output
+
+        :type args: tuple or None
+        :param args: Positional arguments used to format the message
+
+        :type kwargs: dict or None
+        :param kwargs: Keyword arguments used to format the message
+
+        :return: None
+        """
+        # Convert the log level to a human readable string
+        level_name = Log.get_log_level_name(level)
 
-        message_formatted = '[{timestamp}] {message_formatted}'.format(timestamp=timestamp, message_formatted=message_formatted)
+        # Work out where the message needs to go
+        is_displayed = Log.__get_level__() >= level
+        history = Log.__get_history__()
 
-        if Log.__function_name__ is not None:
-            message_formatted = "{function} - {message_formatted}".format(function=Log.__function_name__, message_formatted=message_formatted)
+        if is_displayed is False and history is None:
+            return
+
+        # Drop the message if its call site has exceeded the rate limit
+        if Log.__rate_limiter__ is not None and Log.__is_rate_limited__(level=level, message=message, stack_frame=stack_frame) is True:
+            return
+
+        entry = LogEntry(
+            level=level,
+            level_name=level_name,
+            created=time.time(),
+            message=message,
+            stack_frame=stack_frame,
+            function_name=Log.__function_name__,
+            context=Log.__context__.get(),
+            extra=extra,
+            args=args if args else None,
+            kwargs=kwargs if kwargs else None
+        )
 
-        history['message_formatted'] = message_formatted
+        # Render the entry if it would otherwise retain its arguments, before it can be read by the async writer
+        if history is not None:
+            entry.snapshot()
 
         # Display the message if appropriate based on the current log level
-        if Log.__level__ is None or Log.__level__ >= level:
-            print(message_formatted)
+        if is_displayed is True:
+            Log.__write__(entry)
 
         # Add entry to the log
-        Log.__history__.append(history)
+        if history is not None:
+            history.append(entry)
 
     @staticmethod
     def format_message(level, message, stack_frame=None) -> str:
@@ -317,13 +847,330 @@ class Log:
 
         :return: None
         """
-        Log.__history__ = []
+        history = Log.__get_history__()
+
+        if history is not None:
+            history.clear()
 
     @staticmethod
-    def get_log_history(self) -> list:
+    def get_log_history(self=None) -> list:
         """
-        Return the complete log history regardless of the current log level
+        Return the retained log history regardless of the current log level
 
         :return: list
         """
-        return self.__history__
+        history = Log.__get_history__()
+
+        if history is None:
+            return []
+
+        # Copying the deque is atomic, iterating it while other threads are logging is not
+        return [entry.to_dict() for entry in history.copy()]
+
+    # Internal methods
+
+    @staticmethod
+    def __get_level__() -> int:
+        """
+        Retrieve the current logging display level, selecting one based on the current context if none was defined
+
+        :return: int
+        """
+        # If no logging level is defined, select one based on the current context. The result is cached so this
+        # only ever happens once
+        if Log.__level__ is None:
+            Log.__level__ = Log.__detect_level__()
+
+        return Log.__level__
+
+    @staticmethod
+    def __detect_level__() -> int:
+        """
+        Select a logging level based on the EASY_LOG_LEVEL environment variable, falling back to the TEST level
+        when running unit tests and TRACE level otherwise
+
+        :return: int
+        """
+        environment_level = os.environ.get(Log.ENVIRONMENT_LEVEL, '').strip()
+
+        if environment_level != '':
+            levels = (Log.LEVEL_EXCEPTION, Log.LEVEL_TEST, Log.LEVEL_ERROR, Log.LEVEL_INFO, Log.LEVEL_WARNING, Log.LEVEL_DEBUG, Log.LEVEL_TRACE)
+            for level in levels:
+                if environment_level.upper() == Log.get_log_level_name(level) or environment_level == str(level):
+                    return level
+            raise Exception('Unknown logging level specified')
+
+        if Log.__is_unit_test__() is True:
+            # Running unit tests, disable logging
+            print('Running unit tests, logging test messages only...')
+            return Log.LEVEL_TEST
+
+        # Not running unit tests, default to maximum logging level
+        print('No logging level has been defined, defaulting to maximum logging...')
+        return Log.LEVEL_TRACE
+
+    @staticmethod
+    def __is_unit_test__() -> bool:
+        """
+        Determine whether we are running inside a unit test runner without reading any source files
+
+        :return: bool
+        """
+        # Running under pytest
+        if 'PYTEST_CURRENT_TEST' in os.environ or 'pytest' in sys.modules:
+            return True
+
+        # Running under unittest, its module is imported by other libraries so check whether any of its code is
+        # currently executing instead
+        unittest_path = '{separator}unittest{separator}'.format(separator=os.sep)
+        frame = sys._getframe(1)
+        while frame is not None:
+            if unittest_path in frame.f_code.co_filename:
+                return True
+            frame = frame.f_back
+
+        return False
+
+    @staticmethod
+    def __is_rate_limited__(level, message, stack_frame) -> bool:
+        """
+        Determine whether a message should be dropped because its call site has exceeded the rate limit
+
+        :type level: int
+        :param level: Logging level of the message
+
+        :type message: str or Exception or Callable
+        :param message: The message or message template
+
+        :type stack_frame: CallSite or inspect.FrameInfo or None
+        :param stack_frame: The location the message was logged from
+
+        :return: bool
+        """
+        rate_limiter = Log.__rate_limiter__
+
+        if rate_limiter is None or level in (Log.LEVEL_EXCEPTION, Log.LEVEL_ERROR):
+            return False
+
+        # Identify the call site by its code location, falling back to the message template
+        if isinstance(stack_frame, CallSite) is True:
+            key = (stack_frame.code, stack_frame.lineno)
+        elif stack_frame is not None:
+            key = (stack_frame.filename, stack_frame.lineno)
+        elif isinstance(message, str) is True:
+            key = message
+        else:
+            return False
+
+        return rate_limiter.is_allowed(key=key, stack_frame=stack_frame) is False
+
+    @staticmethod
+    def __log_span__(span, duration) -> None:
+        """
+        Log the completion of a span
+
+        :type span: Span
+        :param span: The completed span
+
+        :type duration: float
+        :param duration: Duration of the span in seconds
+
+        :return: None
+        """
+        if Log.__is_required__(Log.LEVEL_TRACE) is False:
+            return
+
+        extra = dict(span.fields)
+        extra['span'] = span.name
+        extra['duration'] = duration
+
+        Log.log(
+            level=Log.LEVEL_TRACE,
+            message='Span {name} completed in {duration:.6f}s',
+            extra=extra,
+            kwargs={'name': span.name, 'duration': duration}
+        )
+
+    @staticmethod
+    def __write__(entry) -> None:
+        """
+        Write an entry to stdout, either directly or via the async writer, or pass it to the standard library logger
+
+        :type entry: LogEntry
+        :param entry: The entry to write
+
+        :return: None
+        """
+        if Log.__logger__ is not None:
+            Log.__write_logging__(entry)
+            return
+
+        writer = Log.__writer__
+
+        if writer is None:
+            if Log.__buffer_size__ == 1:
+                sys.stdout.write(Log.__format_entry__(entry) + '\n')
+                return
+
+            with Log.__buffer_lock__:
+                Log.__buffer__.append(entry)
+                is_full = len(Log.__buffer__) >= Log.__buffer_size__
+
+            if is_full is True or entry.level == Log.LEVEL_EXCEPTION:
+                Log.__write_buffer__()
+
+            return
+
+        writer.write(entry)
+
+        # Make sure exceptions are visible before they are raised
+        if entry.level == Log.LEVEL_EXCEPTION:
+            writer.flush()
+
+    @staticmethod
+    def __write_logging__(entry) -> None:
+        """
+        Pass an entry to the standard library logger as a LogRecord. The record uses the call site already captured
+        for the entry and its message is only rendered when a handler formats it
+
+        :type entry: LogEntry
+        :param entry: The entry to write
+
+        :return: None
+        """
+        logger = Log.__logger__
+        logging_level = Log.__get_logging_level__(entry.level)
+
+        if logger.isEnabledFor(logging_level) is False:
+            return
+
+        line_number = entry.line_number
+
+        record = logger.makeRecord(
+            name=logger.name,
+            level=logging_level,
+            fn=entry.filename,
+            lno=line_number if line_number != '' else 0,
+            msg=entry,
+            args=None,
+            exc_info=None,
+            func=entry.function if entry.function != '' else None
+        )
+
+        # Keep the time the message was logged rather than the time the record was created
+        record.created = entry.created
+        record.msecs = (entry.created - int(entry.created)) * 1000
+
+        # Attach function name, context and extra fields without replacing any of the records own attributes
+        fields = {'function_name': entry.function_name}
+        for extra_fields in (entry.context, entry.extra):
+            if extra_fields is not None:
+                fields.update(extra_fields)
+
+        for key, value in fields.items():
+            if key not in record.__dict__ and key not in ('message', 'asctime'):
+                record.__dict__[key] = value
+
+        logger.handle(record)
+
+    @staticmethod
+    def __get_logging_level__(level) -> int:
+        """
+        Convert a logging level to the equivalent standard library logging level
+
+        :type level: int
+        :param level: Logging level, one of the LEVEL class constants
+
+        :return: int
+        """
+        if level == Log.LEVEL_EXCEPTION:
+            return logging.CRITICAL
+        if level == Log.LEVEL_ERROR:
+            return logging.ERROR
+        if level == Log.LEVEL_WARNING:
+            return logging.WARNING
+        if level == Log.LEVEL_INFO:
+            return logging.INFO
+        if level == Log.LEVEL_TEST:
+            return Log.LOGGING_LEVEL_TEST
+        if level == Log.LEVEL_DEBUG:
+            return logging.DEBUG
+
+        return Log.LOGGING_LEVEL_TRACE
+
+    @staticmethod
+    def __format_entry__(entry) -> str:
+        """
+        Format an entry for display
+
+        :type entry: LogEntry
+        :param entry: The entry to format
+
+        :return: str
+        """
+        if Log.__format__ == Log.FORMAT_JSON:
+            return entry.to_json()
+
+        return entry.message_formatted
+
+    @staticmethod
+    def __write_buffer__() -> None:
+        """
+        Write all buffered entries to stdout in a single write
+
+        :return: None
+        """
+        with Log.__buffer_lock__:
+            entries = Log.__buffer__
+            Log.__buffer__ = []
+
+        if len(entries) == 0:
+            return
+
+        lines = [Log.__format_entry__(entry) for entry in entries]
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+
+    @staticmethod
+    def __get_history__():
+        """
+        Retrieve the log history, configuring it from the environment on first use
+
+        :return: deque or None
+        """
+        if Log.__history_mode__ is None:
+            Log.set_history_mode(
+                history_mode=os.environ.get(Log.ENVIRONMENT_HISTORY, Log.HISTORY_FULL).strip().lower(),
+                capacity=os.environ.get(Log.ENVIRONMENT_HISTORY_CAPACITY) or None
+            )
+
+        return Log.__history__
+
+    @staticmethod
+    def __is_required__(level) -> bool:
+        """
+        Determine whether a message at the specified level will be displayed or recorded in the log history
+
+        :type level: int
+        :param level: Logging level of the message
+
+        :return: bool
+        """
+        return Log.__get_history__() is not None or Log.__get_level__() >= level
+
+    @staticmethod
+    def __get_stack_frame__():
+        """
+        Retrieve the call site of the function that called the public logging function. This must only be called
+        directly from one of the public logging functions, otherwise the wrong frame will be returned
+
+        :return: CallSite or inspect.FrameInfo or None
+        """
+        if Log.__capture_mode__ == Log.CAPTURE_FRAME:
+            # Frame 0 is this function, frame 1 is the logging function and frame 2 is its caller
+            return CallSite.from_frame(sys._getframe(2))
+
+        if Log.__capture_mode__ == Log.CAPTURE_STACK:
+            return inspect.stack()[2]
+
+        return None
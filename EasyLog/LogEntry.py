@@ -0,0 +1,267 @@
+import json
+import os
+import threading
+
+from datetime import datetime
+from datetime import timezone
+from time import localtime
+from time import strftime
+
+
+class LogEntry:
+    """
+    A single log message
+
+    Entries are kept deliberately small as they may be retained in the log history for the lifetime of the process.
+    The message, timestamp and display formatted version of the entry are only rendered when they are first requested,
+    unless the entry is retained with arguments that are not scalars, in which case the message is rendered when it is
+    retained.
+    """
+    __slots__ = ('level', 'level_name', 'created', 'stack_frame', 'function_name', 'context', 'extra', '__message__', '__args__', '__kwargs__', '__message_formatted__')
+
+    TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    # Standard fields included in every JSON formatted entry
+    JSON_FIELDS = ('level', 'timestamp', 'file', 'function', 'line', 'function_name', 'message')
+
+    # Immutable argument types that are cheap to retain until the message is rendered
+    SCALAR_TYPES = (str, int, float, bool, bytes, type(None))
+
+    # Serializes rendering, as an entry may be read by the async writer while it is being retained or read from history
+    __resolve_lock__ = threading.RLock()
+
+    def __init__(self, level, level_name, created, message, stack_frame=None, function_name=None, context=None, extra=None, args=None, kwargs=None):
+        """
+        :type level: int
+        :param level: Logging level, one of the Log.LEVEL constants
+
+        :type level_name: str
+        :param level_name: Human readable name of the logging level
+
+        :type created: float
+        :param created: Time the entry was created in seconds since the epoch
+
+        :type message: str or Exception or Callable
+        :param message: The message that was logged. If args or kwargs are supplied this is a str.format() template,
+            otherwise if it is callable it will be called to produce the message
+
+        :type stack_frame: CallSite or inspect.FrameInfo or None
+        :param stack_frame: The location the message was logged from (if known)
+
+        :type function_name: str or None
+        :param function_name: Function name used to prefix the message, unless the context contains a function name
+
+        :type context: dict or None
+        :param context: Fields bound to the thread or task the message was logged from
+
+        :type extra: dict or None
+        :param extra: Additional fields to be included in structured output
+
+        :type args: tuple or None
+        :param args: Positional arguments used to format the message template
+
+        :type kwargs: dict or None
+        :param kwargs: Keyword arguments used to format the message template
+        """
+        self.level = level
+        self.level_name = level_name
+        self.created = created
+        self.stack_frame = stack_frame
+        self.function_name = function_name
+        self.context = context
+        self.extra = extra
+
+        if context is not None and context.get('function_name') is not None:
+            self.function_name = context['function_name']
+
+        self.__message__ = message
+        self.__args__ = args
+        self.__kwargs__ = kwargs
+        self.__message_formatted__ = None
+
+    def __str__(self) -> str:
+        return self.message
+
+    @property
+    def message(self) -> str:
+        """
+        The message with leading/trailing whitespace removed
+
+        :return: str
+        """
+        self.__resolve__()
+
+        return self.__message__.strip()
+
+    @property
+    def timestamp(self) -> str:
+        """
+        The time the entry was created in human readable format
+
+        :return: str
+        """
+        return strftime(LogEntry.TIMESTAMP_FORMAT, localtime(self.created))
+
+    @property
+    def filename(self) -> str:
+        """
+        Full path of the file the message was logged from
+
+        :return: str
+        """
+        if self.stack_frame is None:
+            return ''
+
+        return self.stack_frame.filename
+
+    @property
+    def function(self) -> str:
+        """
+        Name of the function the message was logged from
+
+        :return: str
+        """
+        if self.stack_frame is None:
+            return ''
+
+        return self.stack_frame.function
+
+    @property
+    def line_number(self):
+        """
+        Line number the message was logged from
+
+        :return: int or str
+        """
+        if self.stack_frame is None:
+            return ''
+
+        return self.stack_frame.lineno
+
+    @property
+    def message_formatted(self) -> str:
+        """
+        Display formatted version of the message
+
+        :return: str
+        """
+        if self.__message_formatted__ is None:
+            message_formatted = self.message
+
+            # If we have a stack frame, add its details to the message
+            if self.stack_frame is not None:
+                message_formatted = '[{level_name}: {filename}] {function}():{line_number} - {message_formatted}'.format(
+                    level_name=self.level_name,
+                    filename=os.path.basename(self.stack_frame.filename),
+                    function=self.stack_frame.function,
+                    line_number=self.stack_frame.lineno,
+                    message_formatted=message_formatted
+                )
+
+            message_formatted = '[{timestamp}] {message_formatted}'.format(timestamp=self.timestamp, message_formatted=message_formatted)
+
+            if self.function_name is not None:
+                message_formatted = "{function} - {message_formatted}".format(function=self.function_name, message_formatted=message_formatted)
+
+            self.__message_formatted__ = message_formatted
+
+        return self.__message_formatted__
+
+    def snapshot(self) -> None:
+        """
+        Prepare the entry to be retained in the log history. If the message is not a str, or any argument is not a
+        scalar, the message is rendered now, so the entry does not keep the arguments alive (e.g. exceptions and their
+        tracebacks, or large payloads) and does not reflect changes made to them after they were logged
+
+        :return: None
+        """
+        arguments = list(self.__args__ or ()) + list((self.__kwargs__ or {}).values())
+
+        if type(self.__message__) is not str or any(type(argument) not in LogEntry.SCALAR_TYPES for argument in arguments):
+            self.__resolve__()
+
+    def to_dict(self) -> dict:
+        """
+        Convert the entry to a dictionary
+
+        :return: dict
+        """
+        return {
+            'message': self.message,
+            'message_formatted': self.message_formatted,
+            'level': self.level_name,
+            'timestamp': self.timestamp,
+            'filename': self.filename,
+            'function': self.function,
+            'line_number': self.line_number,
+            'context': self.context if self.context is not None else {},
+            'extra': self.extra if self.extra is not None else {},
+        }
+
+    def to_json(self) -> str:
+        """
+        Serialize the entry as a single line JSON object
+
+        :return: str
+        """
+        record = {
+            'level': self.level_name,
+            'timestamp': datetime.fromtimestamp(self.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'file': os.path.basename(self.filename),
+            'function': self.function,
+            'line': self.line_number,
+            'function_name': self.function_name,
+            'message': self.message,
+        }
+
+        # Context and extra fields must not replace the standard fields
+        for fields in (self.context, self.extra):
+            if fields is not None:
+                for key, value in fields.items():
+                    if key not in LogEntry.JSON_FIELDS:
+                        record[key] = value
+
+        return json.dumps(record, default=str)
+
+    # Internal methods
+
+    def __resolve__(self) -> None:
+        """
+        Render the message if it has not already been rendered, releasing the arguments used to render it
+
+        :return: None
+        """
+        # The rendered message is stored before the arguments are released, so a rendered entry is never rendered again
+        if type(self.__message__) is str and self.__args__ is None and self.__kwargs__ is None:
+            return
+
+        with LogEntry.__resolve_lock__:
+            if self.__args__ is not None or self.__kwargs__ is not None:
+                self.__message__ = self.__render__()
+                self.__args__ = None
+                self.__kwargs__ = None
+            elif type(self.__message__) is not str:
+                message = self.__message__
+                if callable(message) is True:
+                    message = message()
+                self.__message__ = str(message)
+
+    def __render__(self) -> str:
+        """
+        Render the message template using the supplied arguments
+
+        :return: str
+        """
+        args = self.__args__ if self.__args__ is not None else ()
+        kwargs = self.__kwargs__ if self.__kwargs__ is not None else {}
+
+        try:
+            return str(self.__message__).format(*args, **kwargs)
+        except Exception as format_exception:
+            # Never lose a message because of a bad template
+            return '{message} (args={args}, kwargs={kwargs}, format error: {format_exception})'.format(
+                message=self.__message__,
+                args=args,
+                kwargs=kwargs,
+                format_exception=format_exception
+            )
@@ -0,0 +1,86 @@
+import itertools
+
+
+class RateLimiter:
+    """
+    Per call site log sampling
+
+    The first messages from each call site are always allowed, after which only one in every N messages is allowed.
+    Counters are plain iterators so concurrent threads never contend on a lock.
+    """
+
+    def __init__(self, first=10, every=100):
+        """
+        :type first: int
+        :param first: Number of messages always allowed from each call site
+
+        :type every: int
+        :param every: Once the first messages have been allowed, allow one in every this many messages
+        """
+        if int(first) < 0 or int(every) < 1:
+            raise Exception('Invalid rate limit specified')
+
+        self.first = int(first)
+        self.every = int(every)
+        self.__call_sites__ = {}
+
+    def is_allowed(self, key, stack_frame=None) -> bool:
+        """
+        Count a message from the specified call site and determine whether it should be logged
+
+        :type key: Hashable
+        :param key: Key uniquely identifying the call site
+
+        :type stack_frame: CallSite or inspect.FrameInfo or None
+        :param stack_frame: Location of the call site, used when reporting suppressed messages
+
+        :return: bool
+        """
+        call_site = self.__call_sites__.get(key)
+
+        if call_site is None:
+            location = ('', '', '') if stack_frame is None else (stack_frame.filename, stack_frame.function, stack_frame.lineno)
+            call_site = self.__call_sites__.setdefault(key, [itertools.count(), 0, location])
+
+        count = next(call_site[0])
+        call_site[1] = count + 1
+
+        if count < self.first:
+            return True
+
+        return (count - self.first) % self.every == 0
+
+    def get_summary(self) -> list:
+        """
+        Return the number of messages seen and suppressed at each call site that has had messages suppressed
+
+        :return: list[dict]
+        """
+        summary = []
+
+        for key, (_, count, location) in list(self.__call_sites__.items()):
+            allowed = min(count, self.first)
+            if count > self.first:
+                allowed += (count - self.first - 1) // self.every + 1
+
+            if count == allowed:
+                continue
+
+            summary.append({
+                'filename': location[0],
+                'function': location[1],
+                'line_number': location[2],
+                'message': key if isinstance(key, str) else '',
+                'count': count,
+                'suppressed': count - allowed
+            })
+
+        return sorted(summary, key=lambda item: item['suppressed'], reverse=True)
+
+    def clear(self) -> None:
+        """
+        Reset all call site counters
+
+        :return: None
+        """
+        self.__call_sites__ = {}
@@ -0,0 +1,97 @@
+import functools
+
+from time import perf_counter
+
+
+class Span:
+    """
+    Time a block of code or function, usable as either a context manager or a decorator
+
+    When spans are disabled entering and leaving a span does nothing beyond a single flag check.
+    """
+    __slots__ = ('name', 'fields', 'parent', '__statistics__', '__start__', '__token__')
+
+    def __init__(self, name, fields, statistics):
+        """
+        :type name: str
+        :param name: Name of the operation being timed
+
+        :type fields: dict
+        :param fields: Additional fields describing this execution of the operation
+
+        :type statistics: SpanStatistics
+        :param statistics: Statistics the span duration will be recorded in
+        """
+        self.name = name
+        self.fields = fields
+        self.parent = None
+        self.__statistics__ = statistics
+        self.__start__ = None
+        self.__token__ = None
+
+    def __enter__(self):
+        if self.__statistics__.enabled is True:
+            active_spans = self.__statistics__.active_spans.get()
+            self.parent = active_spans[-1] if len(active_spans) > 0 else None
+            self.__token__ = self.__statistics__.active_spans.set(active_spans + (self,))
+            self.__start__ = perf_counter()
+
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        if self.__start__ is None:
+            return False
+
+        duration = perf_counter() - self.__start__
+        self.__start__ = None
+
+        # The span may be exited from a different context than it was entered in (e.g. a generator resumed by
+        # another task), in which case the token cannot be used
+        try:
+            self.__statistics__.active_spans.reset(self.__token__)
+        except ValueError:
+            pass
+        self.__token__ = None
+
+        self.__statistics__.record(self, duration)
+
+        return False
+
+    def __call__(self, function):
+        """
+        Decorate a function so every call to it is timed
+
+        :type function: Callable
+        :param function: The function to time
+
+        :return: Callable
+        """
+        name = self.name
+        fields = self.fields
+        statistics = self.__statistics__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if statistics.enabled is False:
+                return function(*args, **kwargs)
+
+            with Span(name=name, fields=fields, statistics=statistics):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    @property
+    def depth(self) -> int:
+        """
+        Number of spans this span is nested inside
+
+        :return: int
+        """
+        depth = 0
+        parent = self.parent
+
+        while parent is not None:
+            depth += 1
+            parent = parent.parent
+
+        return depth
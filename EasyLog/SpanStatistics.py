@@ -0,0 +1,196 @@
+import contextvars
+import random
+import threading
+import weakref
+
+
+class SpanStatistics:
+    """
+    Aggregated timings for all spans recorded by the logger
+
+    Each thread records into its own statistics, which are only merged when a summary is requested, so threads never
+    contend with each other while recording. The statistics of threads that have finished are merged into a single
+    retired set the next time a thread starts recording or a summary is requested, so short lived worker threads do not
+    accumulate. The stack of open spans is held in a context variable so that nesting is tracked correctly for both
+    threads and asyncio tasks.
+    """
+    # Maximum number of durations retained per span name when calculating percentiles
+    SAMPLE_CAPACITY = 10000
+
+    def __init__(self):
+        self.enabled = False
+        self.listener = None
+        self.active_spans = contextvars.ContextVar('easy_log_active_spans', default=())
+        self.__local__ = threading.local()
+        self.__lock__ = threading.Lock()
+        self.__thread_statistics__ = []
+        self.__retired_statistics__ = {}
+
+    def record(self, span, duration) -> None:
+        """
+        Record the duration of a completed span
+
+        :type span: Span
+        :param span: The completed span
+
+        :type duration: float
+        :param duration: Duration of the span in seconds
+
+        :return: None
+        """
+        thread_statistics = getattr(self.__local__, 'statistics', None)
+
+        if thread_statistics is None:
+            thread_statistics = {}
+            self.__local__.statistics = thread_statistics
+            with self.__lock__:
+                self.__retire_finished_threads__()
+                self.__thread_statistics__.append((weakref.ref(threading.current_thread()), thread_statistics))
+
+        statistics = thread_statistics.get(span.name)
+
+        if statistics is None:
+            statistics = SpanStatistics.__create_statistics__()
+            thread_statistics[span.name] = statistics
+
+        statistics['count'] += 1
+        statistics['total'] += duration
+
+        if duration > statistics['max']:
+            statistics['max'] = duration
+
+        if span.parent is not None:
+            statistics['parents'].add(span.parent.name)
+
+        # Retain a uniform random sample of durations once the sample capacity has been reached
+        if len(statistics['samples']) < SpanStatistics.SAMPLE_CAPACITY:
+            statistics['samples'].append(duration)
+        else:
+            index = random.randrange(statistics['count'])
+            if index < SpanStatistics.SAMPLE_CAPACITY:
+                statistics['samples'][index] = duration
+
+        if self.listener is not None:
+            self.listener(span, duration)
+
+    def get_summary(self) -> dict:
+        """
+        Return the count, total, p50, p95 and max durations (in seconds) of each span, ordered by total duration
+
+        :return: dict
+        """
+        # Merge the statistics recorded by each thread with those of the threads that have finished
+        merged = {}
+
+        with self.__lock__:
+            self.__retire_finished_threads__()
+            SpanStatistics.__merge__(merged, self.__retired_statistics__)
+            for _, thread_statistics in self.__thread_statistics__:
+                SpanStatistics.__merge__(merged, thread_statistics)
+
+        statistics = [(name, dict(values, samples=sorted(values['samples']))) for name, values in merged.items()]
+
+        summary = {}
+
+        for name, values in sorted(statistics, key=lambda item: item[1]['total'], reverse=True):
+            samples = values['samples']
+            summary[name] = {
+                'count': values['count'],
+                'total': values['total'],
+                'p50': SpanStatistics.__percentile__(samples, 50),
+                'p95': SpanStatistics.__percentile__(samples, 95),
+                'max': values['max'],
+                'parents': sorted(values['parents'])
+            }
+
+        return summary
+
+    def clear(self) -> None:
+        """
+        Discard all recorded timings
+
+        :return: None
+        """
+        with self.__lock__:
+            self.__retired_statistics__.clear()
+            for _, thread_statistics in self.__thread_statistics__:
+                thread_statistics.clear()
+
+    # Internal methods
+
+    def __retire_finished_threads__(self) -> None:
+        """
+        Merge the statistics of threads that have finished into the retired statistics and stop tracking those threads,
+        must be called while holding the lock
+
+        :return: None
+        """
+        running = []
+
+        for thread_reference, thread_statistics in self.__thread_statistics__:
+            thread = thread_reference()
+            if thread is not None and thread.is_alive() is True:
+                running.append((thread_reference, thread_statistics))
+                continue
+
+            SpanStatistics.__merge__(self.__retired_statistics__, thread_statistics)
+
+            # Keep the retired samples within the sample capacity so they do not grow with the number of threads
+            for statistics in self.__retired_statistics__.values():
+                if len(statistics['samples']) > SpanStatistics.SAMPLE_CAPACITY:
+                    statistics['samples'] = random.sample(statistics['samples'], SpanStatistics.SAMPLE_CAPACITY)
+
+        self.__thread_statistics__ = running
+
+    @staticmethod
+    def __create_statistics__() -> dict:
+        """
+        Return empty statistics for a span
+
+        :return: dict
+        """
+        return {'count': 0, 'total': 0.0, 'max': 0.0, 'samples': [], 'parents': set()}
+
+    @staticmethod
+    def __merge__(merged, thread_statistics) -> None:
+        """
+        Add the statistics of each span recorded by a thread to the merged statistics
+
+        :type merged: dict
+        :param merged: The merged statistics, keyed by span name
+
+        :type thread_statistics: dict
+        :param thread_statistics: The statistics recorded by the thread, keyed by span name
+
+        :return: None
+        """
+        for name, values in list(thread_statistics.items()):
+            statistics = merged.get(name)
+            if statistics is None:
+                statistics = SpanStatistics.__create_statistics__()
+                merged[name] = statistics
+            statistics['count'] += values['count']
+            statistics['total'] += values['total']
+            statistics['max'] = max(statistics['max'], values['max'])
+            statistics['samples'].extend(values['samples'])
+            statistics['parents'].update(values['parents'])
+
+    @staticmethod
+    def __percentile__(samples, percentile) -> float:
+        """
+        Return the nearest rank percentile of a sorted list of samples
+
+        :type samples: list
+        :param samples: Sorted samples
+
+        :type percentile: int
+        :param percentile: The percentile to return (0-100)
+
+        :return: float
+        """
+        if len(samples) == 0:
+            return 0.0
+
+        index = max(0, int(round(percentile / 100 * len(samples))) - 1)
+
+        return samples[min(index, len(samples) - 1)]
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark the per-call cost of EasyLog call site capture
+
+Usage: python benchmarks/log_capture.py [iterations]
+"""
+import contextlib
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from EasyLog.Log import Log
+
+
+def nested_call(depth, function):
+    """
+    Call the function from beneath the requested number of stack frames to simulate a realistic call stack
+
+    :type depth: int
+    :param depth: Number of frames to add to the stack
+
+    :type function: Callable
+    :param function: Function to call
+
+    :return: None
+    """
+    if depth == 0:
+        return function()
+
+    return nested_call(depth - 1, function)
+
+
+def measure(name, iterations, capture_mode, level, history):
+    """
+    Measure and print the average cost of a single Log.trace() call
+
+    :type name: str
+    :param name: Name of the scenario being measured
+
+    :type iterations: int
+    :param iterations: Number of log calls to make
+
+    :type capture_mode: str
+    :param capture_mode: The capture mode to use
+
+    :type level: int
+    :param level: The logging display level
+
+    :type history: bool
+    :param history: Flag indicating whether log history is enabled
+
+    :return: None
+    """
+    Log.set_capture_mode(capture_mode)
+    Log.set_level(level)
+
+    if history is True:
+        Log.enable_history()
+    else:
+        Log.disable_history()
+
+    def run():
+        for _ in range(iterations):
+            Log.trace('Processing file...')
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        duration = min(timeit.repeat(lambda: nested_call(20, run), number=1, repeat=3))
+
+    Log.clear_log_history()
+
+    print('{name:<50} {cost:>10.2f} us/call'.format(name=name, cost=duration / iterations * 1000000))
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    measure('inspect.stack(), displayed', iterations, Log.CAPTURE_STACK, Log.LEVEL_TRACE, True)
+    measure('inspect.stack(), filtered, history enabled', iterations, Log.CAPTURE_STACK, Log.LEVEL_INFO, True)
+    measure('frame capture, displayed', iterations, Log.CAPTURE_FRAME, Log.LEVEL_TRACE, True)
+    measure('frame capture, filtered, history enabled', iterations, Log.CAPTURE_FRAME, Log.LEVEL_INFO, True)
+    measure('frame capture, filtered, history disabled', iterations, Log.CAPTURE_FRAME, Log.LEVEL_INFO, False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark EasyLog throughput using the text and JSON output formats
+
+Usage: python benchmarks/log_format.py [iterations]
+"""
+import contextlib
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from EasyLog.Log import Log
+
+
+def measure(name, iterations, output_format, buffer_size):
+    """
+    Measure and print the number of displayed messages written per second
+
+    :type name: str
+    :param name: Name of the scenario being measured
+
+    :type iterations: int
+    :param iterations: Number of log calls to make
+
+    :type output_format: str
+    :param output_format: The output format to use
+
+    :type buffer_size: int
+    :param buffer_size: Number of messages written at once
+
+    :return: None
+    """
+    Log.set_format(output_format)
+    Log.set_buffer_size(buffer_size)
+
+    def run():
+        for _ in range(iterations):
+            Log.info('Downloading file...', extra={'bucket': 'example-bucket', 'key': 'inbox/example.csv'})
+        Log.flush()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        duration = min(timeit.repeat(run, number=1, repeat=3))
+
+    print('{name:<30} {throughput:>12,.0f} messages/s'.format(name=name, throughput=iterations / duration))
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    Log.set_level(Log.LEVEL_TRACE)
+    Log.disable_history()
+
+    measure('text', iterations, Log.FORMAT_TEXT, 1)
+    measure('text, buffered (100)', iterations, Log.FORMAT_TEXT, 100)
+    measure('json', iterations, Log.FORMAT_JSON, 1)
+    measure('json, buffered (100)', iterations, Log.FORMAT_JSON, 100)
+
+
+if __name__ == '__main__':
+    main()
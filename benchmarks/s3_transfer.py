@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark S3 upload, download and copy throughput using each transfer profile
+
+Runs against a local S3 stand-in (e.g. MinIO or moto_server) so results are not affected by network conditions. The
+endpoint is read from EASY_AWS_BENCHMARK_S3_ENDPOINT (default http://localhost:9000) and the bucket, which is created
+if it does not exist, from EASY_AWS_BENCHMARK_S3_BUCKET. Credentials are taken from the usual AWS environment variables.
+
+Usage: python benchmarks/s3_transfer.py [file size in MB]
+"""
+import boto3
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from EasyFilesystem.S3.Client import Client
+from EasyFilesystem.S3.TransferProfile import TransferProfile
+from EasyFilesystem.VerificationPolicy import VerificationPolicy
+from EasyLog.Log import Log
+
+
+def measure(name, size, function):
+    """
+    Measure and print the throughput of a transfer
+
+    :type name: str
+    :param name: Name of the scenario being measured
+
+    :type size: int
+    :param size: Number of bytes transferred
+
+    :type function: Callable
+    :param function: Function performing the transfer
+
+    :return: None
+    """
+    start = time.perf_counter()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        function()
+
+    duration = time.perf_counter() - start
+
+    print('{name:<40} {throughput:>10.1f} MB/s'.format(name=name, throughput=size / duration / TransferProfile.MB))
+
+
+def main():
+    size = (int(sys.argv[1]) if len(sys.argv) > 1 else 256) * TransferProfile.MB
+    endpoint_url = os.environ.get('EASY_AWS_BENCHMARK_S3_ENDPOINT', 'http://localhost:9000')
+    bucket = os.environ.get('EASY_AWS_BENCHMARK_S3_BUCKET', 'easy-aws-benchmark')
+
+    Log.set_level(Log.LEVEL_ERROR)
+
+    # Only the transfers themselves are measured, the existence checks are identical for each profile
+    client = Client(max_pool_connections=16, verification_policy=VerificationPolicy.TRUST, endpoint_url=endpoint_url)
+
+    if bucket not in client.bucket_list():
+        boto3.client('s3', endpoint_url=endpoint_url).create_bucket(Bucket=bucket)
+
+    with tempfile.TemporaryDirectory() as temp_path:
+        local_filename = os.path.join(temp_path, 'upload.bin')
+        with open(local_filename, 'wb') as local_file:
+            for _ in range(size // TransferProfile.MB):
+                local_file.write(os.urandom(TransferProfile.MB))
+
+        for profile in (TransferProfile.DEFAULT, TransferProfile.LARGE_FILES, TransferProfile.SMALL_FILES, TransferProfile.SINGLE_THREADED):
+            remote_filename = 'benchmark/{profile}/upload.bin'.format(profile=profile)
+
+            measure('{profile}, upload'.format(profile=profile), size, lambda: client.file_upload(
+                bucket=bucket,
+                remote_filename=remote_filename,
+                local_filename=local_filename,
+                transfer_config=profile
+            ))
+            measure('{profile}, download'.format(profile=profile), size, lambda: client.file_download(
+                bucket=bucket,
+                remote_filename=remote_filename,
+                local_filename=os.path.join(temp_path, 'download.bin'),
+                transfer_config=profile
+            ))
+            measure('{profile}, copy'.format(profile=profile), size, lambda: client.file_copy(
+                source_bucket=bucket,
+                source_filename=remote_filename,
+                destination_bucket=bucket,
+                destination_filename=remote_filename + '.copy',
+                transfer_config=profile
+            ))
+
+    client.path_delete(bucket=bucket, path='benchmark', allow_missing=True, recursive=True)
+
+
+if __name__ == '__main__':
+    main()